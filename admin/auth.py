@@ -1,19 +1,17 @@
 # admin/auth.py — 임원진 전용 권한 검증 데코레이터
 from flask import request, jsonify, current_app
 from functools import wraps
-import jwt
 
-from smash_db.auth import _get_token_version
+from smash_db.auth import verify_token
 
 
 def admin_required(f):
     """JWT 토큰 검증 + 임원진(manager) 권한 검증 데코레이터.
 
     1) Authorization 헤더에서 Bearer 토큰 추출 → 없으면 401
-    2) JWT 디코딩 → 만료·무효 시 401
-    3) token_version 검증 → 비밀번호 변경 후 구 토큰 차단
-    4) 토큰의 role 필드가 'manager'인지 확인 → 아니면 403
-    5) request.current_user에 사용자 정보 세팅 후 핸들러 진입
+    2) verify_token — JWT 만료·무효, token_version 불일치(비밀번호 변경 후 구 토큰) 시 401
+    3) 토큰의 role 필드가 'manager'인지 확인 → 아니면 403
+    4) request.current_user에 사용자 정보 세팅 후 핸들러 진입
     """
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -23,29 +21,10 @@ def admin_required(f):
 
         token = auth_header.split(' ')[1]
 
-        try:
-            payload = jwt.decode(
-                token,
-                current_app.config['SECRET_KEY'],
-                algorithms=["HS256"],
-            )
-        except jwt.ExpiredSignatureError:
-            return jsonify({'error': '토큰이 만료되었습니다. 다시 로그인해주세요.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'error': '유효하지 않은 토큰입니다.'}), 401
-
-        # token_version 검증: 비밀번호 변경 후 구 토큰 즉시 차단
-        user_id = payload.get('id')
-        current_ver = _get_token_version(user_id)
-        if current_ver is None:
-            return jsonify({'error': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
-
-        token_ver = payload.get('ver')
-        if token_ver is None:
-            if current_ver != 1:
-                return jsonify({'error': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
-        elif token_ver != current_ver:
-            return jsonify({'error': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
+        # JWT 서명·만료 + token_version 검증 (token_required와 같은 규칙·같은 캐시)
+        payload, error = verify_token(token, current_app.config['SECRET_KEY'])
+        if error:
+            return jsonify({'error': error}), 401
 
         # 임원진 여부 검증 (JWT payload의 role 필드)
         if payload.get('role') != 'manager':
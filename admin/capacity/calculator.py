@@ -2,6 +2,8 @@
 #
 # 총 정원(total)을 동아리 규칙에 따라
 # 운동 / 게스트 / 잔여석 3개 카테고리로 분리하는 순수 연산 함수.
+# get_effective_capacity()는 보드 카테고리 하나의 유효 정원을 계산한다
+# (빈자리 알림 · /api/my-position 공용).
 
 from time_control import board_store
 from time_control.scheduler_logic import Category
@@ -26,7 +28,7 @@ def calculate_capacity_details(day: str, total_capacity: int, special_count: int
         # 수요일: 게스트 정원 0, 총정원 전체가 운동 카테고리
         s = total_capacity
         guest_limit = 0
-        e = len(board_store.get_board(Category.WED_REGULAR))
+        e = board_store.count_entries(Category.WED_REGULAR)
         exercise = min(e, s)
         leftover = max(0, s - e)
     else:
@@ -35,15 +37,10 @@ def calculate_capacity_details(day: str, total_capacity: int, special_count: int
         # 잔여석 = (total - 2) - 운동 신청자 수
         # 게스트 표시용 limit은 실제 신청자 수 기준 (0~2), 운동 계산에 미반영
         f = total_capacity
-        guest_entries = board_store.get_board(Category.FRI_GUEST)
-        g = sum(
-            1 for entry in guest_entries
-            if "(ob)" not in entry.get("guest_name", "").lower()
-            and "(교류전)" not in entry.get("guest_name", "").lower()
-        )
+        g = board_store.count_entries(Category.FRI_GUEST, board_store.NORMAL_PRIORITY)
         guest_limit = min(g, 2)
         r = f - 2
-        e = len(board_store.get_board(Category.FRI_REGULAR))
+        e = board_store.count_entries(Category.FRI_REGULAR)
         exercise = min(e, r)
         leftover = max(0, r - e)
 
@@ -60,16 +57,61 @@ def calculate_capacity_details(day: str, total_capacity: int, special_count: int
 def count_special_guests(category: str) -> int:
     """해당 카테고리 게스트 명단에서 (ob)/(교류전) 특수 인원 수를 센다.
 
+    특수 여부는 INSERT 시점에 applications.priority로 저장되어 있으므로
+    (category, priority) 인덱스 COUNT 한 번으로 계산한다.
+
     Args:
         category: Category enum 값 (예: "WED_GUEST", "FRI_GUEST")
 
     Returns:
         특수 키워드가 포함된 게스트 수
     """
-    entries = board_store.get_board(category)
-    count = 0
-    for entry in entries:
-        guest_lower = entry.get("guest_name", "").lower()
-        if "(ob)" in guest_lower or "(교류전)" in guest_lower:
-            count += 1
-    return count
+    return board_store.count_entries(category, board_store.SPECIAL_PRIORITY)
+
+
+# 정원이 있는 보드 카테고리 → (요일_한글, 게스트_카테고리)
+#   · 요일_한글: get_capacities() 딕셔너리 조회 키 ("수" / "금")
+#   · 게스트_카테고리: count_special_guests() 호출 시 사용할 게스트 보드 카테고리명
+# 레슨(WED_LESSON)은 정원 개념이 없으므로 제외한다.
+CAPACITY_CATEGORY_MAP: dict[str, tuple[str, str]] = {
+    "WED_REGULAR":  ("수", "WED_GUEST"),
+    "FRI_REGULAR":  ("금", "FRI_GUEST"),
+    "WED_GUEST":    ("수", "WED_GUEST"),
+    "FRI_GUEST":    ("금", "FRI_GUEST"),
+    "WED_LEFTOVER": ("수", "WED_GUEST"),
+    "FRI_LEFTOVER": ("금", "FRI_GUEST"),
+}
+
+
+def get_effective_capacity(category: str) -> int | None:
+    """보드 카테고리의 유효 정원(0-based 순번이 이 값 미만이면 정원 내)을 반환한다.
+
+    카테고리 종류에 따라 calculate_capacity_details() 결과를 다르게 사용한다:
+      - _REGULAR  : details["운동"] + details["잔여석"]
+      - _GUEST    : details["게스트"]["limit"] + details["게스트"]["special_count"]
+      - _LEFTOVER : details["잔여석"]
+
+    Returns:
+        유효 정원. 정원 대상이 아닌 카테고리이거나 해당 요일 정원이 아직 없으면 None.
+    """
+    if category not in CAPACITY_CATEGORY_MAP:
+        return None
+
+    from admin.capacity.store import get_capacities  # Redis 연결 모듈 — 사용 시점에 import
+
+    day_korean, guest_category = CAPACITY_CATEGORY_MAP[category]
+    total_capacity = get_capacities().get(day_korean)
+    if total_capacity is None:
+        return None
+
+    special_count = count_special_guests(guest_category)
+    details = calculate_capacity_details(day_korean, total_capacity, special_count)
+
+    if category.endswith("_REGULAR"):
+        # 정규 운동: 운동 슬롯 + 잔여석 슬롯의 합 (총 유효 슬롯)
+        return details["운동"] + details["잔여석"]
+    if category.endswith("_GUEST"):
+        # 게스트: 일반 게스트 정원 + 특수 인원(ob / 교류전) 수
+        return details["게스트"]["limit"] + details["게스트"]["special_count"]
+    # 잔여석(_LEFTOVER): 잔여석 슬롯만
+    return details["잔여석"]
@@ -14,11 +14,8 @@ import sqlite3
 
 import redis as _redis_mod
 
-# ── DB 경로 (smash_db/users.db 와 같은 디렉터리) ───────────────────────────────
-_DB_PATH = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    '..', '..', 'smash_db', 'users.db',
-)
+# ── DB 연결 (smash_db/users.db, smash_db/connections.py 공용 연결 관리) ─────────
+from smash_db.connections import write_conn
 
 # ── Redis 연결 (notifications/store.py 와 동일한 패턴) ───────────────────────────
 _redis = _redis_mod.Redis(
@@ -36,27 +33,23 @@ _DAY_KEYS: dict[str, str] = {
 
 
 def _ensure_table(conn: sqlite3.Connection) -> None:
-    """capacities 테이블이 없으면 생성한다."""
+    """capacities 테이블이 없으면 생성한다. (commit은 write_conn()이 수행)"""
     conn.execute("""
         CREATE TABLE IF NOT EXISTS capacities (
             day   TEXT PRIMARY KEY,
             value INTEGER NOT NULL
         )
     """)
-    conn.commit()
 
 
 def init_cache() -> None:
     """서버 부팅 시 1회 호출. SQLite에서 마지막 확정 정원을 읽어 Redis에 적재한다."""
-    conn = sqlite3.connect(_DB_PATH)
-    try:
+    with write_conn() as conn:
         _ensure_table(conn)
         rows = conn.execute("SELECT day, value FROM capacities").fetchall()
-        for day, value in rows:
-            if day in _DAY_KEYS:
-                _redis.set(_DAY_KEYS[day], value)
-    finally:
-        conn.close()
+    for day, value in rows:
+        if day in _DAY_KEYS:
+            _redis.set(_DAY_KEYS[day], value)
 
 
 def get_capacities() -> dict[str, int | None]:
@@ -79,8 +72,7 @@ def update_capacities(data: dict) -> None:
         return
 
     # 1) SQLite 영구 저장 (재시작 후 Redis 복원의 원본)
-    conn = sqlite3.connect(_DB_PATH)
-    try:
+    with write_conn() as conn:
         _ensure_table(conn)
         for day, value in updates.items():
             conn.execute(
@@ -88,9 +80,6 @@ def update_capacities(data: dict) -> None:
                 "ON CONFLICT(day) DO UPDATE SET value = excluded.value",
                 (day, value),
             )
-        conn.commit()
-    finally:
-        conn.close()
 
     # 2) Redis 업데이트 (즉시 모든 워커에 반영)
     for day, value in updates.items():
@@ -104,10 +93,6 @@ def reset_capacities() -> None:
         _redis.delete(key)
 
     # 2) SQLite 삭제
-    conn = sqlite3.connect(_DB_PATH)
-    try:
+    with write_conn() as conn:
         _ensure_table(conn)
         conn.execute("DELETE FROM capacities")
-        conn.commit()
-    finally:
-        conn.close()
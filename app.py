@@ -7,6 +7,10 @@ load_dotenv()  # .env 파일을 OS 환경변수로 로드
 
 app = Flask(__name__)
 
+# [성능] jsonify/get_json을 json_codec으로 교체 (orjson 설치 시 사용, 없으면 표준 json)
+from time_control.json_codec import FastJSONProvider
+app.json = FastJSONProvider(app)
+
 # [보안] 시크릿 키를 환경변수에서 읽음 (미설정 시 서버 시작 차단)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
 if not app.config['SECRET_KEY']:
@@ -20,18 +24,21 @@ app.config['MAX_CONTENT_LENGTH'] = 1 * 1024 * 1024  # 1 MB
 # 모든 엔드포인트 진입 전에 IP당 분당 요청 수를 검사한다.
 # 비정상적으로 많은 요청을 보내는 IP를 조기에 차단하여 서버 리소스를 보호한다.
 from time_control.rate_limiter import check_global_ip_limit
-from flask import jsonify as _jsonify
+from flask import jsonify as _jsonify, request as _request
+
+# /api/time(시계 동기화)은 샘플을 여러 번 연속 요청하므로 글로벌 한도에서 빼고 자체 한도만 쓴다.
+_GLOBAL_GUARD_EXEMPT = {'/api/time'}
 
 @app.before_request
 def _global_ip_guard():
+    if _request.path in _GLOBAL_GUARD_EXEMPT:
+        return None
     if check_global_ip_limit():
         return _jsonify({"error": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."}), 429
 
 # --- [API 전역 에러 핸들러] ---
 # Flask 기본 에러 핸들러는 HTML을 반환하지만, /api/ 경로에서는 클라이언트가
 # JSON을 기대하므로 미처리 예외 발생 시 JSON 형태의 500 응답을 반환한다.
-from flask import request as _request
-
 @app.errorhandler(500)
 def _handle_500(e):
     return _jsonify({"error": "서버 내부 오류가 발생했습니다."}), 500
@@ -93,6 +100,8 @@ if __name__ == '__main__':
     # 개발 환경 전용 — 로컬 테스트 시에만 사용
     from time_control.scheduler_logic import start_reset_scheduler
     from notifications.sender import start_push_worker
+    from smash_db.token_cache import start_token_cache
     start_reset_scheduler(KST)
     start_push_worker()
+    start_token_cache()
     app.run(host='127.0.0.1', port=5000, debug=True)
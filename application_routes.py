@@ -1,21 +1,31 @@
 # application_routes.py — 운동 신청/취소/현황 API Blueprint
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, after_this_request, request, jsonify
 import os
 import redis as _redis
 
 from smash_db.auth import token_required
-from time_control.scheduler_logic import Category, get_current_status
+from time_control.scheduler_logic import Category, Status, get_current_status
 from time_control.time_handler import _now_kst
 from time_control.rate_limiter import rate_limit
+from time_control.idempotency import idempotent
+from time_control.admission import admission_gate
 from time_control.apply import handle_apply
+from time_control.apply_ticket import ticket_or_token, issue as issue_apply_ticket
+from time_control.apply_stream import pending_count
 from time_control.cancel import handle_cancel
 from time_control.admin import handle_admin_apply, handle_admin_cancel
-from time_control.board_store import get_board, get_all_boards, get_applied_categories
+from time_control.board_store import (
+    get_snapshot, get_columns_snapshot, get_applied_categories, get_changes_since, get_user_positions,
+)
+from time_control.board_compact import wants_compact, parse_fields, render_compact, COMPACT_MEDIA_TYPE
+from time_control.board_view import get_board_view, render_applications, user_in
+from time_control.conditional import make_etag, is_not_modified, not_modified, with_etag
+from admin.capacity.calculator import get_effective_capacity
 
 application_bp = Blueprint('application', __name__)
 
 # ── GET 서킷 브레이커 ─────────────────────────────────────────────────────────
-# Redis apply_queue 길이가 임계값을 초과하면 시스템이 피크 부하 상태로 판단한다.
+# Redis 신청 스트림(apply_stream:*)의 처리 대기 건수 합이 임계값을 초과하면 시스템이 피크 부하 상태로 판단한다.
 # 이 경우 GET(게시판 조회) 요청에 SQLite 조회를 생략하고 정적 메시지를 반환하여
 # 남은 스레드를 신청(POST) 처리에 집중시킨다.
 #
@@ -34,9 +44,12 @@ _circuit_redis = _redis.Redis(
 )
 
 def _is_overloaded() -> bool:
-    """Redis apply_queue 길이로 시스템 과부하 여부를 판단한다."""
+    """신청 스트림의 처리 대기 건수 합으로 시스템 과부하 여부를 판단한다.
+
+    worker가 처리(SQLite 커밋)한 항목은 XACK + XDEL로 지우므로 XLEN = 처리 대기 건수.
+    """
     try:
-        return _circuit_redis.llen("apply_queue") >= _QUEUE_OVERLOAD_THRESHOLD
+        return pending_count(_circuit_redis) >= _QUEUE_OVERLOAD_THRESHOLD
     except Exception:
         return False  # Redis 조회 실패 시 과부하 아닌 것으로 간주 (안전 방향)
 
@@ -52,18 +65,62 @@ def _validate_category(category: str | None) -> str | None:
     return None
 
 
+# ── 입장 제어 ─────────────────────────────────────────────────────────────────
+# 신청과 게시판 조회(board-data / all-boards / board-delta)는 @admission_gate를 거친다
+# (time_control/admission.py, ADMISSION_ENABLED=true일 때만). 모든 워커·GEN·VIP 인스턴스가
+# Redis의 토큰 버킷 하나를 공유하고, 넘치는 요청은 대기 순번을 받는다 —
+# 게시판 조회는 200 {"waiting": true, ...}, 신청은 503 + Retry-After.
+
+
+# ── 신청권 (오픈 직전 발급) ────────────────────────────────────────────────────
+# 오픈 전 APPLY_TICKET_WINDOW초 동안 (user, category, week) 범위의 서명 신청권을 발급한다
+# (time_control/apply_ticket.py). /api/apply는 @ticket_or_token으로 신청권을 HMAC 1회로 확인하고
+# 토큰 검증(SQLite token_version 조회)을 건너뛴다. 신청권이 없으면 기존 토큰 검증 그대로.
+
+@application_bp.route('/api/apply/ticket', methods=['GET'])
+@token_required
+@rate_limit(max_requests=10, window_seconds=10)
+def apply_ticket():
+    """신청권 발급 API
+
+    Query: category (필수)
+    Response (200): {"ticket": "...", "category": "WED_REGULAR", "expiresAt": Unix ms}
+             (400): 잘못된 카테고리 또는 발급 시간이 아님 (BEFORE_OPEN, 오픈 APPLY_TICKET_WINDOW초 전부터)
+    """
+    category = request.args.get('category')
+    error = _validate_category(category)
+    if error:
+        return jsonify({"error": error}), 400
+
+    result, error = issue_apply_ticket(request.current_user, category, _now_kst())
+    if error:
+        return jsonify({"error": error}), 400
+    response = jsonify(result)
+    response.headers['Cache-Control'] = 'no-store'
+    return response, 200
+
+
 # ── 일반 신청/취소 (본인 전용) ────────────────────────────────────────────────
+# 신청·취소·대리 신청/취소는 Idempotency-Key 헤더를 받는다 (time_control/idempotency.py).
+# @idempotent가 가장 바깥에 있으므로 같은 키의 재시도는 토큰 검증·rate limit·핸들러를 거치지 않고
+# 첫 응답을 그대로 돌려받는다.
 
 @application_bp.route('/api/apply', methods=['POST'])
-@token_required
+@idempotent
+@admission_gate(waiting_status=503)
+@ticket_or_token
 @rate_limit(max_requests=5, window_seconds=10)
 def apply():
     """운동 신청 API (일반 회원 본인 신청 전용)
 
+    인증: X-Apply-Ticket(신청권)이 본문 category·이번 주에 맞으면 신청권, 아니면 Bearer 토큰.
+
     handle_apply() 처리 순서:
       1) 타임스탬프 즉시 채번
       2) 시간 검증 (항상 수행, 바이패스 없음)
-      3) 인메모리 조작 (board_store.apply_entry)
+      3) Lua 스크립트 1회: 중복 검사 + 카테고리 신청 스트림 적재 + 잠정 순번·접수증 (Redis)
+         → SQLite INSERT는 worker.py가 하고, 응답은 잠정 순번·접수 번호와 함께 즉시 반환
+      4) Redis 장애 시에만 SQLite 중복 검사 + 직접 INSERT로 폴백 (board_store.apply_entry)
 
     매니저 대리 신청은 /admin/apply가 전담한다.
     """
@@ -79,6 +136,7 @@ def apply():
 
 
 @application_bp.route('/api/cancel', methods=['POST'])
+@idempotent
 @token_required
 @rate_limit(max_requests=5, window_seconds=10)
 def cancel():
@@ -110,6 +168,7 @@ def cancel():
 # ── 매니저 대리 신청/취소 ──────────────────────────────────────────────────────
 
 @application_bp.route('/api/admin/apply', methods=['POST'])
+@idempotent
 @token_required
 @rate_limit(max_requests=5, window_seconds=10)
 def admin_apply():
@@ -119,7 +178,8 @@ def admin_apply():
       1) role == 'manager' 검증 (실패 시 즉시 403)
       2) 시간 검증 없음 (의도적 생략)
       3) target_user_id → DB 조회 → entry 구성
-      4) 인메모리 조작 (board_store.apply_entry)
+      4) SQLite 직접 INSERT (board_store.apply_entry — 큐를 거치지 않는 저빈도 경로)
+         → 성공 시 Redis 신청자 집합·잠정 순번 집합에 반영 (mark_applied, board_rank.add)
     """
     data = request.get_json() or {}
     category = data.get('category')
@@ -133,6 +193,7 @@ def admin_apply():
 
 
 @application_bp.route('/api/admin/cancel', methods=['POST'])
+@idempotent
 @token_required
 @rate_limit(max_requests=5, window_seconds=10)
 def admin_cancel():
@@ -163,14 +224,20 @@ def admin_cancel():
 # ── 현황 조회 ─────────────────────────────────────────────────────────────────
 
 @application_bp.route('/api/board-data', methods=['GET'])
+@admission_gate(waiting_status=200)
 @token_required
 @rate_limit(max_requests=30, window_seconds=10)
 def get_status():
     """현황 조회 API — 현재 상태와 신청 목록 반환
 
-    2초 폴링 대상 엔드포인트. 인메모리에서 즉시 응답한다.
+    2초 폴링 대상 엔드포인트.
+    신청 목록은 worker가 미리 렌더링한 Redis 공개 뷰(board_view)의 bytes를 HMGET 1회로 가져와
+    상태만 덧붙인다 (SQLite 조회·직렬화 없음). 뷰가 없거나 Redis 장애 시 SQLite 스냅샷으로
+    폴백하며, 같은 보드 버전이면 두 경로의 본문 bytes가 같다 (render_applications 공유).
     Rate Limit: IP당 10초 내 30회 (2초 폴링 기준 충분히 여유)
     피크타임 과부하 시 정적 메시지를 반환하여 스레드를 신청 처리에 집중시킨다.
+    ETag(보드 버전 + 카테고리 + 상태)가 If-None-Match와 같으면 304를 반환한다.
+    X-Board-Seq 헤더로 보드 버전을 알려 /api/board-delta의 since로 쓰게 한다.
     """
     # 서킷 브레이커: 과부하 시 DB 조회 없이 즉시 반환
     if _is_overloaded():
@@ -187,30 +254,92 @@ def get_status():
 
     now = _now_kst()
     status = get_current_status(category, now)
-    applications = get_board(category)
 
-    # user_id(학번)는 공개 API에서 제외 — 이름/게스트명/타입/순번만 노출
-    safe_applications = [
-        {k: v for k, v in entry.items() if k != "user_id"}
-        for entry in applications
-    ]
+    # 1순위: worker가 미리 렌더링한 Redis 공개 뷰 (SQLite·직렬화 없음)
+    view = get_board_view([category])
+    if view is not None:
+        version, docs, _ = view
+        etag = make_etag("board-data", version, category, status)
+        if is_not_modified(etag):
+            return _with_seq(not_modified(etag), version)
+        body = _board_data_body(docs[category], status)
+        return _with_seq(with_etag(_raw_json(body), etag), version), 200
+
+    # 폴백: Redis 장애·뷰 미생성 시 SQLite 스냅샷 — 뷰와 같은 인코딩으로 같은 bytes를 만든다
+    version, boards = get_snapshot()
 
-    return jsonify({
-        "status": status,
-        "applications": safe_applications,
-    }), 200
+    etag = make_etag("board-data", version, category, status)
+    if is_not_modified(etag):
+        return _with_seq(not_modified(etag), version)
+
+    # user_id(학번)는 공개 API에서 제외 — 이름/게스트명/타입/순번만 노출 (render_applications)
+    body = _board_data_body(render_applications(boards.get(category, [])), status)
+    return _with_seq(with_etag(_raw_json(body), etag), version), 200
+
+
+@application_bp.route('/api/my-position', methods=['GET'])
+@token_required
+@rate_limit(max_requests=30, window_seconds=10)
+def get_my_position():
+    """내 순번 조회 API — 신청한 카테고리별 0-based 순번과 유효 정원만 반환
+
+    "정원 안에 들었는가"만 궁금한 클라이언트가 전체 게시판 대신 폴링한다.
+    순번은 본인 행보다 앞선 행 수를 인덱스 COUNT로 세어 구하며(board_store.get_user_positions),
+    게시판 목록을 만들거나 직렬화하지 않는다.
+    게스트/잔여석 카테고리는 본인이 신청한 게스트 항목마다 한 건씩 반환한다.
+
+    Response (JSON):
+        {
+          "positions": [
+            {"category": "WED_REGULAR", "rank": 12, "capacity": 40},
+            {"category": "FRI_GUEST", "rank": 0, "guest_name": "OB 김철수", "capacity": 3}
+          ]
+        }
+        capacity: admin.capacity.calculator.get_effective_capacity() 값.
+                  정원 미설정·정원 없는 카테고리(레슨)는 null.
+                  rank < capacity 이면 정원 내.
+    """
+    # 서킷 브레이커: 과부하 시 DB 조회 없이 즉시 반환
+    if _is_overloaded():
+        return jsonify({
+            "overloaded": True,
+            "message": "집계중입니다. 잠시만 기다려주세요.",
+        }), 200
+
+    positions = get_user_positions(request.current_user["id"])
+
+    # 같은 카테고리의 게스트 항목이 여러 건이어도 정원 계산은 카테고리당 1회
+    capacities = {}
+    for pos in positions:
+        cat = pos["category"]
+        if cat not in capacities:
+            capacities[cat] = get_effective_capacity(cat)
+        pos["capacity"] = capacities[cat]
+
+    return jsonify({"positions": positions}), 200
 
 
 @application_bp.route('/api/all-boards', methods=['GET'])
+@admission_gate(waiting_status=200)
 @token_required
 @rate_limit(max_requests=15, window_seconds=10)
 def get_all_statuses():
     """전체 카테고리 현황 일괄 조회 API
 
     기존 /api/board-data 를 카테고리별로 7회 호출하던 것을 1회로 통합한다.
-    인메모리에서 전체 스냅샷을 한 번에 반환하므로 Lock 획득도 1회로 줄어든다.
+    본문은 Redis 공개 뷰(board_view)의 카테고리별 bytes와 신청자 목록을 HMGET 1회로 가져와
+    상태·신청 여부만 덧붙여 조립한다 (SQLite 조회·직렬화 없음).
+    뷰가 없거나 Redis 장애 시 SQLite 스냅샷으로 폴백하며, 같은 보드 버전이면 본문 bytes가 같다.
     피크타임 과부하 시 정적 메시지를 반환하여 스레드를 신청 처리에 집중시킨다.
 
+    ETag = 보드 버전 + 카테고리별 상태 + 본인 신청 카테고리.
+    세 값이 모두 같으면 본문을 만들지 않고 304를 반환한다.
+    보드 버전은 본문이 아닌 X-Board-Seq 헤더로 내려준다 (본문 키 = 카테고리 유지).
+
+    ?format=compact 또는 Accept: application/vnd.smash.board-compact+json 이면
+    카테고리별 평행 배열 형식으로 응답한다 (time_control/board_compact.py 참고).
+    ?fields=name,type 처럼 필요한 열만 고를 수 있다.
+
     Response (JSON):
         {
           "WED_REGULAR": { "status": "OPEN", "applications": [...] },
@@ -218,6 +347,12 @@ def get_all_statuses():
           ...
         }
     """
+    # 같은 URL이 Accept에 따라 다른 형식을 내므로 캐시가 구분하도록 한다.
+    @after_this_request
+    def _vary_accept(resp):
+        resp.vary.add("Accept")
+        return resp
+
     # 서킷 브레이커: 과부하 시 DB 조회 없이 즉시 반환
     if _is_overloaded():
         return jsonify({
@@ -226,26 +361,149 @@ def get_all_statuses():
         }), 200
 
     now = _now_kst()
-    all_data = get_all_boards()
-
     user_id = request.current_user["id"]
+    statuses = {cat.value: get_current_status(cat.value, now) for cat in Category}
+
+    if wants_compact(request):
+        return _get_all_boards_compact(user_id, statuses)
+
+    # 1순위: worker가 미리 렌더링한 Redis 공개 뷰 + 사용자별 신청 여부 오버레이
+    view = get_board_view()
+    if view is not None:
+        version, docs, applied = view
+        applied_cats = {cat for cat, ids in applied.items() if user_in(ids, user_id)}
+
+        etag = make_etag("all-boards", version, tuple(statuses.values()), sorted(applied_cats))
+        if is_not_modified(etag):
+            return _with_seq(not_modified(etag), version)
+
+        body = _all_boards_body(docs, statuses, applied_cats)
+        return _with_seq(with_etag(_raw_json(body), etag), version), 200
+
+    # 폴백: Redis 장애·뷰 미생성 시 SQLite 스냅샷 — 뷰와 같은 인코딩으로 같은 bytes를 만든다
+    version, all_data = get_snapshot()
+    applied_cats = get_applied_categories(user_id, all_data)
+
+    etag = make_etag("all-boards", version, tuple(statuses.values()), sorted(applied_cats))
+    if is_not_modified(etag):
+        return _with_seq(not_modified(etag), version)
+
+    docs = {cat: render_applications(all_data.get(cat, [])) for cat in statuses}
+    body = _all_boards_body(docs, statuses, applied_cats)
+    return _with_seq(with_etag(_raw_json(body), etag), version), 200
+
+
+def _get_all_boards_compact(user_id: str, statuses: dict[str, str]):
+    """/api/all-boards compact 형식 응답 — 버전별 캐시된 열 배열 + 상태·신청 여부."""
+    fields = parse_fields(request.args.get('fields'))
+    if fields is None:
+        return jsonify({"error": "fields 파라미터가 올바르지 않습니다."}), 400
+
+    version, base_ms, columns = get_columns_snapshot()
     applied_cats = get_applied_categories(user_id)
 
-    result = {}
-    for cat_enum in Category:
-        cat = cat_enum.value
-        status = get_current_status(cat, now)
-        applications = all_data.get(cat, [])
-
-        safe_applications = [
-            {k: v for k, v in entry.items() if k != "user_id"}
-            for entry in applications
-        ]
-
-        result[cat] = {
-            "status": status,
-            "applications": safe_applications,
-            "user_already_applied": cat in applied_cats,
+    etag = make_etag("all-boards-compact", version, tuple(statuses.values()),
+                     sorted(applied_cats), fields)
+    if is_not_modified(etag):
+        return _with_seq(not_modified(etag), version)
+
+    body = render_compact(base_ms, columns, statuses, applied_cats, fields)
+    resp = Response(body, mimetype=COMPACT_MEDIA_TYPE)
+    return _with_seq(with_etag(resp, etag), version), 200
+
+
+@application_bp.route('/api/board-delta', methods=['GET'])
+@admission_gate(waiting_status=200)
+@token_required
+@rate_limit(max_requests=30, window_seconds=10)
+def get_board_delta():
+    """증분 현황 조회 API — since 이후의 신청/취소 변경분만 반환
+
+    클라이언트는 /api/all-boards 응답의 X-Board-Seq(또는 직전 delta의 seq)를
+    since로 보낸다. 변경이 없으면 빈 changes만 돌려주므로 피크 타임 폴링 비용이
+    보드 크기가 아닌 "그 사이 변경 건수"에 비례한다.
+
+    Query:
+        since: 마지막으로 반영한 보드 버전 (정수)
+
+    Response (JSON):
+        {
+          "seq": 1234,
+          "changes": [
+            {"seq": 1233, "op": "insert", "category": "WED_REGULAR", "pos": 4,
+             "entry": {"name": ..., "type": ..., "timestamp": ...}},
+            {"seq": 1234, "op": "delete", ...},
+            {"seq": 1200, "op": "reset"}
+          ],
+          "statuses": {"WED_REGULAR": "OPEN", ...},
+          "applied": ["WED_REGULAR", ...]
         }
+        또는 {"resync": true, "seq": 1234}
+          — 로그가 잘렸거나 변경이 너무 많으면 /api/all-boards로 전체를 다시 받는다.
+
+    클라이언트는 changes를 seq 순서대로 적용한다:
+      insert → 해당 카테고리 목록의 pos 위치에 entry 삽입
+      delete → pos 위치의 항목 제거
+      reset  → 모든 카테고리 목록 비우기
+    """
+    # 서킷 브레이커: 과부하 시 DB 조회 없이 즉시 반환
+    if _is_overloaded():
+        return jsonify({
+            "overloaded": True,
+            "message": "집계중입니다. 잠시만 기다려주세요.",
+        }), 200
+
+    try:
+        since = int(request.args.get('since', ''))
+    except ValueError:
+        return jsonify({"error": "since 파라미터가 올바르지 않습니다."}), 400
+    if since < 0:
+        return jsonify({"error": "since 파라미터가 올바르지 않습니다."}), 400
+
+    seq, changes = get_changes_since(since)
+    if changes is None:
+        return _with_seq(jsonify({"resync": True, "seq": seq}), seq), 200
+
+    now = _now_kst()
+    statuses = {cat.value: get_current_status(cat.value, now) for cat in Category}
+    applied_cats = get_applied_categories(request.current_user["id"])
+
+    return _with_seq(jsonify({
+        "seq": seq,
+        "changes": changes,
+        "statuses": statuses,
+        "applied": sorted(applied_cats),
+    }), seq), 200
+
+
+# Redis 공개 뷰 응답 조립용: 상태 문자열의 JSON 표현을 미리 인코딩해 둔다.
+_STATUS_JSON = {s.value: b'"%s"' % s.value.encode() for s in Status}
+
+
+def _board_data_body(applications: bytes, status: str) -> bytes:
+    """/api/board-data 본문 — Redis 뷰 경로와 SQLite 폴백이 같은 bytes를 내도록 공유한다."""
+    return b'{"applications":%s,"status":%s}' % (applications, _STATUS_JSON[status])
+
+
+def _all_boards_body(docs: dict[str, bytes], statuses: dict[str, str], applied_cats: set[str]) -> bytes:
+    """/api/all-boards 본문 (카테고리 순서 = statuses 순서 = Category 정의 순서)."""
+    return b"{" + b",".join(
+        b'"%s":{"applications":%s,"status":%s,"user_already_applied":%s}' % (
+            cat.encode(),
+            docs[cat],
+            _STATUS_JSON[statuses[cat]],
+            b"true" if cat in applied_cats else b"false",
+        )
+        for cat in statuses
+    ) + b"}"
+
+
+def _raw_json(body: bytes) -> Response:
+    """이미 인코딩된 JSON bytes를 그대로 응답으로 감싼다."""
+    return Response(body, mimetype="application/json")
+
 
-    return jsonify(result), 200
+def _with_seq(resp, seq: int):
+    """보드 버전을 X-Board-Seq 헤더로 붙인다 (304 응답 포함)."""
+    resp.headers["X-Board-Seq"] = str(seq)
+    return resp
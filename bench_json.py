@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+JSON 인코딩/디코딩 벤치마크
+===========================
+/api/all-boards 응답과 같은 모양의 문서(7개 카테고리, 신청 60건, 한글 이름)를 기준으로
+표준 json / orjson / json_codec(현재 선택된 구현)의 인코딩·디코딩 비용을 비교한다.
+
+측정 항목:
+  1) all-boards 문서 encode / decode        — GET 응답 직렬화
+  2) apply_queue 메시지 encode / decode     — handle_apply(producer) / worker(consumer)
+  3) WebPush 페이로드 encode                — notifications.sender
+
+실행: python bench_json.py [반복 횟수]   (기본 20000)
+orjson이 설치되지 않은 환경에서는 orjson 열을 건너뛴다.
+"""
+
+import json
+import random
+import sys
+import time
+import timeit
+
+from time_control import json_codec
+from time_control.scheduler_logic import Category, Status
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지민", "현우", "채원"]
+
+# 카테고리별 신청 인원 (합계 60)
+_COUNTS = {
+    "WED_REGULAR": 18, "WED_GUEST": 6, "WED_LEFTOVER": 4, "WED_LESSON": 6,
+    "FRI_REGULAR": 16, "FRI_GUEST": 6, "FRI_LEFTOVER": 4,
+}
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(_SURNAMES) + rng.choice(_GIVEN)
+
+
+def build_all_boards() -> dict:
+    """/api/all-boards 응답과 같은 구조의 문서를 만든다."""
+    rng = random.Random(42)
+    base_ts = time.time()
+    doc = {}
+    for cat in Category:
+        apps = []
+        for i in range(_COUNTS[cat.value]):
+            entry = {
+                "name": _name(rng),
+                "type": "member",
+                "timestamp": base_ts + i * 0.0137 + rng.random() / 1000,
+            }
+            if "GUEST" in cat.value or "LEFTOVER" in cat.value:
+                if rng.random() < 0.5:
+                    entry["type"] = "guest"
+                    entry["guest_name"] = rng.choice(["OB ", "교류전 ", ""]) + _name(rng)
+            apps.append(entry)
+        doc[cat.value] = {
+            "status": Status.OPEN,
+            "applications": apps,
+            "user_already_applied": False,
+        }
+    return doc
+
+
+def build_queue_entry() -> dict:
+    return {
+        "user_id": "20231234",
+        "name": "홍길동",
+        "type": "guest",
+        "guest_name": "OB 김철수",
+        "category": "WED_GUEST",
+        "timestamp": time.time(),
+    }
+
+
+def build_push_payload() -> dict:
+    return {
+        "title": "수요일 운동 빈자리 알림",
+        "body": "수요일 운동에 빈자리가 생겼습니다. 지금 신청하세요!",
+        "icon": "/icons/icon-192x192.png",
+        "data": {"category": "WED_REGULAR", "url": "/"},
+    }
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _bench(fn, number: int) -> float:
+    """호출 1회당 평균 시간(µs). 5회 반복 중 최솟값을 쓴다."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    boards = build_all_boards()
+    entry = build_queue_entry()
+    payload = build_push_payload()
+
+    boards_text = _stdlib_dumps(boards)
+    entry_text = _stdlib_dumps(entry)
+
+    # 두 구현이 같은 값을 내는지 먼저 확인
+    assert json.loads(json_codec.dumps(boards)) == json.loads(boards_text)
+    assert json_codec.loads(boards_text) == json.loads(boards_text)
+
+    total = sum(len(v["applications"]) for v in boards.values())
+    print("=" * 70)
+    print(f"  JSON 벤치마크 — all-boards {len(boards)}개 카테고리 / {total}건, "
+          f"{len(boards_text.encode())} bytes")
+    print(f"  json_codec 백엔드: {json_codec.BACKEND}   반복: {number}회")
+    print("=" * 70)
+
+    cases = [
+        ("all-boards encode", lambda: _stdlib_dumps(boards),
+         (lambda: orjson.dumps(boards)) if orjson else None,
+         lambda: json_codec.dumps_bytes(boards)),
+        ("all-boards decode", lambda: json.loads(boards_text),
+         (lambda: orjson.loads(boards_text)) if orjson else None,
+         lambda: json_codec.loads(boards_text)),
+        ("queue entry encode", lambda: _stdlib_dumps(entry),
+         (lambda: orjson.dumps(entry)) if orjson else None,
+         lambda: json_codec.dumps_bytes(entry)),
+        ("queue entry decode", lambda: json.loads(entry_text),
+         (lambda: orjson.loads(entry_text)) if orjson else None,
+         lambda: json_codec.loads(entry_text)),
+        ("push payload encode", lambda: _stdlib_dumps(payload),
+         (lambda: orjson.dumps(payload)) if orjson else None,
+         lambda: json_codec.dumps(payload)),
+    ]
+
+    print(f"  {'항목':<22}{'json(µs)':>12}{'orjson(µs)':>14}{'codec(µs)':>12}{'배율':>8}")
+    print("-" * 70)
+    for label, std_fn, fast_fn, codec_fn in cases:
+        std_us = _bench(std_fn, number)
+        fast_us = _bench(fast_fn, number) if fast_fn else None
+        codec_us = _bench(codec_fn, number)
+        fast_col = f"{fast_us:>14.2f}" if fast_us is not None else f"{'-':>14}"
+        print(f"  {label:<22}{std_us:>12.2f}{fast_col}{codec_us:>12.2f}{std_us / codec_us:>7.1f}x")
+    print("-" * 70)
+    print("  배율 = json / codec (1.0x면 표준 json 폴백 중)")
+
+
+if __name__ == "__main__":
+    main()
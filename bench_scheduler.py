@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+상태 조회 벤치마크 (scheduler_logic)
+====================================
+get_current_status() / get_next_change()의 기존 구현(호출마다 _get_transitions()로
+timedelta 리스트를 다시 만들어 선형 탐색)과 주간 전환 색인(epoch 초 배열 + bisect)을 비교한다.
+
+측정 항목:
+  1) get_current_status 1회
+  2) get_next_change 1회
+  3) /api/all-boards 1회분       — get_current_status × 7
+  4) /api/category-states 1회분  — (get_current_status + get_next_change) × 7
+  5) 주 시작 epoch 초             — is_already_applied / get_applied_categories
+
+실행: python bench_scheduler.py [반복 횟수]   (기본 20000)
+두 구현의 결과 일치는 tests/test_scheduler_logic.py가 검사한다 (한 주 1분 간격 + 모든 전환 시각 ±1µs).
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from time_control.scheduler_logic import (
+    Category,
+    Status,
+    _get_transitions,
+    _get_week_start,
+    get_current_status,
+    get_next_change,
+    get_week_start_ts,
+)
+
+KST = timezone(timedelta(hours=9))
+_CATEGORIES = [cat.value for cat in Category]
+
+
+# ── 기존 구현 (색인 도입 전) ─────────────────────────────────────────────────
+
+def legacy_current_status(category: str, now: datetime) -> str:
+    current_status = Status.CLOSED
+    for transition_time, status in _get_transitions(category, _get_week_start(now)):
+        if now >= transition_time:
+            current_status = status
+        else:
+            break
+    return current_status
+
+
+def legacy_next_change(category: str, now: datetime) -> tuple[datetime, str]:
+    week_start = _get_week_start(now)
+    for transition_time, status in _get_transitions(category, week_start):
+        if now < transition_time:
+            return transition_time, status
+    return week_start + timedelta(days=7), Status.BEFORE_OPEN
+
+
+def legacy_week_start_ts(now: datetime) -> float:
+    days_since_saturday = (now.weekday() - 5) % 7
+    return (now - timedelta(days=days_since_saturday)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ).timestamp()
+
+
+# ── 측정 ──────────────────────────────────────────────────────────────────────
+
+def _bench(fn, number: int) -> float:
+    """호출 1회당 평균 시간(µs). 5회 반복 중 최솟값을 쓴다."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    # 토요일 22:00:30 — 오픈 직후 (가장 붐비는 시각)
+    now = _get_week_start(datetime.now(KST)) + timedelta(hours=22, seconds=30)
+    cat = Category.WED_REGULAR.value
+
+    def legacy_all_boards():
+        for c in _CATEGORIES:
+            legacy_current_status(c, now)
+
+    def indexed_all_boards():
+        for c in _CATEGORIES:
+            get_current_status(c, now)
+
+    def legacy_category_states():
+        for c in _CATEGORIES:
+            legacy_current_status(c, now)
+            legacy_next_change(c, now)
+
+    def indexed_category_states():
+        for c in _CATEGORIES:
+            get_current_status(c, now)
+            get_next_change(c, now)
+
+    cases = [
+        ("get_current_status", lambda: legacy_current_status(cat, now), lambda: get_current_status(cat, now)),
+        ("get_next_change", lambda: legacy_next_change(cat, now), lambda: get_next_change(cat, now)),
+        ("all-boards (×7)", legacy_all_boards, indexed_all_boards),
+        ("category-states (×14)", legacy_category_states, indexed_category_states),
+        ("week start ts", lambda: legacy_week_start_ts(now), lambda: get_week_start_ts(now)),
+    ]
+
+    print("=" * 64)
+    print(f"  상태 조회 벤치마크 — 반복: {number}회")
+    print(f"  기준 시각: {now:%Y-%m-%d %H:%M:%S %Z}")
+    print("=" * 64)
+    print(f"  {'항목':<24}{'기존(µs)':>12}{'색인(µs)':>12}{'배율':>10}")
+    print("-" * 64)
+    for label, legacy_fn, indexed_fn in cases:
+        legacy_us = _bench(legacy_fn, number)
+        indexed_us = _bench(indexed_fn, number)
+        print(f"  {label:<24}{legacy_us:>12.2f}{indexed_us:>12.2f}{legacy_us / indexed_us:>9.1f}x")
+    print("-" * 64)
+    print("  배율 = 기존 / 색인")
+
+
+if __name__ == "__main__":
+    main()
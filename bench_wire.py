@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+게시판 응답 형식 벤치마크 — 기본 JSON vs compact(컬럼형)
+=========================================================
+임시 SQLite DB에 신청 데이터를 채운 뒤 /api/all-boards 두 형식의
+응답 크기(원본 / gzip)와 생성 시간을 비교한다.
+
+측정 항목:
+  1) 응답 크기            — 기본 형식, compact 전체 필드, compact name+type
+  2) 행 → 보드 변환       — _load_all_boards(항목별 dict) vs _load_all_columns(열 배열)
+                            (보드 버전이 바뀔 때 1회)
+  3) 응답 본문 인코딩     — 요청마다 (공개 필드 추출 + 직렬화)
+
+실행: python bench_wire.py [신청 건수 ...]   (기본 60 300)
+"""
+
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+from smash_db import connections
+from time_control import json_codec
+from time_control.scheduler_logic import Category, Status
+
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지민", "현우", "채원"]
+_GUEST_CATS = {"WED_GUEST", "FRI_GUEST", "WED_LEFTOVER", "FRI_LEFTOVER"}
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(_SURNAMES) + rng.choice(_GIVEN)
+
+
+def _fill(board_store, total: int) -> None:
+    """카테고리에 total건을 고르게 나눠 INSERT한다."""
+    rng = random.Random(42)
+    cats = [cat.value for cat in Category]
+    base_ts = time.time()
+    with connections.write_conn() as conn:
+        conn.execute("DELETE FROM applications")
+        for i in range(total):
+            cat = cats[i % len(cats)]
+            guest = None
+            if cat in _GUEST_CATS and rng.random() < 0.6:
+                guest = rng.choice(["OB ", "(교류전) ", ""]) + _name(rng)
+            conn.execute(
+                """INSERT INTO applications
+                       (user_id, name, category, type, guest_name, timestamp, priority)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (f"2024{i:04d}", _name(rng), cat, "guest" if guest else "member",
+                 guest, base_ts + i * 0.0137 + rng.random() / 1000,
+                 board_store.compute_priority(cat, guest)),
+            )
+
+
+def _bench(fn, number: int) -> float:
+    """호출 1회당 평균 시간(µs). 5회 반복 중 최솟값을 쓴다."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def run(total: int, number: int) -> None:
+    from time_control import board_store
+    from time_control.board_compact import FIELDS, render_compact
+
+    _fill(board_store, total)
+    conn = connections.read_conn()
+    statuses = {cat.value: Status.OPEN.value for cat in Category}
+    applied = {"WED_REGULAR"}
+
+    _, boards = board_store.get_snapshot()
+    _, base_ms, columns = board_store.get_columns_snapshot()
+
+    def default_body() -> bytes:
+        return json_codec.dumps_bytes({
+            cat: {
+                "status": statuses[cat],
+                "applications": [
+                    {k: v for k, v in e.items() if k != "user_id"}
+                    for e in boards.get(cat, [])
+                ],
+                "user_already_applied": cat in applied,
+            }
+            for cat in statuses
+        })
+
+    def compact_body(fields=FIELDS) -> bytes:
+        return render_compact(base_ms, columns, statuses, applied, fields)
+
+    small = ("name", "type")
+    bodies = [
+        ("기본 JSON", default_body()),
+        ("compact 전체 필드", compact_body()),
+        ("compact name,type", compact_body(small)),
+    ]
+
+    print("=" * 70)
+    print(f"  신청 {total}건 / {len(statuses)}개 카테고리   json_codec: {json_codec.BACKEND}")
+    print("=" * 70)
+    print(f"  {'형식':<22}{'원본(B)':>10}{'gzip(B)':>10}{'원본 비율':>12}{'gzip 비율':>12}")
+    print("-" * 70)
+    raw0 = len(bodies[0][1])
+    gz0 = len(gzip.compress(bodies[0][1]))
+    for label, body in bodies:
+        gz = len(gzip.compress(body))
+        print(f"  {label:<22}{len(body):>10}{gz:>10}{len(body) / raw0:>11.0%}{gz / gz0:>11.0%}")
+
+    print("-" * 70)
+    print(f"  {'항목':<34}{'기본(µs)':>12}{'compact(µs)':>14}")
+    print("-" * 70)
+    load_std = _bench(lambda: board_store._load_all_boards(conn), max(1, number // 20))
+    load_col = _bench(lambda: board_store._load_all_columns(conn), max(1, number // 20))
+    print(f"  {'행 → 보드 (버전 변경 시 1회)':<34}{load_std:>12.1f}{load_col:>14.1f}")
+    enc_std = _bench(default_body, number)
+    enc_col = _bench(compact_body, number)
+    print(f"  {'응답 본문 생성 (요청마다)':<34}{enc_std:>12.1f}{enc_col:>14.1f}")
+    print()
+
+
+def main() -> None:
+    totals = [int(a) for a in sys.argv[1:]] or [60, 300]
+
+    tmp = tempfile.mkdtemp()
+    connections.DB_PATH = os.path.join(tmp, "bench.db")
+    from time_control import board_store
+    board_store.ensure_table()
+
+    for total in totals:
+        run(total, number=2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+신청 워커 배치 처리 벤치마크 — 이전 방식 vs 현재 worker.py
+=============================================================
+임시 SQLite DB와 실제 Redis(REDIS_HOST/REDIS_PORT)를 사용해
+신청 적재 → SQLite 커밋까지의 지연과 처리량을 비교한다.
+
+비교 대상:
+  legacy  — 이전 worker.py 방식 재현: apply_queue 리스트에서 RPOP을 최대 50회 반복,
+            비어 있으면 100ms sleep
+  single  — 현재 worker.py, consumer 1개가 모든 카테고리 스트림을 맡음
+            (XREADGROUP BLOCK + 1회 다건 읽기 + 배치 크기 자동 조절, _Consumer.fetch / process 그대로 호출)
+  sharded — 현재 worker.py, consumer N개(기본 2 = 수요일 / 금요일)가 스레드로 나눠 맡음
+            (SQLite 커밋은 _write_lock으로 넘겨받음)
+
+부하 패턴:
+  sparse — 한 건씩 간헐적으로 도착 (20~80ms 간격)  → 유휴 후 첫 신청의 대기 시간
+  burst  — 생산자 스레드 여러 개가 최대 속도로 적재  → 적체 시 처리량
+  skew   — 수요일 카테고리에만 burst + 금요일 신청은 간헐적으로 도착
+           → 한 요일 적체가 다른 요일 신청을 얼마나 늦추는지 (지연은 금요일 신청만 집계)
+
+실행: python bench_worker.py [burst 건수] [sharded consumer 수]   (기본 2000, 2)
+Redis의 apply_queue / apply_stream:* 키를 지우고 사용하므로 운영 Redis에서 실행하지 말 것.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import redis
+
+from smash_db import connections
+from time_control import json_codec
+from time_control.apply_stream import STREAM_KEYS, shard_categories, stream_key
+
+_SPARSE_COUNT = 200
+_BURST_PRODUCERS = 8
+_LEGACY_QUEUE = "apply_queue"
+_LEGACY_BATCH = 50
+# 수요일·금요일 게스트/잔여석 카테고리에 고르게 나눈다
+# (한 보드가 지나치게 길면 변경 로그 트리거의 순번 계산이 지배적)
+_CATEGORIES = ("WED_GUEST", "FRI_GUEST", "WED_LEFTOVER", "FRI_LEFTOVER")
+_WED = ("WED_GUEST", "WED_LEFTOVER")
+_FRI = ("FRI_GUEST",)
+_SKEW_FRI_COUNT = 100
+
+
+def _entry(i: int, categories: tuple[str, ...]) -> dict:
+    return {
+        "user_id":    f"guest_bench_{i}",
+        "name":       "벤치",
+        "guest_name": str(i),
+        "type":       "guest",
+        "category":   categories[i % len(categories)],
+        "timestamp":  time.time(),
+    }
+
+
+def _produce(r: redis.Redis, mode: str, start: int, count: int, gap: tuple[float, float] | None,
+             categories: tuple[str, ...] = _CATEGORIES) -> None:
+    for i in range(start, start + count):
+        entry = _entry(i, categories)
+        payload = json_codec.dumps_bytes(entry)
+        if mode == "legacy":
+            r.lpush(_LEGACY_QUEUE, payload)
+        else:
+            r.xadd(stream_key(entry["category"]), {"d": payload})
+        if gap:
+            time.sleep(random.uniform(*gap))
+
+
+def _legacy_loop(worker, conn, r: redis.Redis, total: int, latencies: list[tuple[str, float]]) -> None:
+    """이전 _fetch_batch(RPOP × 50) + 100ms sleep 루프."""
+    done = 0
+    while done < total:
+        entries = []
+        for _ in range(_LEGACY_BATCH):
+            raw = r.rpop(_LEGACY_QUEUE)
+            if raw is None:
+                break
+            entries.append(json_codec.loads(raw))
+        if not entries:
+            time.sleep(0.1)
+            continue
+        worker._insert_batch(conn, entries)
+        now = time.time()
+        latencies.extend((e["category"], now - e["timestamp"]) for e in entries)
+        done += len(entries)
+
+
+def _consumer_loop(worker, consumer, total: int, done: list[int], lock: threading.Lock) -> None:
+    """consumer 하나의 fetch → process 루프. 모든 consumer가 합쳐 total건을 처리하면 끝난다."""
+    consumer.conn = worker._init_db()  # sqlite3 연결은 만든 스레드에서만 쓸 수 있다
+    while True:
+        with lock:
+            if done[0] >= total:
+                break
+        ids, entries = consumer.fetch(block=20)
+        if ids:
+            consumer.process(ids, entries)
+            with lock:
+                done[0] += sum(len(msg_ids) for msg_ids in ids.values())
+    consumer.conn.close()
+
+
+def _current_loop(worker, total: int, consumers: int) -> None:
+    workers = [worker._Consumer(i, shard_categories(i, consumers)) for i in range(consumers)]
+    for c in workers:
+        c.ensure_groups()
+    done, lock = [0], threading.Lock()
+    threads = [threading.Thread(target=_consumer_loop, args=(worker, c, total, done, lock)) for c in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+# (카테고리, 신청→커밋 초) — legacy는 루프가, 나머지는 worker._record 래퍼가 채운다
+_latencies: list[tuple[str, float]] = []
+
+
+def _run(worker, r: redis.Redis, mode: str, pattern: str, total: int, consumers: int) -> dict:
+    r.delete(_LEGACY_QUEUE, *STREAM_KEYS)
+    conn = worker._init_db()
+    conn.execute("DELETE FROM applications")
+    conn.commit()
+    worker._stats.update(count=0, batches=0, commit_sec=0.0, latencies=[], since=time.monotonic())
+    _latencies.clear()
+
+    if pattern == "sparse":
+        producers = [threading.Thread(target=_produce, args=(r, mode, 0, total, (0.02, 0.08)))]
+    elif pattern == "skew":
+        per = total // _BURST_PRODUCERS
+        producers = [threading.Thread(target=_produce, args=(r, mode, k * per, per, None, _WED))
+                     for k in range(_BURST_PRODUCERS)]
+        producers.append(threading.Thread(
+            target=_produce, args=(r, mode, total, _SKEW_FRI_COUNT, (0.002, 0.005), _FRI)))
+        total = per * _BURST_PRODUCERS + _SKEW_FRI_COUNT
+    else:
+        per = total // _BURST_PRODUCERS
+        producers = [threading.Thread(target=_produce, args=(r, mode, k * per, per, None))
+                     for k in range(_BURST_PRODUCERS)]
+        total = per * _BURST_PRODUCERS
+
+    started = time.perf_counter()
+    for t in producers:
+        t.start()
+    if mode == "legacy":
+        _legacy_loop(worker, conn, r, total, _latencies)
+    else:
+        _current_loop(worker, total, 1 if mode == "single" else consumers)
+    elapsed = time.perf_counter() - started
+    for t in producers:
+        t.join()
+    conn.close()
+
+    lat = sorted(sec for cat, sec in _latencies if pattern != "skew" or cat in _FRI)
+    return {
+        "count": total,
+        "rate":  total / elapsed,
+        "p50":   lat[len(lat) // 2] * 1000,
+        "p99":   lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000,
+    }
+
+
+def main() -> None:
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    consumers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    tmp = tempfile.mkdtemp()
+    db_path = os.path.join(tmp, "users.db")
+    connections.DB_PATH = db_path
+
+    import worker  # DB 경로를 바꾼 뒤 import
+    worker._DB_PATH = db_path
+    worker.refresh_board_view = lambda *a, **k: None   # 두 방식 모두 SQLite 커밋까지만 비교
+    worker.publish_board_changed = lambda *a, **k: None
+    record = worker._record
+
+    def _record(entries: list[dict], commit_sec: float) -> None:
+        record(entries, commit_sec)
+        now = time.time()
+        _latencies.extend((e["category"], now - e["timestamp"]) for e in entries)
+
+    worker._record = _record
+
+    r = redis.Redis(
+        host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+        port=int(os.environ.get("REDIS_PORT", 6379)),
+        db=int(os.environ.get("REDIS_DB", 0)),
+    )
+
+    print(f"{'방식':<8} {'부하':<7} {'건수':>6} {'처리량(건/s)':>13} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for pattern, total in (("sparse", _SPARSE_COUNT), ("burst", burst), ("skew", burst)):
+        for mode in ("legacy", "single", "sharded"):
+            res = _run(worker, r, mode, pattern, total, consumers)
+            print(f"{mode:<8} {pattern:<7} {res['count']:>6} {res['rate']:>13.0f} "
+                  f"{res['p50']:>9.1f} {res['p99']:>9.1f}")
+    r.delete(_LEGACY_QUEUE, *STREAM_KEYS)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,9 @@ import { Sidebar } from '@/components/Sidebar';
 import { ExerciseListModal } from '@/components/ExerciseListModal';
 import { buildExerciseListText } from '@/lib/buildExerciseListText';
 import type { DayType, BoardType, User, Capacity, CapacityDetails, CategoryState, NotifStatus } from '@/types';
-import { fetchAllBoardData, type BoardEntry } from '@/hooks/useScheduleSystem';
-import { updateServerTimeOffset } from '@/lib/serverTime';
+import { fetchAllBoardData, invalidateBoardCache, type BoardEntry } from '@/hooks/useScheduleSystem';
+import { useBoardStream } from '@/hooks/useBoardStream';
+import { syncServerTime, updateServerTimeOffset } from '@/lib/serverTime';
 import { usePushNotifications } from '@/hooks/usePushNotifications';
 import { fetchWithAuth } from '@/lib/fetchWithAuth';
 
@@ -271,7 +272,7 @@ function App() {
 
       const data = await response.json();
 
-      // 1. 서버 시계 동기화: 오프셋 갱신 (캐시 히트 시 Node.js가 Date.now()로 교체하므로 항상 정확)
+      // 1. 서버 시계 동기화: /api/time 다중 샘플 추정 전까지만 쓰는 단일 샘플 오프셋
       if (typeof data.serverTime === 'number') {
         updateServerTimeOffset(data.serverTime);
       }
@@ -311,6 +312,13 @@ function App() {
     return () => clearInterval(id);
   }, [user, fetchCapacities]);
 
+  // 시계 동기화: 앱 시작 시 + 5분마다 /api/time 다중 샘플 (인증 불필요)
+  useEffect(() => {
+    void syncServerTime();
+    const id = setInterval(() => { void syncServerTime(); }, 5 * 60 * 1000);
+    return () => clearInterval(id);
+  }, []);
+
   // 카운트다운/상태: 5분마다 (로그인 상태에서만)
   useEffect(() => {
     if (!user) return;
@@ -319,6 +327,30 @@ function App() {
     return () => clearInterval(id);
   }, [user, fetchCategoryStates]);
 
+  // ─── 실시간 스트림 (/api/stream) + 폴링 폴백 ─────────────────────────────────
+  // 스트림이 연결되어 있으면 게시판 변경·상태 전환을 서버가 밀어준다.
+  // 연결이 끊긴 동안에만 2초 간격으로 게시판을 폴링한다 (/api/board-delta 증분 조회).
+  const streamConnected = useBoardStream(user?.token ?? null, {
+    onBoard: (applications) => {
+      setBoardOverloaded(false);
+      setAllApplications(applications);
+    },
+    onResync: () => {
+      invalidateBoardCache();
+      fetchAllBoards();
+    },
+    onStatus: fetchCategoryStates,
+  });
+
+  useEffect(() => {
+    if (!user || streamConnected) return;
+    const id = setInterval(() => {
+      // grace period 동안은 기존 정책대로 게시판 조회를 쉬게 한다
+      if (!isGracePeriodRef.current) fetchAllBoards();
+    }, 2000);
+    return () => clearInterval(id);
+  }, [user, streamConnected, fetchAllBoards]);
+
   // ─── 카운트다운 0 도달 시 핸들러 (디바운스 + 랜덤 지터) ─────────────────────
   // 동일 정각에 여러 패널이 동시에 카운트다운 0에 도달하면 중복 호출 방지 (2초 디바운스).
   // 랜덤 지터(0~500ms)로 212명 동시 접속 시 Thundering Herd 현상을 완화한다.
@@ -6,7 +6,7 @@ import { BoardTable } from './BoardTable';
 import { AdminActionModal } from './AdminActionModal';
 import { CancelSelectionModal } from './CancelSelectionModal';
 import type { CategoryState, GuestCapacity, User } from '@/types';
-import { useScheduleSystem, Category, type BoardEntry } from '@/hooks/useScheduleSystem';
+import { useScheduleSystem, prefetchApplyTicket, Category, type BoardEntry } from '@/hooks/useScheduleSystem';
 import { fetchWithAuth } from '@/lib/fetchWithAuth';
 import { serverNow } from '@/lib/serverTime';
 
@@ -25,6 +25,9 @@ const CATEGORY_MAP: Record<string, Category> = {
   '금_잔여석': Category.FRI_LEFTOVER,
 };
 
+// 오픈 몇 ms 전부터 신청권을 미리 받는지 (서버 APPLY_TICKET_WINDOW 이내)
+const APPLY_TICKET_PREFETCH_MS = 5 * 60_000;
+
 interface AccordionPanelProps {
   title: BoardType;
   isExpanded: boolean;
@@ -190,6 +193,17 @@ export function AccordionPanel({
     return () => clearTimeout(timerId);
   }, [deadlineTimestamp]);
 
+  // 오픈 직전 신청권 미리 받기 — 서버 발급 창(10분)보다 짧게 잡고,
+  // 모든 회원이 같은 순간에 요청하지 않도록 최대 30초 무작위 지연을 둔다
+  const inTicketWindow = !!user && !isManager && status === 'before-open' && nextStatus === 'open'
+    && remainingMilliseconds > 0 && remainingMilliseconds <= APPLY_TICKET_PREFETCH_MS;
+
+  useEffect(() => {
+    if (!inTicketWindow) return;
+    const timerId = setTimeout(() => { void prefetchApplyTicket(category); }, Math.random() * 30_000);
+    return () => clearTimeout(timerId);
+  }, [inTicketWindow, category]);
+
   // ── 1. 신청 버튼 핸들러 ─────────────────────────────────────────
   const handleApply = async (e: React.MouseEvent) => {
     e.stopPropagation();
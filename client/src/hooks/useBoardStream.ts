@@ -0,0 +1,80 @@
+// hooks/useBoardStream.ts — /api/stream SSE 구독 훅
+//
+// 설계 원칙:
+//   - 게시판 변경(board)과 상태 전환(status)을 서버가 밀어주므로 주기 폴링이 필요 없다.
+//   - 연결은 별도 asyncio 서버(stream_server.py)가 유지 → Gunicorn 스레드를 점유하지 않음
+//   - EventSource는 헤더를 설정할 수 없어 토큰을 쿼리(?token=)로 전달한다.
+//   - 끊기면 EventSource가 retry 간격으로 자동 재연결하며 Last-Event-ID로 놓친 변경을 받는다.
+//   - 재연결이 불가능한 상태(401/503/미지원 브라우저)이면 connected=false를 반환하고,
+//     호출부(App.tsx)는 이를 보고 폴링으로 전환한다.
+
+import { useEffect, useRef, useState } from 'react';
+import {
+  applyBoardChanges,
+  getBoardSeq,
+  type BoardChange,
+  type BoardEntry,
+} from '@/hooks/useScheduleSystem';
+
+interface BoardStreamHandlers {
+  /** board 이벤트를 보관 중인 보드에 적용한 결과 */
+  onBoard: (applications: Record<string, BoardEntry[]>) => void;
+  /** 증분 적용 불가 — 전체 보드를 다시 받아야 함 */
+  onResync: () => void;
+  /** 카테고리 상태 전환 발생 */
+  onStatus: () => void;
+}
+
+export function useBoardStream(token: string | null, handlers: BoardStreamHandlers): boolean {
+  const [connected, setConnected] = useState(false);
+
+  // 핸들러는 매 렌더마다 바뀔 수 있으므로 ref로 최신 값을 참조 (재연결 방지)
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    if (!token || typeof EventSource === 'undefined') {
+      setConnected(false);
+      return;
+    }
+
+    const params = new URLSearchParams({ token });
+    const seq = getBoardSeq();
+    if (seq !== null) params.set('since', String(seq));
+    const source = new EventSource(`/api/stream?${params}`);
+
+    source.addEventListener('open', () => {
+      setConnected(true);
+      console.log('[스트림] 연결됨');
+    });
+
+    source.addEventListener('board', (e) => {
+      const data = JSON.parse((e as MessageEvent).data) as { seq: number; changes: BoardChange[] };
+      const applications = applyBoardChanges(data.seq, data.changes);
+      if (applications) handlersRef.current.onBoard(applications);
+    });
+
+    source.addEventListener('resync', () => {
+      handlersRef.current.onResync();
+    });
+
+    source.addEventListener('status', () => {
+      handlersRef.current.onStatus();
+    });
+
+    source.addEventListener('error', () => {
+      // CONNECTING: 브라우저가 자동 재연결 중 / CLOSED: 재연결 포기(401·503 등)
+      setConnected(false);
+      if (source.readyState === EventSource.CLOSED) {
+        console.warn('[스트림] 연결 불가 — 폴링으로 전환');
+      }
+    });
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [token]);
+
+  return connected;
+}
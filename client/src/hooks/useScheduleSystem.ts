@@ -91,16 +91,146 @@ export interface AllBoardData {
   overloaded?: boolean;
 }
 
+// ── 증분 동기화 (/api/board-delta, /api/stream) ─────────
+// 마지막으로 받은 전체 보드와 그 버전(X-Board-Seq)을 보관해 두고,
+// 이후에는 since 이후의 변경분만 받아 로컬 목록에 splice로 반영한다.
+// 변경분은 폴링(/api/board-delta) 또는 SSE(/api/stream의 board 이벤트)로 들어온다.
+export interface BoardChange {
+  seq: number;
+  op: 'insert' | 'delete' | 'reset';
+  category?: string;
+  pos?: number;
+  entry?: BoardEntry;
+}
+
+let boardCache: { seq: number; applications: Record<string, BoardEntry[]> } | null = null;
+
+function parseSeq(response: Response): number | null {
+  const raw = response.headers.get('X-Board-Seq');
+  const seq = raw === null ? NaN : Number(raw);
+  return Number.isInteger(seq) ? seq : null;
+}
+
+/** 보관 중인 보드의 버전. 아직 전체 보드를 받지 못했으면 null. */
+export function getBoardSeq(): number | null {
+  return boardCache?.seq ?? null;
+}
+
+/** 보관 중인 보드를 버린다 — 다음 fetchAllBoardData()는 전체 조회를 수행한다. */
+export function invalidateBoardCache(): void {
+  boardCache = null;
+}
+
+/**
+ * 변경분을 seq 순서대로 보관 중인 보드에 적용하고 새 보드를 반환한다.
+ * 이미 반영한 seq 이하의 변경은 건너뛴다 (스트림 재연결·폴링 중복 대비).
+ * 보드를 아직 받지 못했거나 새로 반영할 변경이 없으면 null을 반환한다.
+ */
+export function applyBoardChanges(seq: number, changes: BoardChange[]): Record<string, BoardEntry[]> | null {
+  if (!boardCache || seq <= boardCache.seq) return null;
+
+  // 변경된 카테고리만 새 배열로 교체 (React 상태 비교용)
+  const applications = { ...boardCache.applications };
+  const copied = new Set<string>();
+  for (const change of changes) {
+    if (change.seq <= boardCache.seq) continue;
+    if (change.op === 'reset') {
+      for (const cat of Object.keys(applications)) applications[cat] = [];
+      continue;
+    }
+    const cat = change.category!;
+    if (!copied.has(cat)) {
+      applications[cat] = [...(applications[cat] ?? [])];
+      copied.add(cat);
+    }
+    if (change.op === 'insert') {
+      applications[cat].splice(change.pos!, 0, change.entry!);
+    } else {
+      applications[cat].splice(change.pos!, 1);
+    }
+  }
+  boardCache = { seq, applications };
+  return applications;
+}
+
+/**
+ * 보관 중인 보드에 since 이후 변경분을 적용한다.
+ * 응답이 resync이거나 실패하면 null을 반환하여 전체 조회로 폴백한다.
+ */
+async function fetchBoardDelta(token: string): Promise<AllBoardData | null> {
+  if (!boardCache) return null;
+
+  const response = await fetchWithAuth(`/api/board-delta?since=${boardCache.seq}`, {
+    headers: { Authorization: `Bearer ${token}` },
+  });
+  if (!response.ok) return null;
+  const data = await response.json();
+
+  if (data.overloaded || data.waiting) {
+    return { applications: {}, userApplied: {}, overloaded: true };
+  }
+  if (data.resync) return null;
+
+  const applications = applyBoardChanges(data.seq, data.changes ?? []) ?? boardCache?.applications ?? {};
+
+  const applied = new Set<string>(data.applied ?? []);
+  const userApplied: Record<string, boolean> = {};
+  for (const cat of Object.keys(applications)) {
+    userApplied[cat] = applied.has(cat);
+  }
+  return { applications, userApplied };
+}
+
+// ── compact 형식 (/api/all-boards?format=compact) ───────
+// 카테고리마다 필드별 평행 배열로 받는다 (키 반복 없음, timestamp는 base 대비 ms 오프셋).
+interface CompactBoard {
+  status: string;
+  user_already_applied: boolean;
+  name: string[];
+  guest_name: (string | null)[];
+  type: number[];
+  timestamp: number[];
+}
+
+interface CompactBoards {
+  format: 'compact';
+  base: number;
+  types: string[];
+  boards: Record<string, CompactBoard>;
+}
+
+function decodeCompactBoard(board: CompactBoard, base: number, types: string[]): BoardEntry[] {
+  const entries: BoardEntry[] = [];
+  for (let i = 0; i < board.name.length; i++) {
+    const entry: BoardEntry = {
+      user_id: '',
+      name: board.name[i],
+      type: types[board.type[i]] ?? 'member',
+      timestamp: (base + board.timestamp[i]) / 1000,
+    };
+    const guest = board.guest_name[i];
+    if (guest !== null) entry.guest_name = guest;
+    entries.push(entry);
+  }
+  return entries;
+}
+
 /**
  * 전체 카테고리 현황을 1회 요청으로 가져온다.
  * 기존 7개 개별 요청(fetchBoardData × 7)을 대체하여 서버 부하를 ~85% 감소시킨다.
  * user_already_applied: 이번 주 해당 카테고리 신청 여부 (UNIQUE_APPLY_CATEGORIES만 true 가능)
+ *
+ * 최초 1회(또는 resync 요청 시)만 전체를 받고, 이후에는 /api/board-delta로 변경분만 받는다.
+ * 전체 조회는 compact 형식으로 받아 BoardEntry 배열로 풀어 쓴다.
  */
 export async function fetchAllBoardData(): Promise<AllBoardData> {
   const token = getToken();
   if (!token) throw new Error('로그인이 필요합니다.');
 
-  const response = await fetchWithAuth('/api/all-boards', {
+  const delta = await fetchBoardDelta(token);
+  if (delta) return delta;
+
+  const response = await fetchWithAuth('/api/all-boards?format=compact', {
     headers: { Authorization: `Bearer ${token}` },
   });
   if (!response.ok) {
@@ -109,20 +239,122 @@ export async function fetchAllBoardData(): Promise<AllBoardData> {
   const data = await response.json();
 
   // 서킷 브레이커: 과부하 시 서버가 {overloaded: true, message: "..."} 반환
-  if (data.overloaded) {
+  // 입장 대기: {waiting: true, position, ...} — 같은 방식으로 기존 데이터를 유지한다
+  if (data.overloaded || data.waiting) {
     return { applications: {}, userApplied: {}, overloaded: true };
   }
 
-  const typed = data as Record<string, { status: string; applications: BoardEntry[]; user_already_applied: boolean }>;
+  const compact = data as CompactBoards;
   const applications: Record<string, BoardEntry[]> = {};
   const userApplied: Record<string, boolean> = {};
-  for (const [cat, value] of Object.entries(typed)) {
-    applications[cat] = value.applications ?? [];
-    userApplied[cat] = value.user_already_applied ?? false;
+  for (const [cat, board] of Object.entries(compact.boards)) {
+    applications[cat] = decodeCompactBoard(board, compact.base, compact.types);
+    userApplied[cat] = board.user_already_applied ?? false;
   }
+
+  const seq = parseSeq(response);
+  boardCache = seq === null ? null : { seq, applications };
   return { applications, userApplied };
 }
 
+// ── 쓰기 요청: Idempotency-Key + 네트워크 오류 재시도 ──
+// 응답을 못 받은 POST를 같은 키로 다시 보내면 서버가 첫 응답을 그대로 돌려준다
+// (중복 신청·rate limit 소모 없음). 키는 사용자 동작 1회마다 새로 만든다.
+// 입장 대기(503 + X-Admission: waiting)는 Retry-After만큼 기다렸다가 같은 키로 다시 보낸다.
+const POST_RETRIES = 2;
+const POST_RETRY_DELAY_MS = 500;
+const ADMISSION_MAX_WAIT_MS = 120_000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function postIdempotent(
+  url: string,
+  body: Record<string, string>,
+  extraHeaders: Record<string, string> = {},
+): Promise<Response> {
+  const idempotencyKey = crypto.randomUUID();
+  const deadline = Date.now() + ADMISSION_MAX_WAIT_MS;
+  let failures = 0;
+  for (;;) {
+    let response: Response;
+    try {
+      response = await fetchWithAuth(url, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Idempotency-Key': idempotencyKey,
+          ...authHeaders(),
+          ...extraHeaders,
+        },
+        credentials: 'same-origin',
+        body: JSON.stringify(body),
+      });
+    } catch (err) {
+      if (++failures > POST_RETRIES) throw err;
+      await sleep(POST_RETRY_DELAY_MS * failures);
+      continue;
+    }
+    if (response.status !== 503 || response.headers.get('X-Admission') !== 'waiting' || Date.now() >= deadline) {
+      return response;
+    }
+    const retryAfter = Number(response.headers.get('Retry-After')) || 1;
+    await sleep(Math.min(retryAfter * 1000, Math.max(deadline - Date.now(), 0)));
+  }
+}
+
+// ── 신청권: 오픈 직전 미리 발급 ────────────────────────
+// 오픈 몇 분 전에 (사용자, 카테고리, 주) 범위의 서명 신청권을 받아 두면 오픈 순간의
+// /api/apply는 서버에서 토큰·DB 검증 없이 HMAC 확인만 거친다. 신청권이 없거나 만료됐으면
+// 헤더 없이 보내고 서버는 기존 토큰 검증으로 처리한다.
+const applyTickets = new Map<Category, { ticket: string; expiresAt: number }>();
+
+export async function prefetchApplyTicket(category: Category): Promise<void> {
+  const cached = applyTickets.get(category);
+  if (cached && cached.expiresAt > Date.now()) return;
+  if (!getToken()) return;
+  try {
+    const response = await fetchWithAuth(`/api/apply/ticket?category=${category}`, {
+      headers: authHeaders(),
+      credentials: 'same-origin',
+    });
+    if (!response.ok) return;
+    const data = (await response.json()) as { ticket: string; expiresAt: number };
+    applyTickets.set(category, { ticket: data.ticket, expiresAt: data.expiresAt });
+  } catch {
+    // 발급 실패 시 신청은 토큰 검증 경로로 진행된다
+  }
+}
+
+function applyTicketHeaders(category: Category): Record<string, string> {
+  const cached = applyTickets.get(category);
+  if (!cached || cached.expiresAt <= Date.now()) return {};
+  return { 'X-Apply-Ticket': cached.ticket };
+}
+
+// ── 신청 접수증 대기 ───────────────────────────────────
+// /api/apply 200은 "큐 적재"까지만 의미한다. 응답의 receipt로 워커의 최종 결과
+// (inserted / duplicate / rejected)를 long-poll로 기다린다 — 게시판 전체 재조회 불필요.
+const RECEIPT_WAIT_SEC = 10;
+const RECEIPT_MAX_POLLS = 3;
+
+interface ReceiptOutcome {
+  status: 'pending' | 'inserted' | 'duplicate' | 'rejected';
+  reason?: string;
+}
+
+async function awaitReceipt(receipt: string): Promise<ReceiptOutcome | null> {
+  for (let i = 0; i < RECEIPT_MAX_POLLS; i++) {
+    const response = await fetch(
+      `/api/apply/receipt/${encodeURIComponent(receipt)}?wait=${RECEIPT_WAIT_SEC}`,
+      { credentials: 'same-origin' },
+    );
+    if (!response.ok) return null;
+    const outcome = (await response.json()) as ReceiptOutcome;
+    if (outcome.status !== 'pending') return outcome;
+  }
+  return null;
+}
+
 // ── Hook ───────────────────────────────────────────────
 export function useScheduleSystem(category: Category) {
   // ⭐️ 상태(State) 및 폴링(useEffect) 로직 전면 제거
@@ -132,16 +364,20 @@ export function useScheduleSystem(category: Category) {
       const body: Record<string, string> = { category };
       if (options?.guestName) body.guest_name = options.guestName;
 
-      const response = await fetchWithAuth('/api/apply', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json', ...authHeaders() },
-        credentials: 'same-origin',
-        body: JSON.stringify(body),
-      });
+      const response = await postIdempotent('/api/apply', body, applyTicketHeaders(category));
 
       const data = await response.json();
       if (!response.ok) return { success: false, error: data.error ?? '신청에 실패했습니다.', data };
 
+      // 접수증 조회 실패·시간 초과(null)는 접수 성공으로 본다 — 게시판 갱신으로 확인된다
+      if (typeof data.receipt === 'string') {
+        const outcome = await awaitReceipt(data.receipt).catch(() => null);
+        if (outcome?.status === 'duplicate') return { success: false, error: '이미 신청되어 있습니다.', data };
+        if (outcome?.status === 'rejected') {
+          return { success: false, error: outcome.reason ?? '신청이 반영되지 않았습니다.', data };
+        }
+      }
+
       return { success: true, data };
     } catch (err) {
       return { success: false, error: err instanceof Error ? err.message : '네트워크 오류' };
@@ -153,12 +389,7 @@ export function useScheduleSystem(category: Category) {
       const body: Record<string, string> = { category };
       if (options?.guestName) body.guest_name = options.guestName;
 
-      const response = await fetchWithAuth('/api/cancel', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json', ...authHeaders() },
-        credentials: 'same-origin',
-        body: JSON.stringify(body),
-      });
+      const response = await postIdempotent('/api/cancel', body);
 
       const data = await response.json();
       if (!response.ok) return { success: false, error: data.error ?? '취소에 실패했습니다.', data };
@@ -174,12 +405,7 @@ export function useScheduleSystem(category: Category) {
       const body: Record<string, string> = { category, target_user_id: targetUserId };
       if (targetGuestName) body.target_guest_name = targetGuestName;
 
-      const response = await fetchWithAuth('/api/admin/apply', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json', ...authHeaders() },
-        credentials: 'same-origin',
-        body: JSON.stringify(body),
-      });
+      const response = await postIdempotent('/api/admin/apply', body);
 
       const data = await response.json();
       if (!response.ok) return { success: false, error: data.error ?? data.message ?? '대리 신청에 실패했습니다.', data };
@@ -195,12 +421,7 @@ export function useScheduleSystem(category: Category) {
       const body: Record<string, string> = { category, target_user_id: targetUserId };
       if (targetGuestName) body.target_guest_name = targetGuestName;
 
-      const response = await fetchWithAuth('/api/admin/cancel', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json', ...authHeaders() },
-        credentials: 'same-origin',
-        body: JSON.stringify(body),
-      });
+      const response = await postIdempotent('/api/admin/cancel', body);
 
       const data = await response.json();
       if (!response.ok) return { success: false, error: data.error ?? data.message ?? '대리 취소에 실패했습니다.', data };
@@ -4,16 +4,35 @@
  * 서버에서 401(Unauthorized)을 반환하면 'auth:logout' 커스텀 이벤트를 dispatch한다.
  * App.tsx에서 이 이벤트를 수신하여 localStorage 초기화 + setUser(null)를 처리한다.
  *
+ * 입장 제어(대기실): 서버가 X-Admission: waiting과 함께 대기표(X-Admission-Ticket)를 주면
+ * 보관했다가 다음 요청에 첨부해 순번을 유지한다. X-Admission: admitted면 사용한 대기표를 버린다.
+ *
  * 사용법: 기존 fetch()와 동일한 시그니처로 대체하기만 하면 됨.
  * 반환값: 원본 Response 객체 그대로 반환 (호출부에서 .ok, .json() 등 동일하게 사용 가능)
  */
+let admissionTicket: string | null = null;
+
 export async function fetchWithAuth(
   url: string | URL | Request,
   options?: RequestInit,
 ): Promise<Response> {
-  const response = await fetch(url, options);
+  let init = options;
+  if (admissionTicket) {
+    const headers = new Headers(options?.headers);
+    headers.set('X-Admission-Ticket', admissionTicket);
+    init = { ...options, headers };
+  }
+
+  const response = await fetch(url, init);
   if (response.status === 401) {
     window.dispatchEvent(new CustomEvent('auth:logout'));
   }
+
+  const admission = response.headers.get('X-Admission');
+  if (admission === 'waiting') {
+    admissionTicket = response.headers.get('X-Admission-Ticket');
+  } else if (admission === 'admitted') {
+    admissionTicket = null;
+  }
   return response;
 }
@@ -5,27 +5,69 @@
 //       시계가 빠른 기기는 카운트다운이 일찍 0이 되고,
 //       느린 기기는 늦게 0이 된다.
 //
-// 해결: /api/category-states 응답의 serverTime 필드로 오프셋을 계산하고,
+// 해결: /api/time을 여러 번 호출해 NTP 방식으로 오프셋을 추정하고,
 //       카운트다운 계산에 Date.now() 대신 serverNow()를 사용한다.
+//         t0 = 요청 송신, t1 = 서버 수신(receive), t2 = 서버 송신(send), t3 = 응답 수신
+//         offset = ((t1 - t0) + (t2 - t3)) / 2,  rtt = (t3 - t0) - (t2 - t1)
+//       왕복 지연이 가장 짧은 샘플이 가장 대칭에 가까우므로 그 샘플의 offset을 쓴다.
 //
-// 정확도: RTT/2 ≈ ±25~100ms (NTP 방식)
+// 정확도: 최소 RTT/2 이내 (단일 샘플보다 모바일 네트워크 지연 편차의 영향이 작다)
 //
 // 사용법:
-//   updateServerTimeOffset(data.serverTime);  // fetchCategoryStates 응답 수신 시
+//   await syncServerTime();                        // 앱 시작 시 + 주기적으로
+//   updateServerTimeOffset(data.serverTime);       // /api/category-states 응답 (동기화 전 임시값)
 //   const remaining = deadlineTimestamp - serverNow();  // 카운트다운 계산 시
 
 let _offset = 0; // ms. 양수: 서버가 클라이언트보다 빠름, 음수: 반대
+let _synced = false; // syncServerTime() 추정값이 있으면 단일 샘플로 덮어쓰지 않는다
+
+const SYNC_SAMPLES = 5;
+const SYNC_SAMPLE_GAP_MS = 50;
+
+/** 고해상도 클라이언트 시각 (Unix ms, 소수점 이하 포함) */
+function clientNow(): number {
+  return performance.timeOrigin + performance.now();
+}
 
 /**
  * 서버 시각으로 오프셋을 갱신한다.
  * /api/category-states 응답의 serverTime(Unix ms)을 받아 계산한다.
+ * syncServerTime()이 한 번이라도 성공했다면 그 추정값이 더 정확하므로 무시한다.
  *
  * @param serverTimeMs - 서버의 현재 Unix ms
  */
 export function updateServerTimeOffset(serverTimeMs: number): void {
+  if (_synced) return;
   _offset = serverTimeMs - Date.now();
 }
 
+/**
+ * /api/time을 samples번 호출해 왕복 지연이 가장 짧은 샘플의 오프셋을 적용한다.
+ * 모든 샘플이 실패하면 기존 오프셋을 유지하고 false를 반환한다.
+ */
+export async function syncServerTime(samples: number = SYNC_SAMPLES): Promise<boolean> {
+  let best: { offset: number; rtt: number } | null = null;
+  for (let i = 0; i < samples; i++) {
+    if (i > 0) await new Promise((resolve) => setTimeout(resolve, SYNC_SAMPLE_GAP_MS));
+    try {
+      const t0 = clientNow();
+      const response = await fetch('/api/time', { cache: 'no-store' });
+      const t3 = clientNow();
+      if (!response.ok) continue;
+      const { receive: t1, send: t2 } = (await response.json()) as { receive: number; send: number };
+      const rtt = (t3 - t0) - (t2 - t1);
+      if (!best || rtt < best.rtt) best = { offset: ((t1 - t0) + (t2 - t3)) / 2, rtt };
+    } catch {
+      // 네트워크 오류 샘플은 건너뛴다
+    }
+  }
+  if (!best) return false;
+  // clientNow()와 Date.now()의 기준 차이(수 ms 이내)를 보정해 serverNow()와 맞춘다
+  _offset = best.offset + (clientNow() - Date.now());
+  _synced = true;
+  return true;
+}
+
 /**
  * 서버 기준 현재 시각 (Unix ms).
  * 카운트다운 계산 시 Date.now() 대신 이 함수를 사용한다.
@@ -65,7 +65,7 @@ while IFS= read -r line; do
 done < "${PROFILE_FILE}"
 
 echo "[configure] .env 업데이트 완료:"
-grep -E "^(GUNICORN_|BCRYPT_|VIP_|FLASK_VIP_)" "${ENV_FILE}" | sed 's/^/  /'
+grep -E "^(GUNICORN_|BCRYPT_|VIP_|FLASK_VIP_|WORKER_|ADMISSION_)" "${ENV_FILE}" | sed 's/^/  /'
 
 # ── PM2 재시작 ────────────────────────────────────────────────────────────────
 if command -v pm2 &>/dev/null; then
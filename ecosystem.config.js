@@ -15,6 +15,7 @@
 //   gunicorn-general : Flask GEN 인스턴스 (로그인/GET/취소, port 5000)
 //   gunicorn-vip     : Flask VIP 인스턴스 (/api/apply 전용, port 5001) ← 피크타임만
 //   apply-worker     : Redis → SQLite 백그라운드 워커
+//   stream-server    : /api/stream SSE 전용 asyncio 서버 (port 5002)
 
 'use strict';
 
@@ -94,5 +95,21 @@ module.exports = {
       max_memory_restart: '200M',
       log_date_format: 'YYYY-MM-DD HH:mm:ss',
     },
+
+    // ── 5. SSE 스트림 서버 (/api/stream) ─────────────────────────────────────
+    // 중단되어도 클라이언트는 폴링으로 자동 전환되므로 서비스 영향은 없다.
+    {
+      name        : 'stream-server',
+      script      : PYTHON_BIN,
+      args        : path.join(APP_DIR, 'stream_server.py'),
+      interpreter : 'none',
+      cwd         : APP_DIR,
+      env_file    : path.join(APP_DIR, '.env'),
+      watch       : false,
+      autorestart  : true,
+      restart_delay: 3000,    // 포트 5002 반환 대기
+      max_memory_restart: '200M',
+      log_date_format: 'YYYY-MM-DD HH:mm:ss',
+    },
   ],
 };
@@ -66,12 +66,51 @@ def on_starting(server):
 # worker.nr == 0 (첫 번째 워커)에서만 시작한다.
 def post_fork(server, worker):
     from notifications.sender import start_push_worker
+    from smash_db.connections import reset_after_fork
+    from smash_db.token_cache import start_token_cache
+
+    # SQLite 연결: 마스터(preload)에서 상속된 연결을 버리고 워커 전용 연결을 지연 생성
+    reset_after_fork()
 
     # 푸시 워커: 모든 워커에서 시작 (자기 프로세스 큐 소비)
     start_push_worker()
 
+    # token_version 캐시 무효화 구독: 모든 워커에서 시작 (구독 전에는 DB 직접 조회)
+    start_token_cache()
+
     # 주간 리셋 스케줄러: 워커 0에서만 시작 (중복 실행 방지)
     if worker.nr == 0:
         from time_control.time_handler import KST
         from time_control.scheduler_logic import start_reset_scheduler
         start_reset_scheduler(KST)
+
+
+# ── worker_exit: SQLite 연결 통계 + token_version 캐시 + 응답 압축 통계 출력 ───────────────────────
+# 워커 재시작(max_requests) 또는 종료 시 연결 재사용률과 writer Lock 대기 시간,
+# token_version 캐시·압축 캐시 적중률을 stdout(PM2 로그)에 남긴다.
+def worker_exit(server, worker):
+    from smash_db.connections import get_stats
+    from smash_db.token_cache import get_stats as get_token_cache_stats
+    from time_control.compression import get_stats as get_compress_stats
+    s = get_stats()
+    print(
+        f"[db-conn] pid={s['pid']} read_opened={s['read_opened']} "
+        f"read_reused={s['read_reused']} reuse_ratio={s['read_reuse_ratio']:.3f} "
+        f"write_acquired={s['write_acquired']} "
+        f"write_wait_avg={s['write_wait_avg'] * 1000:.2f}ms "
+        f"write_wait_max={s['write_wait_max'] * 1000:.2f}ms",
+        flush=True,
+    )
+    t = get_token_cache_stats()
+    print(
+        f"[token-cache] pid={s['pid']} hits={t['hits']} misses={t['misses']} "
+        f"invalidations={t['invalidations']} resubscribes={t['resubscribes']}",
+        flush=True,
+    )
+    c = get_compress_stats()
+    ratio = c["bytes_out"] / c["bytes_in"] if c["bytes_in"] else 0.0
+    print(
+        f"[compress] pid={s['pid']} hits={c['hits']} misses={c['misses']} "
+        f"skipped={c['skipped']} ratio={ratio:.3f}",
+        flush=True,
+    )
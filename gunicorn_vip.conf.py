@@ -5,7 +5,7 @@
 #
 # 역할:
 #   - POST /api/apply 요청만 수신 (Node.js server.js가 라우팅)
-#   - 유효성 검증 → redis.lpush("apply_queue") → 즉시 200 OK 반환
+#   - 유효성 검증 → Lua 스크립트 xadd("apply_stream:{category}") → 즉시 200 OK 반환
 #   - bcrypt/SQLite 직접 접근 없음 → timeout을 짧게 설정해도 안전
 #
 # 인스턴스별 수치:
@@ -21,7 +21,7 @@ threads      = int(os.environ.get("GUNICORN_VIP_THREADS", "4"))
 worker_class = "gthread"
 
 # ── 타임아웃 ──────────────────────────────────────────────────────────────────
-# /api/apply는 Redis lpush 후 즉시 응답 (실제 처리 < 50ms).
+# /api/apply는 Redis xadd 후 즉시 응답 (실제 처리 < 50ms).
 # 타임아웃을 짧게 잡아 hung worker를 빠르게 재생성한다.
 timeout          = 10
 graceful_timeout = 5
@@ -61,8 +61,30 @@ def on_starting(server):
 
 # ── post_fork: 워커별 데몬 스레드 시작 ────────────────────────────────────────
 # VIP 인스턴스는 /api/apply만 처리하므로:
+#   - SQLite 연결 상태 초기화: reset_after_fork() (마스터 상속 연결 폐기)
 #   - 푸시 알림 워커: 시작 (알림 트리거는 apply 성공 후 발생 가능)
+#   - token_version 캐시 무효화 구독: 시작 (@token_required 폴백 경로의 DB 조회 절감)
 #   - 주간 리셋 스케줄러: 시작하지 않음 (GEN 인스턴스 worker 0이 담당, 중복 방지)
 def post_fork(server, worker):
     from notifications.sender import start_push_worker
+    from smash_db.connections import reset_after_fork
+    from smash_db.token_cache import start_token_cache
+    reset_after_fork()
     start_push_worker()
+    start_token_cache()
+
+
+# ── worker_exit: SQLite 연결 통계 출력 ───────────────────────────────────────
+# 워커 재시작(max_requests) 또는 종료 시 연결 재사용률과 writer Lock 대기 시간을
+# stdout(PM2 로그)에 남긴다.
+def worker_exit(server, worker):
+    from smash_db.connections import get_stats
+    s = get_stats()
+    print(
+        f"[db-conn] pid={s['pid']} read_opened={s['read_opened']} "
+        f"read_reused={s['read_reused']} reuse_ratio={s['read_reuse_ratio']:.3f} "
+        f"write_acquired={s['write_acquired']} "
+        f"write_wait_avg={s['write_wait_avg'] * 1000:.2f}ms "
+        f"write_wait_max={s['write_wait_max'] * 1000:.2f}ms",
+        flush=True,
+    )
@@ -8,7 +8,6 @@
 #     페이로드 암호화, HTTP 전송을 단일 호출로 처리
 #   - 410 Gone 응답 → 만료된 구독을 SQLite에서 자동 삭제
 
-import json
 import logging
 import os
 import queue
@@ -19,6 +18,8 @@ from urllib.parse import urlparse
 import requests
 from pywebpush import webpush, WebPushException
 
+from time_control import json_codec
+
 # [수정됨] 존재하지 않는 DefaultCookiePolicy 관련 임포트 삭제
 # from http.cookiejar import DefaultCookiePolicy
 
@@ -252,7 +253,7 @@ def _send_one(item: dict[str, Any]) -> None:
             "auth":   item["auth"],
         },
     }
-    encoded_payload = json.dumps(item["payload"], ensure_ascii=False)
+    encoded_payload = json_codec.dumps(item["payload"])
 
     try:
         # webpush()는 requests_session, vapid_private_key, vapid_claims를
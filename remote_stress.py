@@ -10,6 +10,7 @@ remote_stress.py  (로컬 PC 또는 EC2에서 실행)
   3. 실행:
      - EC2 내부 테스트:  python remote_stress.py --local
      - 외부 도메인 테스트: python remote_stress.py
+     - 수요일/금요일 동시 신청: 위 명령에 --split-days 추가
 
 의존 패키지:
   pip install requests
@@ -167,6 +168,8 @@ else:
 APPLY_URL   = f"{TARGET_HOST}/api/apply"
 BOARD_URL   = f"{TARGET_HOST}/api/all-boards"
 CATEGORY    = "WED_REGULAR"
+# --split-days: 유효 신청을 수요일/금요일 정규 운동에 번갈아 보낸다 (22:00 동시 오픈 재현 — worker consumer 분산 확인)
+CATEGORIES    = ("WED_REGULAR", "FRI_REGULAR") if "--split-days" in sys.argv else (CATEGORY,)
 
 GET_REPEAT      = 4    # 유저당 GET 반복 횟수 (100명 x 4 = 400건)
 BARRIER_TIMEOUT = 60   # 배리어 대기 최대 시간 (초) — 원격이므로 넉넉하게
@@ -196,7 +199,7 @@ tasks = []
 # Group A: 유효 토큰으로 POST /api/apply (운동 신청) — 100건
 for i, token in enumerate(VALID_TOKENS):
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    tasks.append(("A", "POST", APPLY_URL, headers, {"category": CATEGORY}, f"test{i+1}"))
+    tasks.append(("A", "POST", APPLY_URL, headers, {"category": CATEGORIES[i % len(CATEGORIES)]}, f"test{i+1}"))
 
 # Group B: 유효 토큰으로 GET /api/all-boards (게시판 조회) — 100 x 4 = 400건
 for repeat in range(GET_REPEAT):
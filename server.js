@@ -10,6 +10,9 @@ const FLASK_PORT     = process.env.FLASK_PORT || 5000;
 // VIP 포트: VIP_ENABLED=true (c6i.xlarge 피크타임)일 때 POST /api/apply를 별도 Gunicorn으로 분기
 const VIP_ENABLED    = process.env.VIP_ENABLED    === 'true';
 const FLASK_VIP_PORT = process.env.FLASK_VIP_PORT || 5001;
+// SSE 스트림(/api/stream)과 신청 접수증 long-poll(/api/apply/receipt/*)은
+// Gunicorn이 아닌 stream_server.py(asyncio)가 전담한다.
+const STREAM_PORT    = process.env.STREAM_PORT    || 5002;
 
 // [보안] CORS — 허용 출처를 운영 도메인으로 제한
 const ALLOWED_ORIGINS = (process.env.ALLOWED_ORIGINS || '').split(',').filter(Boolean);
@@ -47,12 +50,6 @@ app.use((req, res, next) => {
 // 정적 파일 경로를 React 빌드 폴더(client/dist)로 설정
 app.use(express.static(path.join(__dirname, 'client/dist')));
 
-// ── /api/category-states 응답 캐시 (2초 TTL) ─────────────────────────────────
-// 200명 동시 접속 × 2초 폴링 = 최대 초당 100건 요청을 캐시가 흡수한다.
-// TTL 2초: 실제 상태 변경(신청 오픈/마감)보다 훨씬 짧아 UX 영향 없음.
-let _statesCache = { body: null, headers: null, ts: 0 };
-const STATES_CACHE_TTL_MS = 2000;
-
 // ── Flask 리버스 프록시 ────────────────────────────────────────────────────────
 // /api/* 와 Flask Blueprint 경로들을 127.0.0.1:5000(Flask)으로 전달한다.
 // SPA catch-all보다 반드시 앞에 위치해야 한다.
@@ -62,29 +59,8 @@ app.use((req, res, next) => {
     const isFlask = FLASK_PREFIXES.some(p => req.path === p || req.path.startsWith(p));
     if (!isFlask) return next();
 
-    // ── /api/category-states 캐시 처리 ───────────────────────────────────────
-    // 2초 TTL 내 재요청은 캐시에서 즉시 반환하여 Flask 도달 차단.
-    // serverTime 필드는 캐시 저장 시각이 아닌 현재 시각으로 교체하여
-    // 클라이언트 시계 동기화 정확도를 유지한다.
-    if (req.method === 'GET' && req.path === '/api/category-states') {
-        if (_statesCache.body && (Date.now() - _statesCache.ts) < STATES_CACHE_TTL_MS) {
-            try {
-                const parsed = JSON.parse(_statesCache.body.toString());
-                parsed.serverTime = Date.now();
-                const freshBody = Buffer.from(JSON.stringify(parsed));
-                const headers = { ..._statesCache.headers, 'content-length': String(freshBody.length) };
-                // transfer-encoding: chunked와 content-length 공존은 RFC 7230 위반
-                // body는 이미 decoded Buffer이므로 transfer-encoding 제거
-                delete headers['transfer-encoding'];
-                res.writeHead(200, headers);
-                return res.end(freshBody);
-            } catch {
-                // JSON 파싱 실패 시 원본 캐시 그대로 반환
-                res.writeHead(200, _statesCache.headers);
-                return res.end(_statesCache.body);
-            }
-        }
-    }
+    // /api/category-states는 Flask가 전환 구간마다 사전 렌더링한 본문에 serverTime만 붙여 응답하므로
+    // (time_handler.py) 프록시에서 따로 캐시하지 않는다 — 22:00:00 상태 전환이 그대로 전달된다.
 
     // req 스트림을 파싱 없이 Flask로 직접 파이프한다.
     // - body 재직렬화를 하지 않으므로 Buffer.byteLength 관련 크래시가 원천 차단됨
@@ -105,7 +81,10 @@ app.use((req, res, next) => {
     // 전용 Gunicorn VIP 인스턴스(port 5001)로 라우팅한다.
     // 그 외 모든 요청(로그인, GET, 취소 등)은 GEN 인스턴스(port 5000)로 전달.
     const isVipApply = VIP_ENABLED && req.path === '/api/apply' && req.method === 'POST';
-    const targetPort = isVipApply ? FLASK_VIP_PORT : FLASK_PORT;
+    // /api/stream(SSE)과 /api/apply/receipt/*(접수증 long-poll)는 장시간 열린 연결이므로
+    // gthread 슬롯을 쓰지 않도록 별도 서버로 보낸다.
+    const isStream = req.path === '/api/stream' || req.path.startsWith('/api/apply/receipt/');
+    const targetPort = isStream ? STREAM_PORT : (isVipApply ? FLASK_VIP_PORT : FLASK_PORT);
 
     const options = {
         hostname: '127.0.0.1',
@@ -121,28 +100,6 @@ app.use((req, res, next) => {
     };
 
     const proxy = http.request(options, (flaskRes) => {
-        // ── category-states 캐시 갱신 ────────────────────────────────────────
-        // 성공 응답(200)일 때만 캐시에 저장한다.
-        const isCacheTarget = req.method === 'GET'
-            && req.path === '/api/category-states'
-            && flaskRes.statusCode === 200;
-
-        if (isCacheTarget) {
-            const chunks = [];
-            flaskRes.on('data', chunk => chunks.push(chunk));
-            flaskRes.on('end', () => {
-                const body = Buffer.concat(chunks);
-                _statesCache = { body, headers: flaskRes.headers, ts: Date.now() };
-                res.writeHead(200, flaskRes.headers);
-                res.end(body);
-            });
-            flaskRes.on('error', (err) => {
-                console.error('[Flask response stream error]', err.message);
-                if (!res.writableEnded) res.end();
-            });
-            return; // 아래 pipe 처리를 건너뜀
-        }
-
         res.writeHead(flaskRes.statusCode, flaskRes.headers);
         flaskRes.pipe(res);
 
@@ -154,7 +111,8 @@ app.use((req, res, next) => {
     });
 
     // Flask 연결 30초 타임아웃 — 무한 대기(hang) 방지
-    proxy.setTimeout(30_000, () => {
+    // SSE 스트림은 서버 하트비트(15초)로 생존을 확인하므로 유휴 타임아웃을 두지 않는다.
+    proxy.setTimeout(isStream ? 0 : 30_000, () => {
         proxy.destroy();
         if (!res.headersSent) {
             res.writeHead(504, { 'Content-Type': 'application/json' });
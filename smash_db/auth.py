@@ -20,13 +20,11 @@ from time_control.rate_limiter import rate_limit
 import threading as _threading
 _bcrypt_sem = _threading.Semaphore(int(os.environ.get("BCRYPT_SEMAPHORE", "1")))
 
-# DB 파일 경로 (__file__ 기준 상대 경로로 안정적으로 해석)
-DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'users.db')
+# DB 연결: 스레드별 영속 읽기 연결 + 프로세스 전용 writer (smash_db/connections.py)
+from smash_db.connections import DB_PATH, read_conn, write_conn
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH, timeout=10)  # Gunicorn timeout(30s)보다 낮게: lock 시 JSON 500 반환 보장
-    conn.row_factory = sqlite3.Row
-    return conn
+# token_version 캐시: 버전을 올린 뒤 invalidate()로 모든 워커에 무효화를 발행한다
+from smash_db.token_cache import get_token_version, invalidate as invalidate_token_version
 
 
 def migrate_token_version_column():
@@ -35,28 +33,56 @@ def migrate_token_version_column():
     서버 시작 시 1회 호출 (app.py). 이미 존재하면 아무 일도 하지 않는다.
     DEFAULT 1로 추가하므로 기존 회원 모두 버전 1을 갖게 된다.
     """
-    conn = get_db_connection()
     try:
-        conn.execute(
-            "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 1"
-        )
-        conn.commit()
+        with write_conn() as conn:
+            conn.execute(
+                "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 1"
+            )
     except sqlite3.OperationalError:
         pass  # 이미 컬럼이 존재하는 경우 — 정상
-    finally:
-        conn.close()
 
 
-def _get_token_version(student_id: str) -> int | None:
-    """DB에서 해당 사용자의 현재 token_version을 반환한다."""
-    conn = get_db_connection()
+def _get_token_version(student_id: str, presented: int | None = None) -> int | None:
+    """해당 사용자의 현재 token_version을 반환한다.
+
+    프로세스 내 캐시(smash_db/token_cache.py)를 먼저 보고, 구독이 끊겼거나
+    토큰의 ver(presented)가 캐시보다 크면 DB를 조회한다.
+    """
+    return get_token_version(student_id, presented)
+
+
+def verify_token(token: str, secret_key: str) -> tuple[dict | None, str | None]:
+    """JWT 서명·만료와 token_version을 검증한다.
+
+    Returns:
+        (payload, None)  — 유효한 토큰
+        (None, message)  — 무효 사유 메시지 (401 응답 본문에 사용)
+
+    Flask 요청 컨텍스트가 없는 프로세스(stream_server.py)에서도 같은 규칙으로
+    토큰을 검증할 수 있도록 token_required에서 분리했다.
+    """
     try:
-        row = conn.execute(
-            "SELECT token_version FROM users WHERE student_id = ?", (student_id,)
-        ).fetchone()
-        return row["token_version"] if row else None
-    finally:
-        conn.close()
+        payload = jwt.decode(token, secret_key, algorithms=["HS256"])
+    except jwt.ExpiredSignatureError:
+        return None, '토큰이 만료되었습니다. 다시 로그인해주세요.'
+    except jwt.InvalidTokenError:
+        return None, '유효하지 않은 토큰입니다.'
+
+    # 토큰 버전 검증: 비밀번호 변경 후 구 토큰 즉시 차단
+    user_id = payload.get('id')
+    token_ver = payload.get('ver')
+    current_ver = _get_token_version(user_id, token_ver)
+    if current_ver is None:
+        return None, '세션이 만료되었습니다. 다시 로그인해주세요.'
+
+    if token_ver is None:
+        # ver 필드 없는 구 토큰: 아직 비밀번호 변경이 없는 경우(token_version=1)만 허용
+        if current_ver != 1:
+            return None, '세션이 만료되었습니다. 다시 로그인해주세요.'
+    elif token_ver != current_ver:
+        return None, '세션이 만료되었습니다. 다시 로그인해주세요.'
+
+    return payload, None
 
 
 def token_required(f):
@@ -65,7 +91,7 @@ def token_required(f):
     검증 순서:
       1) Authorization 헤더에서 Bearer 토큰 추출
       2) JWT 서명·만료 검증
-      3) 토큰의 ver(token_version)과 DB의 현재 token_version 비교
+      3) 토큰의 ver(token_version)과 현재 token_version 비교 (캐시 → DB)
          → 불일치 시 비밀번호 변경 등으로 무효화된 토큰으로 간주하고 401 반환
     """
     @wraps(f)
@@ -78,26 +104,9 @@ def token_required(f):
         if not token:
             return jsonify({'message': '토큰이 없습니다. 로그인이 필요합니다.'}), 401
 
-        try:
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': '토큰이 만료되었습니다. 다시 로그인해주세요.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-
-        # 토큰 버전 검증: 비밀번호 변경 후 구 토큰 즉시 차단
-        user_id = payload.get('id')
-        current_ver = _get_token_version(user_id)
-        if current_ver is None:
-            return jsonify({'message': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
-
-        token_ver = payload.get('ver')
-        if token_ver is None:
-            # ver 필드 없는 구 토큰: 아직 비밀번호 변경이 없는 경우(token_version=1)만 허용
-            if current_ver != 1:
-                return jsonify({'message': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
-        elif token_ver != current_ver:
-            return jsonify({'message': '세션이 만료되었습니다. 다시 로그인해주세요.'}), 401
+        payload, error = verify_token(token, current_app.config['SECRET_KEY'])
+        if error:
+            return jsonify({'message': error}), 401
 
         request.current_user = {
             'id': payload['id'],
@@ -118,11 +127,9 @@ def verify_password(student_id: str, current_password: str) -> bool:
     Returns:
         비밀번호가 일치하면 True, 사용자가 없거나 불일치하면 False.
     """
-    conn = get_db_connection()
-    user = conn.execute(
+    user = read_conn().execute(
         'SELECT password FROM users WHERE student_id = ?', (student_id,)
     ).fetchone()
-    conn.close()
 
     if user is None:
         return False
@@ -157,14 +164,14 @@ def update_password(student_id: str, new_password: str) -> bool:
             new_password.encode('utf-8'), bcrypt.gensalt()
         ).decode('utf-8')
 
-    conn = get_db_connection()
-    cursor = conn.execute(
-        'UPDATE users SET password = ?, token_version = token_version + 1 WHERE student_id = ?',
-        (hashed_pw, student_id)
-    )
-    conn.commit()
+    with write_conn() as conn:
+        cursor = conn.execute(
+            'UPDATE users SET password = ?, token_version = token_version + 1 WHERE student_id = ?',
+            (hashed_pw, student_id)
+        )
     updated = cursor.rowcount > 0
-    conn.close()
+    if updated:
+        invalidate_token_version(student_id)
 
     return updated
 
@@ -186,22 +193,22 @@ def login():
     if len(user_id) > 50 or len(user_pw) > 72:
         return jsonify({'message': '아이디 또는 비밀번호가 올바르지 않습니다.'}), 401
 
-    conn = get_db_connection()
-    user = conn.execute('SELECT * FROM users WHERE student_id = ?', (user_id,)).fetchone()
+    user = read_conn().execute('SELECT * FROM users WHERE student_id = ?', (user_id,)).fetchone()
 
     if user:
         with _bcrypt_sem:
             pw_match = bcrypt.checkpw(user_pw.encode('utf-8'), user['password'].encode('utf-8'))
         if pw_match:
             # 새 로그인 시 token_version 증가 → 기존 기기의 토큰 즉시 무효화 (중복 로그인 방지)
-            conn.execute(
-                'UPDATE users SET token_version = token_version + 1 WHERE student_id = ?',
-                (user['student_id'],)
-            )
-            conn.commit()
-            new_version = conn.execute(
-                'SELECT token_version FROM users WHERE student_id = ?', (user['student_id'],)
-            ).fetchone()['token_version']
+            with write_conn() as conn:
+                conn.execute(
+                    'UPDATE users SET token_version = token_version + 1 WHERE student_id = ?',
+                    (user['student_id'],)
+                )
+                new_version = conn.execute(
+                    'SELECT token_version FROM users WHERE student_id = ?', (user['student_id'],)
+                ).fetchone()['token_version']
+            invalidate_token_version(user['student_id'])
             token = jwt.encode({
                 'id': user['student_id'],
                 'name': user['name'],
@@ -210,7 +217,6 @@ def login():
                 'exp': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=2880)  # 4개월
             }, current_app.config['SECRET_KEY'], algorithm="HS256")
 
-            conn.close()
             return jsonify({
                 'message': '로그인 성공',
                 'token': token,
@@ -219,7 +225,6 @@ def login():
                 'role': user['role']
             }), 200
 
-    conn.close()
     return jsonify({'message': '아이디 또는 비밀번호가 올바르지 않습니다.'}), 401
 
 @auth_bp.route('/api/force-reset-password', methods=['POST'])
@@ -265,11 +270,9 @@ def force_reset_password():
         return jsonify({'message': pw_error}), 400
 
     # 대상 회원 존재 여부 확인
-    conn = get_db_connection()
-    target_user = conn.execute(
+    target_user = read_conn().execute(
         'SELECT student_id FROM users WHERE student_id = ?', (target_id,)
     ).fetchone()
-    conn.close()
 
     if target_user is None:
         return jsonify({'message': '해당 회원을 찾을 수 없습니다.'}), 404
@@ -0,0 +1,179 @@
+# smash_db/connections.py — users.db 공용 SQLite 연결 관리 (fork-safe)
+#
+# 기존에는 board_store / auth / admin / capacity.store가 호출마다 sqlite3.connect()를
+# 새로 열었다. 인증된 폴링 1건이 3~4개의 연결을 열고, board_store는 매번
+# PRAGMA journal_mode/synchronous를 다시 실행했다.
+#
+# [구조]
+#   - 읽기: 스레드당 영속 연결 1개 (threading.local)
+#           gthread 워커의 요청 스레드는 재사용되므로 연결도 그대로 재사용된다.
+#           PRAGMA query_only=ON으로 읽기 연결에서의 실수성 쓰기를 차단한다.
+#   - 쓰기: 프로세스당 전용 writer 연결 1개 + threading.Lock
+#           SQLite는 어차피 쓰기를 직렬화하므로, 프로세스 안에서 먼저 줄을 세워
+#           busy 대기 대신 Lock 대기로 바꾸고 그 대기 시간을 통계로 남긴다.
+#
+# [fork 안전성]
+#   preload_app=True 환경에서는 app.py가 마스터에서 로드되며 부팅 시 쿼리를 실행한다.
+#   SQLite 연결은 fork()를 넘어 공유하면 안 되므로:
+#     1) 모든 연결은 최초 사용 시점에 지연 생성한다.
+#     2) 연결마다 생성 PID를 기록하고, 사용 시 os.getpid()와 다르면 버리고 새로 연다.
+#     3) gunicorn post_fork 훅에서 reset_after_fork()를 호출해 상속된 상태를 즉시 비운다.
+#   상속된 연결은 close()하지 않고 참조만 보관한다 — 부모 프로세스 소유 핸들을
+#   자식에서 닫으면 부모의 잠금 상태에 영향을 줄 수 있기 때문이다.
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# DB 파일 경로 (__file__ 기준 상대 경로로 안정적으로 해석)
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "users.db")
+
+_BUSY_TIMEOUT = 10  # Gunicorn timeout(30s)보다 낮게: lock 시 JSON 500 반환 보장
+
+_local = threading.local()
+
+_write_lock = threading.Lock()
+_writer: sqlite3.Connection | None = None
+_writer_pid: int | None = None
+
+# fork 이전 프로세스에서 상속된 연결 — 닫지 않고 참조만 유지 (GC에 의한 close 방지)
+_inherited: list[sqlite3.Connection] = []
+
+_stats_lock = threading.Lock()
+_stats: dict[str, float] = {
+    "read_opened":      0,    # 새로 연 읽기 연결 수
+    "read_reused":      0,    # 기존 읽기 연결 재사용 횟수
+    "write_opened":     0,    # 새로 연 writer 연결 수
+    "write_acquired":   0,    # writer Lock 획득 횟수
+    "write_wait_total": 0.0,  # writer Lock 대기 누적 (초)
+    "write_wait_max":   0.0,  # writer Lock 최대 대기 (초)
+    "fork_discarded":   0,    # PID 불일치로 폐기한 상속 연결 수
+}
+
+
+def _bump(key: str, amount: float = 1) -> None:
+    with _stats_lock:
+        _stats[key] += amount
+
+
+# ── 연결 생성 ─────────────────────────────────────────────────────────────────
+
+def _open_reader() -> sqlite3.Connection:
+    # isolation_level=None(autocommit): SELECT마다 최신 커밋을 본다.
+    conn = sqlite3.connect(DB_PATH, timeout=_BUSY_TIMEOUT, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def _open_writer() -> sqlite3.Connection:
+    # 프로세스 내 여러 스레드가 Lock 아래에서 번갈아 사용하므로 check_same_thread=False
+    conn = sqlite3.connect(DB_PATH, timeout=_BUSY_TIMEOUT, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+# ── 공개 API ──────────────────────────────────────────────────────────────────
+
+def read_conn() -> sqlite3.Connection:
+    """현재 스레드의 영속 읽기 연결을 반환한다 (없거나 fork 이전 것이면 새로 연다).
+
+    호출자는 연결을 close()하지 않는다. 쓰기는 write_conn()을 사용한다.
+    """
+    pid = os.getpid()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == pid:
+        _bump("read_reused")
+        return conn
+
+    if conn is not None:
+        _inherited.append(conn)
+        _bump("fork_discarded")
+
+    conn = _open_reader()
+    _local.conn = conn
+    _local.pid = pid
+    _bump("read_opened")
+    return conn
+
+
+@contextmanager
+def write_conn() -> Iterator[sqlite3.Connection]:
+    """프로세스 전용 writer 연결을 Lock 아래에서 빌려준다.
+
+    블록이 정상 종료되면 commit, 예외가 발생하면 rollback 후 예외를 다시 던진다.
+
+        with write_conn() as conn:
+            conn.execute("INSERT ...")
+    """
+    global _writer, _writer_pid
+
+    started = time.perf_counter()
+    with _write_lock:
+        waited = time.perf_counter() - started
+        with _stats_lock:
+            _stats["write_acquired"] += 1
+            _stats["write_wait_total"] += waited
+            if waited > _stats["write_wait_max"]:
+                _stats["write_wait_max"] = waited
+
+        pid = os.getpid()
+        if _writer is None or _writer_pid != pid:
+            if _writer is not None:
+                _inherited.append(_writer)
+                _bump("fork_discarded")
+            _writer = _open_writer()
+            _writer_pid = pid
+            _bump("write_opened")
+
+        conn = _writer
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+
+def reset_after_fork() -> None:
+    """fork 직후 자식 프로세스에서 호출한다 (gunicorn post_fork 훅).
+
+    마스터에서 상속된 연결 참조를 모두 내려놓아, 이후 호출이 자식 전용 연결을
+    지연 생성하도록 한다. PID 검사가 최종 안전망이지만, 여기서 미리 비워 두면
+    상속 연결이 한 번도 사용되지 않음이 보장된다.
+    """
+    global _write_lock, _writer, _writer_pid, _stats_lock
+
+    # fork 시점에 다른 스레드가 잡고 있던 Lock은 자식에서 영원히 풀리지 않으므로 새로 만든다.
+    _write_lock = threading.Lock()
+    _stats_lock = threading.Lock()
+
+    if _writer is not None:
+        _inherited.append(_writer)
+    _writer = None
+    _writer_pid = None
+
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        _inherited.append(conn)
+        _local.conn = None
+
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_stats() -> dict[str, float]:
+    """현재 프로세스의 연결 재사용·writer 대기 통계를 반환한다."""
+    with _stats_lock:
+        stats = dict(_stats)
+    acquired = stats["write_acquired"]
+    stats["write_wait_avg"] = stats["write_wait_total"] / acquired if acquired else 0.0
+    total_reads = stats["read_opened"] + stats["read_reused"]
+    stats["read_reuse_ratio"] = stats["read_reused"] / total_reads if total_reads else 0.0
+    stats["pid"] = os.getpid()
+    return stats
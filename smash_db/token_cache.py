@@ -0,0 +1,185 @@
+# token_cache.py — token_version 프로세스 내 TTL 캐시 + Redis pub/sub 무효화
+#
+# 인증이 필요한 모든 요청(@token_required, @admin_required)은 token_version을 확인한다.
+# 2초 폴링 때문에 이 SELECT가 시스템에서 가장 자주 실행되는 쿼리다.
+# 워커 프로세스마다 student_id → token_version을 TOKEN_CACHE_TTL초 동안 보관하고,
+# 버전을 올리는 쪽(로그인, update_password)이 TOKEN_EVENTS_CHANNEL로 무효화를 발행해
+# 모든 GEN·VIP 워커가 즉시 항목을 지운다.
+#
+# [판정] 토큰의 ver와 캐시 값 비교 — token_version은 증가만 한다
+#   ver == 캐시  → 캐시 값 사용 (DB 조회 없음)
+#   ver <  캐시  → 캐시 값 사용 → 호출자가 불일치로 거부 (이미 무효화된 구 토큰)
+#   ver >  캐시  → 캐시가 낡았다 (다른 워커에서 방금 로그인) → DB에서 다시 읽는다
+#   ver 없음(구 토큰) → 캐시 값 사용 (호출자가 1과 비교)
+#   캐시에 없거나 만료 → DB 조회 후 저장 (회원 없음(None)은 저장하지 않는다)
+#
+# [실패 시 DB로] 구독이 건강할 때만 캐시를 쓴다.
+#   - 구독 스레드가 시작되지 않은 프로세스(stream_server.py, 스크립트) → 항상 DB
+#   - Redis 연결 실패·끊김, _PING_INTERVAL × 3초 동안 PONG 없음 → 캐시 비우고 DB, 3초 후 재구독
+#   - 재구독에 성공하면 그 사이 놓친 무효화가 있을 수 있으므로 캐시를 비우고 다시 시작한다
+#
+# [경합] DB 조회 중 무효화가 도착하면 방금 읽은 값을 저장하지 않는다 (_generation 비교).
+#
+# [한계] 무효화 발행이 실패하면(Redis 장애) 다른 워커는 최대 TOKEN_CACHE_TTL초 동안 구 버전을
+#        사용할 수 있다 — 보통은 같은 장애로 구독도 끊겨 즉시 DB로 돌아간다.
+#        DB를 직접 고치는 스크립트(setup_db_and_tokens.py, reset_users_from_csv.py)는 발행하지 않으므로
+#        실행 후 TOKEN_CACHE_TTL초가 지나야 모든 워커에 반영된다.
+#
+# 사용: gunicorn post_fork 훅에서 start_token_cache()를 호출한다 (GEN·VIP 모두).
+
+import logging
+import os
+import threading
+import time
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from smash_db.connections import read_conn
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = os.environ.get("TOKEN_EVENTS_CHANNEL", "auth:token-version")
+TTL = float(os.environ.get("TOKEN_CACHE_TTL", "30"))
+
+_PING_INTERVAL = 5.0     # 초 — 구독 연결 확인 주기 (응답이 3주기 없으면 끊긴 것으로 본다)
+_RETRY_DELAY = 3.0
+
+_redis_kwargs = dict(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_connect_timeout=1,
+)
+
+_redis_client = redis.Redis(
+    **_redis_kwargs,
+    socket_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # 무효화 발행이 로그인·비밀번호 변경 응답을 지연시키지 않도록
+)
+
+# 구독 전용 — 메시지를 기다리는 연결이므로 socket_timeout 없이 PING/PONG으로 끊김을 판단한다
+_subscriber_client = redis.Redis(**_redis_kwargs)
+
+# student_id → (token_version, 만료 monotonic 시각)
+_cache: dict[str, tuple[int, float]] = {}
+_lock = threading.Lock()
+_healthy = False
+_generation = 0          # 무효화·구독 상태 변경마다 증가
+_stats = {"hits": 0, "misses": 0, "invalidations": 0, "resubscribes": 0}
+
+
+# ── 조회 ──────────────────────────────────────────────────────────────────────
+
+def _load(student_id: str) -> int | None:
+    """DB에서 해당 사용자의 현재 token_version을 반환한다."""
+    row = read_conn().execute(
+        "SELECT token_version FROM users WHERE student_id = ?", (student_id,)
+    ).fetchone()
+    return row["token_version"] if row else None
+
+
+def get_token_version(student_id: str, presented: int | None = None) -> int | None:
+    """현재 token_version을 반환한다 (캐시 우선, 판정 규칙은 모듈 주석 참고).
+
+    Args:
+        presented: 토큰의 ver 필드 — 캐시보다 크면 캐시를 믿지 않고 DB를 다시 읽는다.
+    """
+    if _healthy:
+        entry = _cache.get(student_id)
+        if entry is not None and entry[1] > time.monotonic():
+            if presented is None or presented <= entry[0]:
+                _stats["hits"] += 1
+                return entry[0]
+
+    _stats["misses"] += 1
+    generation = _generation
+    version = _load(student_id)
+    if version is not None:
+        with _lock:
+            if _healthy and generation == _generation:
+                _cache[student_id] = (version, time.monotonic() + TTL)
+    return version
+
+
+# ── 무효화 ────────────────────────────────────────────────────────────────────
+
+def _evict(student_id: str) -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.pop(student_id, None)
+    _stats["invalidations"] += 1
+
+
+def _reset(healthy: bool) -> None:
+    global _generation, _healthy
+    with _lock:
+        _generation += 1
+        _healthy = healthy
+        _cache.clear()
+
+
+def invalidate(student_id: str) -> None:
+    """token_version을 올린 직후(커밋 후) 호출한다. 실패해도 예외를 던지지 않는다."""
+    _evict(student_id)
+    try:
+        _redis_client.publish(CHANNEL, student_id)
+    except redis.RedisError as e:
+        logger.warning("token_version 무효화 발행 실패 (%s): %s", student_id, e)
+
+
+# ── 구독 스레드 ────────────────────────────────────────────────────────────────
+
+def _listen() -> None:
+    """무효화 채널을 구독한다. 구독이 확인된 동안만 캐시를 사용한다."""
+    while True:
+        pubsub = _subscriber_client.pubsub()
+        try:
+            pubsub.subscribe(CHANNEL)
+            last_seen = last_ping = time.monotonic()
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                now = time.monotonic()
+                if message is not None:
+                    last_seen = now
+                    if message["type"] == "subscribe":
+                        _reset(healthy=True)
+                        logger.info("token_version 무효화 채널 구독 시작: %s", CHANNEL)
+                    elif message["type"] == "message":
+                        _evict(message["data"])
+                if now - last_ping >= _PING_INTERVAL:
+                    pubsub.ping()
+                    last_ping = now
+                if now - last_seen > _PING_INTERVAL * 3:
+                    raise redis.ConnectionError("PONG 응답 없음")
+        except (redis.RedisError, OSError) as e:
+            logger.warning("token_version 구독 실패: %s — %.0f초 후 재시도 (DB 직접 조회)", e, _RETRY_DELAY)
+        finally:
+            _reset(healthy=False)
+            try:
+                pubsub.close()
+            except (redis.RedisError, OSError):
+                pass
+        _stats["resubscribes"] += 1
+        time.sleep(_RETRY_DELAY)
+
+
+def start_token_cache() -> None:
+    """구독 데몬 스레드를 시작한다 (워커당 1회, gunicorn post_fork 훅).
+
+    fork 시점에 다른 스레드가 잡고 있던 Lock은 자식에서 풀리지 않으므로 새로 만든다.
+    """
+    global _lock
+    _lock = threading.Lock()
+    _reset(healthy=False)
+    for key in _stats:
+        _stats[key] = 0
+    threading.Thread(target=_listen, daemon=True, name="token-cache").start()
+
+
+def get_stats() -> dict[str, int]:
+    """현재 프로세스의 캐시 적중·무효화 통계를 반환한다."""
+    return dict(_stats)
@@ -0,0 +1,430 @@
+# stream_server.py — /api/stream SSE(Server-Sent Events) + 신청 접수증 long-poll 전용 경량 서버
+#
+# Gunicorn gthread 슬롯(피크 12개)을 클라이언트당 하나씩 붙잡지 않도록,
+# 장시간 열린 연결은 Flask와 분리된 asyncio 단일 프로세스가 전담한다.
+# Node.js 프록시가 /api/stream, /api/apply/receipt/*만 이 서버(STREAM_PORT, 기본 5002)로 전달한다.
+#
+# [데이터 흐름]
+#   worker.py / board_store 쓰기 ──PUBLISH board:events──▶ Redis
+#                                                          │ (프로세스당 구독 1개)
+#   stream_server._pubsub_listener ◀───────────────────────┘
+#        └─ _wake 이벤트 → _board_feed가 board_changes 로그를 1회 조회
+#             └─ 같은 SSE 메시지(bytes)를 모든 클라이언트 큐에 전달
+#
+#   _status_feed: get_next_change()로 다음 상태 전환 시각까지 잠들었다가
+#                 전환 순간 status 이벤트를 브로드캐스트
+#
+# [이벤트]
+#   hello  — 연결 직후 1회: {"seq", "statuses", "serverTime"}
+#   board  — 보드 변경: {"seq", "changes": [...]}  (id: seq → 재연결 시 Last-Event-ID)
+#   resync — 로그가 잘려 증분 적용 불가: {"seq"} → 클라이언트는 /api/all-boards 재조회
+#   status — 카테고리 상태 전환: {"statuses", "serverTime"}
+#   (주석 ping — 15초 하트비트, 프록시 idle 타임아웃 방지)
+#
+# [접수증] GET /api/apply/receipt/<id>?wait=초  (time_control/apply_receipt.py)
+#   worker가 결과를 기록하면 RECEIPT_CHANNEL 알림으로 깨어나 키를 다시 읽는다.
+#   결과가 나오거나 wait(최대 _RECEIPT_MAX_WAIT초)이 지나면 응답한다:
+#     200 {"receipt", "status": pending|inserted|duplicate|rejected[, "reason"]}
+#     404 — 없는 번호이거나 만료됨
+#   접수 번호가 곧 조회 권한이므로 토큰 검증(SQLite 조회)을 하지 않는다.
+#
+# [폴백]
+#   연결 거부(401/503)·Redis 장애·서버 미기동 시 클라이언트는 기존 폴링으로 돌아간다.
+#   Redis 알림이 끊겨도 _board_feed는 _FALLBACK_CHECK초마다 로그를 직접 확인한다.
+#
+# 실행: python stream_server.py
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from smash_db.auth import verify_token  # noqa: E402
+from time_control import json_codec  # noqa: E402
+from time_control.apply_receipt import PENDING, RECEIPT_CHANNEL, is_valid_id, receipt_key  # noqa: E402
+from time_control.board_events import CHANNEL  # noqa: E402
+from time_control.board_store import get_board_version, get_changes_since  # noqa: E402
+from time_control.scheduler_logic import Category, get_current_status, get_next_change  # noqa: E402
+
+# ── 설정 ──────────────────────────────────────────────────────────────────────
+
+_HOST = "127.0.0.1"   # Node.js 프록시에서만 접근
+_PORT = int(os.environ.get("STREAM_PORT", "5002"))
+_SECRET_KEY = os.environ.get("SECRET_KEY")
+
+_MAX_CLIENTS     = int(os.environ.get("STREAM_MAX_CLIENTS", "1000"))
+_CLIENT_QUEUE    = 64     # 클라이언트별 미전송 메시지 상한 — 초과 시 resync 후 연결 종료
+_HEARTBEAT       = 15     # 초
+_FALLBACK_CHECK  = 2      # 초 — pub/sub 알림 없이도 로그를 확인하는 주기
+_COALESCE        = 0.05   # 초 — 연속 알림을 한 번의 조회·브로드캐스트로 합치는 간격
+_RETRY_MS        = 3000   # EventSource 재연결 대기 (retry 필드)
+_HEADER_TIMEOUT  = 10     # 초 — 요청 헤더 수신 제한
+
+_RECEIPT_PATH        = "/api/apply/receipt/"
+_RECEIPT_MAX_WAIT    = 20     # 초 — Node 프록시 타임아웃(30초)보다 짧게
+_RECEIPT_MAX_WAITERS = int(os.environ.get("RECEIPT_MAX_WAITERS", "2000"))  # 초과 시 기다리지 않고 현재 상태 응답
+
+_KST = timezone(timedelta(hours=9))
+
+# ── 공유 상태 (이벤트 루프 단일 스레드에서만 접근) ─────────────────────────────
+
+_clients: set[asyncio.Queue] = set()
+_wake = asyncio.Event()
+_last_seq = 0
+
+# 접수 번호 → 기다리는 요청들의 깨우기 이벤트
+_receipt_waiters: dict[str, set[asyncio.Event]] = {}
+_receipt_waiting = 0
+_redis: aioredis.Redis | None = None  # 접수증 조회용 (main()에서 생성)
+
+
+def _redis_kwargs() -> dict:
+    return {
+        "host": os.environ.get("REDIS_HOST", "127.0.0.1"),
+        "port": int(os.environ.get("REDIS_PORT", 6379)),
+        "db": int(os.environ.get("REDIS_DB", 0)),
+        "decode_responses": True,
+        "socket_connect_timeout": 3,
+    }
+
+
+def _now_kst() -> datetime:
+    return datetime.now(_KST)
+
+
+def _statuses(now: datetime) -> dict[str, str]:
+    return {cat.value: get_current_status(cat.value, now).value for cat in Category}
+
+
+def _sse(event: str, data: dict, event_id: int | None = None) -> bytes:
+    """SSE 메시지 1건을 직렬화한다. 브로드캐스트 시 한 번만 만들어 모든 클라이언트가 공유한다."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json_codec.dumps(data))
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def _broadcast(message: bytes) -> None:
+    for q in list(_clients):
+        try:
+            q.put_nowait(message)
+        except asyncio.QueueFull:
+            _evict(q)
+
+
+def _evict(q: asyncio.Queue) -> None:
+    """따라오지 못하는 클라이언트: 큐를 비우고 resync 안내 후 연결을 닫게 한다."""
+    _clients.discard(q)
+    while not q.empty():
+        q.get_nowait()
+    q.put_nowait(_sse("resync", {"seq": _last_seq}))
+    q.put_nowait(None)
+
+
+# ── 피드 ──────────────────────────────────────────────────────────────────────
+
+def _wake_receipts(receipt_ids: str) -> None:
+    """worker가 발행한 접수 번호 목록(공백 구분)을 기다리는 요청들을 깨운다."""
+    for receipt_id in receipt_ids.split():
+        for event in _receipt_waiters.get(receipt_id, ()):
+            event.set()
+
+
+async def _pubsub_listener() -> None:
+    """Redis 채널을 구독하며 보드 알림마다 _wake를, 접수증 알림마다 대기 요청을 깨운다.
+
+    장애 시 3초 후 재구독.
+    """
+    while True:
+        client = aioredis.Redis(**_redis_kwargs())
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(CHANNEL, RECEIPT_CHANNEL)
+                print(f"[stream] Redis 채널 구독 시작: {CHANNEL}, {RECEIPT_CHANNEL}")
+                _wake.set()  # 재구독 사이에 놓친 변경 확인
+                for events in _receipt_waiters.values():
+                    for event in events:
+                        event.set()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    if message["channel"] == RECEIPT_CHANNEL:
+                        _wake_receipts(message["data"])
+                    else:
+                        _wake.set()
+        except (redis.RedisError, OSError) as e:
+            print(f"[stream] Redis 구독 실패: {e} — 3초 후 재시도 (로그 직접 확인으로 동작)")
+        finally:
+            await client.aclose()
+        await asyncio.sleep(3)
+
+
+async def _board_feed() -> None:
+    """변경 로그를 읽어 board/resync 이벤트를 브로드캐스트한다."""
+    global _last_seq
+    _last_seq = await asyncio.to_thread(get_board_version)
+    while True:
+        try:
+            await asyncio.wait_for(_wake.wait(), _FALLBACK_CHECK)
+        except asyncio.TimeoutError:
+            pass
+        _wake.clear()
+
+        try:
+            seq, changes = await asyncio.to_thread(get_changes_since, _last_seq)
+        except Exception as e:  # noqa: BLE001 — SQLite 일시 장애 시 다음 주기에 재시도
+            print(f"[stream] 변경 로그 조회 실패: {e}")
+            await asyncio.sleep(1)
+            continue
+
+        if changes is None:
+            _last_seq = seq
+            _broadcast(_sse("resync", {"seq": seq}))
+        elif changes:
+            _last_seq = seq
+            _broadcast(_sse("board", {"seq": seq, "changes": changes}, event_id=seq))
+
+        await asyncio.sleep(_COALESCE)
+
+
+async def _status_feed() -> None:
+    """다음 상태 전환 시각까지 대기했다가 status 이벤트를 브로드캐스트한다."""
+    last = _statuses(_now_kst())
+    while True:
+        now = _now_kst()
+        next_at = min(get_next_change(cat.value, now)[0] for cat in Category)
+        # 시계 보정·절전 복귀에 대비해 최대 60초 단위로 깨어나 재계산한다.
+        delay = min((next_at - now).total_seconds(), 60)
+        await asyncio.sleep(max(delay, 0) + 0.01)
+
+        current = _statuses(_now_kst())
+        if current != last:
+            last = current
+            _broadcast(_sse("status", {
+                "statuses": current,
+                "serverTime": int(time.time() * 1000),
+            }))
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+
+async def _respond(writer: asyncio.StreamWriter, status: str, body: dict) -> None:
+    payload = json_codec.dumps_bytes(body)
+    writer.write(
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "Connection: close\r\n\r\n".encode() + payload
+    )
+    await writer.drain()
+
+
+def _parse_int(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+async def _read_receipt(receipt_id: str) -> dict | None:
+    raw = await _redis.get(receipt_key(receipt_id))
+    return json_codec.loads(raw) if raw is not None else None
+
+
+async def _await_receipt(receipt_id: str, wait: float) -> dict | None:
+    """접수증 결과가 나오거나 wait초가 지날 때까지 기다린다 (None = 없는 번호·만료).
+
+    대기 등록 → 조회 순서로 해서 조회와 등록 사이에 발행된 알림을 놓치지 않는다.
+    알림이 끊겨도 _FALLBACK_CHECK초마다 키를 다시 읽는다.
+    """
+    global _receipt_waiting
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    event = asyncio.Event()
+    waiters = _receipt_waiters.setdefault(receipt_id, set())
+    waiters.add(event)
+    _receipt_waiting += 1
+    try:
+        while True:
+            receipt = await _read_receipt(receipt_id)
+            remaining = deadline - loop.time()
+            if receipt is None or receipt.get("status") != PENDING or remaining <= 0:
+                return receipt
+            try:
+                await asyncio.wait_for(event.wait(), min(remaining, _FALLBACK_CHECK))
+            except asyncio.TimeoutError:
+                pass
+            event.clear()
+    finally:
+        _receipt_waiting -= 1
+        waiters.discard(event)
+        if not waiters:
+            _receipt_waiters.pop(receipt_id, None)
+
+
+async def _handle_receipt(writer: asyncio.StreamWriter, receipt_id: str, query: dict) -> None:
+    if not is_valid_id(receipt_id):
+        await _respond(writer, "404 Not Found", {"error": "접수 번호를 찾을 수 없습니다."})
+        return
+    try:
+        wait = min(max(float(query.get("wait", ["0"])[0]), 0.0), _RECEIPT_MAX_WAIT)
+    except ValueError:
+        wait = 0.0
+    if _receipt_waiting >= _RECEIPT_MAX_WAITERS:
+        wait = 0.0
+
+    try:
+        if wait:
+            receipt = await _await_receipt(receipt_id, wait)
+        else:
+            receipt = await _read_receipt(receipt_id)
+    except (redis.RedisError, OSError):
+        await _respond(writer, "503 Service Unavailable", {"error": "잠시 후 다시 시도해주세요."})
+        return
+
+    if receipt is None:
+        await _respond(writer, "404 Not Found", {"error": "접수 번호를 찾을 수 없습니다."})
+        return
+    await _respond(writer, "200 OK", {"receipt": receipt_id, **receipt})
+
+
+async def _handle_stream(writer: asyncio.StreamWriter, headers: dict, query: dict) -> None:
+    # EventSource는 헤더를 설정할 수 없으므로 ?token= 도 허용한다.
+    token = None
+    auth_header = headers.get("authorization", "")
+    if auth_header.startswith("Bearer "):
+        token = auth_header.split(" ", 1)[1]
+    elif "token" in query:
+        token = query["token"][0]
+    if not token:
+        await _respond(writer, "401 Unauthorized", {"message": "토큰이 없습니다. 로그인이 필요합니다."})
+        return
+    _, error = await asyncio.to_thread(verify_token, token, _SECRET_KEY)
+    if error:
+        await _respond(writer, "401 Unauthorized", {"message": error})
+        return
+
+    if len(_clients) >= _MAX_CLIENTS:
+        # 클라이언트는 스트림을 포기하고 폴링으로 전환한다.
+        await _respond(writer, "503 Service Unavailable", {"error": "stream full"})
+        return
+
+    # 재연결: Last-Event-ID(자동) → ?since=(최초 연결) 순으로 기준 seq를 정한다.
+    since = _parse_int(headers.get("last-event-id"))
+    if since is None:
+        since = _parse_int(query.get("since", [None])[0])
+
+    q: asyncio.Queue = asyncio.Queue(maxsize=_CLIENT_QUEUE)
+    _clients.add(q)  # 따라잡기 조회 전에 등록 — 중간 변경은 클라이언트가 seq로 중복 제거
+    try:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream; charset=utf-8\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n"
+            b"X-Accel-Buffering: no\r\n\r\n"
+            + f"retry: {_RETRY_MS}\n\n".encode()
+        )
+        writer.write(_sse("hello", {
+            "seq": _last_seq,
+            "statuses": _statuses(_now_kst()),
+            "serverTime": int(time.time() * 1000),
+        }))
+        if since is not None and since != _last_seq:
+            seq, changes = await asyncio.to_thread(get_changes_since, since)
+            if changes is None:
+                writer.write(_sse("resync", {"seq": seq}))
+            elif changes:
+                writer.write(_sse("board", {"seq": seq, "changes": changes}, event_id=seq))
+        await writer.drain()
+
+        while True:
+            try:
+                message = await asyncio.wait_for(q.get(), _HEARTBEAT)
+            except asyncio.TimeoutError:
+                message = b": ping\n\n"
+            if message is None:
+                await writer.drain()
+                break
+            writer.write(message)
+            await writer.drain()
+    finally:
+        _clients.discard(q)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _HEADER_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            return
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if method == "GET" and url.path == "/api/stream":
+            await _handle_stream(writer, headers, query)
+        elif method == "GET" and url.path.startswith(_RECEIPT_PATH):
+            await _handle_receipt(writer, url.path[len(_RECEIPT_PATH):], query)
+        else:
+            await _respond(writer, "404 Not Found", {"error": "Not Found"})
+
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def _stats_reporter() -> None:
+    while True:
+        await asyncio.sleep(60)
+        print(f"[stream] 연결 {len(_clients)}개, 접수증 대기 {_receipt_waiting}건, seq={_last_seq}")
+
+
+async def main() -> None:
+    if not _SECRET_KEY:
+        sys.exit("환경변수 SECRET_KEY가 설정되지 않았습니다. 서버를 시작할 수 없습니다.")
+
+    global _redis
+    _redis = aioredis.Redis(**_redis_kwargs(), socket_timeout=3)
+
+    server = await asyncio.start_server(_handle, _HOST, _PORT, reuse_address=True)
+    print(f"[stream] SSE 서버 시작 — http://{_HOST}:{_PORT}/api/stream, {_RECEIPT_PATH}<id>")
+    async with server:
+        await asyncio.gather(
+            server.serve_forever(),
+            _pubsub_listener(),
+            _board_feed(),
+            _status_feed(),
+            _stats_reporter(),
+        )
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -50,6 +50,8 @@ TARGET_HOST = "http://127.0.0.1:3000"
 APPLY_URL = f"{TARGET_HOST}/api/apply"
 BOARD_URL = f"{TARGET_HOST}/api/all-boards"
 CATEGORY = "WED_REGULAR"
+# --split-days: 유효 신청을 수요일/금요일 정규 운동에 번갈아 보낸다 (22:00 동시 오픈 재현 — worker consumer 분산 확인)
+CATEGORIES = ("WED_REGULAR", "FRI_REGULAR") if "--split-days" in sys.argv else (CATEGORY,)
 
 VALID_USER_COUNT = 100       # 유효 테스트 유저 수
 FAKE_TOKEN_COUNT = 20        # 비정상 토큰 수
@@ -162,7 +164,7 @@ tasks = []
 # Group A: 유효 POST x100 (운동 신청)
 for i, token in enumerate(valid_tokens):
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    tasks.append(("A", "POST", APPLY_URL, headers, {"category": CATEGORY}, f"test{i+1}"))
+    tasks.append(("A", "POST", APPLY_URL, headers, {"category": CATEGORIES[i % len(CATEGORIES)]}, f"test{i+1}"))
 
 # Group B: 유효 GET x400 (게시판 조회, 토큰 포함)
 for repeat in range(GET_REPEAT):
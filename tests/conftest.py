@@ -0,0 +1,91 @@
+# tests/conftest.py — 공용 픽스처 (임시 users.db, fakeredis)
+#
+# 실행: python -m pytest -q   (저장소 루트에서, requirements-dev.txt 설치 후 — pytest.ini가 tests/만 수집)
+# 실제 Redis·운영 DB에 닿지 않도록 각 테스트가 모듈의 Redis 클라이언트를 fakeredis로 바꿔 끼운다.
+
+import os
+import sqlite3
+import sys
+
+import fakeredis
+import jwt
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "test-secret-key-0123456789abcdef")
+
+import application_routes  # noqa: E402
+from admin.capacity import store as capacity_store  # noqa: E402
+from smash_db import connections  # noqa: E402
+from time_control import board_events, board_store, board_view, compression, rate_limiter  # noqa: E402
+from time_control.board_store import ensure_schema  # noqa: E402
+from time_control.time_handler import time_bp  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """users·applications 스키마를 갖춘 임시 DB. smash_db.connections가 이 파일을 쓰게 한다."""
+    path = str(tmp_path / "users.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE users (student_id TEXT PRIMARY KEY, name TEXT NOT NULL, password TEXT NOT NULL,"
+        " role TEXT NOT NULL, token_version INTEGER NOT NULL DEFAULT 1)"
+    )
+    conn.execute("INSERT INTO users VALUES ('u1', '홍길동', 'x', 'user', 1)")
+    ensure_schema(conn)
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(connections, "DB_PATH", path)
+    connections.reset_after_fork()  # 이전 테스트의 스레드별 연결을 버린다
+    yield path
+    connections.reset_after_fork()
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def fake_redis(redis_server):
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture
+def api(db_path, redis_server, fake_redis, monkeypatch):
+    """application_bp·time_bp를 등록한 테스트 클라이언트.
+
+    client.auth_for(user_id) = 해당 회원의 Authorization 헤더, client.auth = u1의 헤더.
+
+    프로세스 전역 캐시(스냅샷·압축 결과·rate limit)는 테스트마다 비운다 —
+    임시 DB마다 보드 버전이 1부터 다시 시작하므로 이전 테스트의 같은 버전 캐시를 재사용하면 안 된다.
+    """
+    bytes_redis = fakeredis.FakeRedis(server=redis_server)  # board:view는 bytes 그대로 읽는다
+    monkeypatch.setattr(board_view, "_redis_client", bytes_redis)
+    monkeypatch.setattr(board_view._STORE_SCRIPT, "registered_client", bytes_redis)
+    monkeypatch.setattr(board_events, "_redis_client", fake_redis)
+    monkeypatch.setattr(application_routes, "_circuit_redis", fake_redis)
+    monkeypatch.setattr(capacity_store, "_redis", fake_redis)
+    monkeypatch.setattr(board_store, "_snapshot", None)
+    monkeypatch.setattr(board_store, "_columns", None)
+    monkeypatch.setattr(compression, "_cache", type(compression._cache)())
+    monkeypatch.setattr(rate_limiter, "_requests", {})
+    monkeypatch.setattr(rate_limiter, "_ip_requests", {})
+
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = os.environ["SECRET_KEY"]
+    app.register_blueprint(application_routes.application_bp)
+    app.register_blueprint(time_bp)
+    client = app.test_client()
+    client.auth_for = _auth_header
+    client.auth = _auth_header("u1")
+    return client
+
+
+def _auth_header(user_id: str) -> dict[str, str]:
+    token = jwt.encode({"id": user_id, "name": "홍길동", "role": "user", "ver": 1},
+                       os.environ["SECRET_KEY"], algorithm="HS256")
+    return {"Authorization": f"Bearer {token}"}
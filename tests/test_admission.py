@@ -0,0 +1,165 @@
+# tests/test_admission.py — 입장 제어(_ADMIT_SCRIPT, admission_gate)의 버스트·대기 번호·대기표 검증
+
+import importlib.util
+
+import fakeredis
+import pytest
+from flask import Flask, jsonify
+
+import application_routes
+from time_control import admission
+
+BURST = 3
+
+
+@pytest.fixture
+def gate(fake_redis, monkeypatch):
+    """버스트 3, 충전이 사실상 없는 입장 제어 (데코레이터가 ENABLED를 보므로 라우트보다 먼저 켠다)."""
+    monkeypatch.setattr(admission, "ENABLED", True)
+    monkeypatch.setattr(admission, "RATE", 0.01)
+    monkeypatch.setattr(admission, "BURST", float(BURST))
+    monkeypatch.setattr(admission._ADMIT_SCRIPT, "registered_client", fake_redis)
+    return fake_redis
+
+
+@pytest.fixture
+def client(gate):
+    app = Flask(__name__)
+
+    @app.route("/board")
+    @admission.admission_gate(waiting_status=200)
+    def board():
+        return jsonify({"ok": True}), 200
+
+    @app.route("/apply", methods=["POST"])
+    @admission.admission_gate(waiting_status=503)
+    def apply():
+        return jsonify({"ok": True}), 200
+
+    return app.test_client()
+
+
+def _get(client, ticket: str | None = None):
+    return client.get("/board", headers={admission.TICKET_HEADER: ticket} if ticket else {})
+
+
+def _fill_burst(client) -> None:
+    for _ in range(BURST):
+        assert _get(client).headers[admission.STATUS_HEADER] == "admitted"
+
+
+def _serve_all(redis_client) -> None:
+    """토큰 충전으로 줄 전체가 입장 가능해진 상태를 만든다 (남는 토큰 없음)."""
+    issued = redis_client.hget(admission._STATE_KEY, "issued")
+    redis_client.hset(admission._STATE_KEY, mapping={"serving": issued, "tokens": 0})
+
+
+def test_burst_admitted_then_overflow_waits_in_order(client):
+    _fill_burst(client)
+
+    positions = []
+    for _ in range(3):
+        resp = _get(client)
+        body = resp.get_json()
+        assert resp.status_code == 200 and body["waiting"] is True
+        assert resp.headers[admission.STATUS_HEADER] == "waiting"
+        assert resp.headers["Retry-After"] == str(body["retry_after"]) == str(admission._MAX_RETRY_AFTER)
+        assert resp.headers["Cache-Control"] == "no-store"
+        assert admission._parse_ticket(resp.headers[admission.TICKET_HEADER])[0] == body["position"]
+        positions.append(body["position"])
+    assert positions == [1, 2, 3]
+
+
+def test_waiting_status_per_route(client):
+    _fill_burst(client)
+
+    board = _get(client)
+    apply = client.post("/apply")
+
+    assert board.status_code == 200 and board.get_json()["waiting"] is True
+    assert apply.status_code == 503 and apply.get_json()["waiting"] is True
+    assert "ok" not in apply.get_json()  # 핸들러는 실행되지 않는다
+
+
+def test_ticket_keeps_number_until_served(client, gate):
+    _fill_burst(client)
+    ticket = _get(client).headers[admission.TICKET_HEADER]
+    _get(client)
+
+    # 같은 대기표로 다시 오면 새 번호를 받지 않고 자기 순번을 유지한다
+    again = _get(client, ticket)
+    assert again.get_json()["position"] == 1
+    assert again.headers[admission.TICKET_HEADER] == ticket
+    assert gate.hget(admission._STATE_KEY, "issued") == "2"
+
+    _serve_all(gate)
+    assert _get(client, ticket).headers[admission.STATUS_HEADER] == "admitted"
+
+
+def test_forged_and_stale_tickets_are_discarded(client, gate):
+    _fill_burst(client)
+    ticket = _get(client).headers[admission.TICKET_HEADER]
+    number, gen = admission._parse_ticket(ticket)
+    _serve_all(gate)
+
+    forged = f"{number}.{gen}.{'0' * 32}"
+    stale = admission._make_ticket(number, "0" + gen)  # 서명은 맞지만 이전 세대 번호
+    for bad in (forged, stale, "garbage"):
+        resp = _get(client, bad)
+        assert resp.headers[admission.STATUS_HEADER] == "waiting"  # 대기표 없이 온 요청처럼 새 번호
+    assert gate.hget(admission._STATE_KEY, "issued") == "4"
+
+
+def test_used_ticket_cannot_be_reused(client, gate):
+    _fill_burst(client)
+    ticket = _get(client).headers[admission.TICKET_HEADER]
+    _serve_all(gate)
+
+    assert _get(client, ticket).headers[admission.STATUS_HEADER] == "admitted"
+    assert gate.getbit(admission._USED_KEY, 1) == 1
+
+    reused = _get(client, ticket)
+    assert reused.headers[admission.STATUS_HEADER] == "waiting"
+    assert reused.headers[admission.TICKET_HEADER] != ticket
+
+
+def test_redis_down_admits_everyone(gate, client, monkeypatch):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    monkeypatch.setattr(admission._ADMIT_SCRIPT, "registered_client", fakeredis.FakeRedis(server=server))
+
+    for _ in range(BURST * 3):
+        assert _get(client).headers[admission.STATUS_HEADER] == "admitted"
+
+
+# ── application_routes 엔드포인트별 대기 응답 ──────────────────────────────────
+
+@pytest.fixture
+def routes_client(gate):
+    """ADMISSION_ENABLED=true로 적재한 application_routes 사본 (원본 모듈은 그대로 둔다)."""
+    spec = importlib.util.spec_from_file_location("application_routes_admission", application_routes.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    app = Flask(__name__)
+    app.register_blueprint(module.application_bp)
+    return app.test_client()
+
+
+@pytest.mark.parametrize("method, path, status", [
+    ("POST", "/api/apply", 503),
+    ("GET", "/api/board-data?category=WED_REGULAR", 200),
+    ("GET", "/api/all-boards", 200),
+    ("GET", "/api/board-delta?since=0", 200),
+])
+def test_endpoint_waiting_status(gate, routes_client, method, path, status):
+    for _ in range(BURST):
+        admission._ADMIT_SCRIPT(keys=[admission._STATE_KEY, admission._USED_KEY],
+                                args=[admission.RATE, admission.BURST, 0, "", admission._STATE_TTL])
+
+    body = {"category": "WED_REGULAR"} if method == "POST" else None
+    resp = routes_client.open(path, method=method, json=body)
+
+    # 토큰 검증보다 바깥이므로 인증 헤더 없이도 대기 응답을 받는다
+    assert resp.status_code == status
+    assert resp.get_json()["waiting"] is True
+    assert resp.headers[admission.STATUS_HEADER] == "waiting"
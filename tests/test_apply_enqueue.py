@@ -0,0 +1,152 @@
+# tests/test_apply_enqueue.py — 신청 스크립트(_ENQUEUE_SCRIPT)의 cold·중복·게스트 경로와 Redis 장애 폴백
+
+import sqlite3
+import time
+
+import fakeredis
+import pytest
+from flask import Flask, request
+
+from time_control import apply as apply_mod
+from time_control import applied_set, board_rank, board_store
+from time_control.apply_receipt import PENDING_VALUE, receipt_key
+from time_control.apply_stream import SEQ_KEY, stream_key
+
+REGULAR = "WED_REGULAR"
+GUEST = "WED_GUEST"
+
+
+@pytest.fixture
+def redis_client(fake_redis, db_path, monkeypatch):
+    for script in (apply_mod._ENQUEUE_SCRIPT, applied_set._WARM_SCRIPT, board_rank._WARM_SCRIPT):
+        monkeypatch.setattr(script, "registered_client", fake_redis)
+    monkeypatch.setattr(board_store, "_after_commit", lambda: None)
+    monkeypatch.setattr(board_store, "_snapshot", None)
+    return fake_redis
+
+
+@pytest.fixture
+def script_calls(monkeypatch):
+    """_ENQUEUE_SCRIPT 호출 결과를 순서대로 기록한다."""
+    calls = []
+    script = apply_mod._ENQUEUE_SCRIPT
+
+    def recording(*args, **kwargs):
+        result = script(*args, **kwargs)
+        calls.append(result)
+        return result
+
+    monkeypatch.setattr(apply_mod, "_ENQUEUE_SCRIPT", recording)
+    return calls
+
+
+def _insert(db_path: str, category: str, user_id: str, timestamp: float) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO applications (user_id, name, category, type, guest_name, timestamp, priority)"
+        " VALUES (?, ?, ?, 'member', NULL, ?, 1)",
+        (user_id, user_id, category, timestamp),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _entry(category: str, user_id: str, receipt: str, guest_name: str | None = None) -> dict:
+    entry = {"user_id": user_id, "name": "홍길동", "type": "guest" if guest_name else "member",
+             "category": category, "timestamp": time.time(), "receipt": receipt}
+    if guest_name:
+        entry["guest_name"] = guest_name
+    return entry
+
+
+def test_cold_sets_are_warmed_then_retried(redis_client, script_calls, db_path):
+    _insert(db_path, REGULAR, "u0", time.time() - 1)
+    now = apply_mod._now_kst()
+
+    status, rank = apply_mod._enqueue(REGULAR, _entry(REGULAR, "u1", "r1"), now)
+
+    assert (status, rank) == (apply_mod._ENQUEUED, 1)
+    assert script_calls == [[apply_mod._COLD, apply_mod._COLD_APPLIED | apply_mod._COLD_RANK], [1, 1]]
+    assert redis_client.smembers(applied_set.applied_key(REGULAR, now)) == {
+        applied_set.WARM_MARKER, "u0", "u1"}
+    assert redis_client.zrange(board_rank.rank_key(REGULAR), 0, -1) == [board_rank.WARM_MARKER, "u0", "u1"]
+    assert redis_client.xlen(stream_key(REGULAR)) == 1
+    assert redis_client.get(receipt_key("r1")) == PENDING_VALUE
+
+    # 집합이 모두 적재된 뒤에는 한 번에 적재된다
+    script_calls.clear()
+    status, rank = apply_mod._enqueue(REGULAR, _entry(REGULAR, "u2", "r2"), now)
+    assert (status, rank) == (apply_mod._ENQUEUED, 2)
+    assert script_calls == [[1, 2]]
+    assert redis_client.get(SEQ_KEY) == "2"
+
+
+def test_duplicate_leaves_no_trace(redis_client, db_path):
+    _insert(db_path, REGULAR, "u0", time.time() - 1)
+    now = apply_mod._now_kst()
+    assert apply_mod._enqueue(REGULAR, _entry(REGULAR, "u1", "r1"), now)[0] == apply_mod._ENQUEUED
+
+    # SQLite에 있는 신청자, 큐에서 처리 대기 중인 신청자 모두 중복
+    for user_id, receipt in (("u0", "r2"), ("u1", "r3")):
+        assert apply_mod._enqueue(REGULAR, _entry(REGULAR, user_id, receipt), now) == (
+            apply_mod._DUPLICATE, None)
+        assert not redis_client.exists(receipt_key(receipt))
+
+    assert redis_client.get(SEQ_KEY) == "1"
+    assert redis_client.xlen(stream_key(REGULAR)) == 1
+
+
+def test_guest_category_skips_duplicate_check(redis_client):
+    now = apply_mod._now_kst()
+    user_id = "guest_u1_친구"
+
+    first = apply_mod._enqueue(GUEST, _entry(GUEST, user_id, "r1", "친구"), now)
+    second = apply_mod._enqueue(GUEST, _entry(GUEST, user_id, "r2", "친구"), now)
+
+    # 같은 게스트도 큐에 그대로 적재된다 (최종 중복은 worker의 UNIQUE 제약이 거른다)
+    assert first == second == (apply_mod._ENQUEUED, 0)
+    assert not redis_client.exists(applied_set.applied_key(GUEST, now))
+    assert redis_client.xlen(stream_key(GUEST)) == 2
+    assert redis_client.get(receipt_key("r2")) == PENDING_VALUE
+
+
+# ── Redis 장애 → SQLite 폴백 (handle_apply) ───────────────────────────────────
+
+@pytest.fixture
+def redis_down(db_path, monkeypatch):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    monkeypatch.setattr(apply_mod._ENQUEUE_SCRIPT, "registered_client",
+                        fakeredis.FakeRedis(server=server, decode_responses=True))
+    monkeypatch.setattr(apply_mod, "validate_apply_time", lambda category, now: None)
+    monkeypatch.setattr(board_store, "_after_commit", lambda: None)
+    monkeypatch.setattr(board_store, "_snapshot", None)
+
+
+def _handle_apply(category: str, body: dict | None = None) -> tuple[dict, int]:
+    with Flask(__name__).test_request_context(json=body or {}):
+        request.current_user = {"id": "u1", "name": "홍길동"}
+        return apply_mod.handle_apply(category)
+
+
+def test_redis_error_falls_back_to_sqlite(redis_down):
+    body, status = _handle_apply(REGULAR)
+
+    assert status == 200
+    assert "rank" not in body and "receipt" not in body  # 이미 반영됨 — 대기할 접수증 없음
+    assert [e["user_id"] for e in board_store.get_board(REGULAR)] == ["u1"]
+
+    body, status = _handle_apply(GUEST, {"guest_name": "친구"})
+    assert status == 200
+    assert [e["guest_name"] for e in board_store.get_board(GUEST)] == ["친구"]
+
+
+def test_redis_error_fallback_checks_sqlite_duplicates(redis_down, db_path, monkeypatch):
+    _insert(db_path, REGULAR, "u1", time.time() - 1)
+    direct = []
+    monkeypatch.setattr(board_store, "apply_entry", lambda *a: direct.append(a) or (True, None))
+
+    body, status = _handle_apply(REGULAR)
+
+    assert status == 409
+    assert direct == []  # is_already_applied에서 거절 — INSERT 시도 없음
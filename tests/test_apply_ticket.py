@@ -0,0 +1,61 @@
+# tests/test_apply_ticket.py — 신청권의 token_version 확인 (time_control/apply_ticket.py)
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask import Flask, jsonify, request
+
+from time_control import apply_ticket
+from time_control.apply_ticket import HEADER, issue, ticket_or_token
+from time_control.scheduler_logic import Status, get_next_change
+
+KST = timezone(timedelta(hours=9))
+CATEGORY = "WED_REGULAR"
+USER = {"id": "u1", "name": "홍길동", "role": "user"}
+
+
+def _before_open() -> datetime:
+    """다음 OPEN 전환 1분 전 (신청권 발급 가능 시각)."""
+    t = datetime.now(KST)
+    while True:
+        t, status = get_next_change(CATEGORY, t)
+        if status == Status.OPEN:
+            return t - timedelta(minutes=1)
+
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    now = _before_open()
+    monkeypatch.setattr(apply_ticket, "_now", lambda: now)
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = "unused-jwt-secret"
+
+    @app.route("/api/apply", methods=["POST"])
+    @ticket_or_token
+    def apply():
+        return jsonify(request.current_user), 200
+
+    client = app.test_client()
+    client.ticket = issue(USER, CATEGORY, now)[0]["ticket"]
+    return client
+
+
+def _apply(client):
+    return client.post("/api/apply", json={"category": CATEGORY}, headers={HEADER: client.ticket})
+
+
+def test_ticket_accepted_while_version_current(client):
+    response = _apply(client)
+    assert response.status_code == 200
+    assert response.json == USER
+
+
+def test_ticket_rejected_after_token_version_bump(client, db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE users SET token_version = token_version + 1 WHERE student_id = 'u1'")
+    conn.commit()
+    conn.close()
+
+    # 신청권 무효 → @token_required로 넘어가고, 토큰이 없으므로 401
+    assert _apply(client).status_code == 401
@@ -0,0 +1,139 @@
+# tests/test_board_changes.py — 변경 로그(board_changes)의 pos 재생·절단·reset 표식 (get_changes_since)
+
+import sqlite3
+
+import pytest
+
+from time_control import board_store
+
+REGULAR = "WED_REGULAR"
+GUEST = "WED_GUEST"
+
+
+@pytest.fixture
+def store(db_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(board_store, "_after_commit", lambda: None)  # Redis 뷰·알림 없이
+    monkeypatch.setattr(board_store, "_snapshot", None)  # 이전 테스트 DB의 스냅샷을 버린다
+    monkeypatch.setattr(board_store, "_BACKUP_PATH", tmp_path / "board_backup.json")
+    return db_path
+
+
+def _apply(category: str, user_id: str, timestamp: float, guest_name: str | None = None) -> None:
+    entry = {"user_id": user_id, "name": user_id, "type": "guest" if guest_name else "member",
+             "timestamp": timestamp}
+    if guest_name:
+        entry["guest_name"] = guest_name
+    ok, reason = board_store.apply_entry(category, entry)
+    assert ok, reason
+
+
+def _replay(boards: dict[str, list[dict]], changes: list[dict]) -> None:
+    """클라이언트(board-delta 구독자)와 같은 방식으로 seq 순서대로 splice한다."""
+    for change in changes:
+        if change["op"] == "reset":
+            for entries in boards.values():
+                entries.clear()
+        elif change["op"] == "insert":
+            boards.setdefault(change["category"], []).insert(change["pos"], change["entry"])
+        else:
+            assert boards[change["category"]].pop(change["pos"]) == change["entry"]
+
+
+def _public_board(category: str) -> list[dict]:
+    return [{k: v for k, v in e.items() if k != "user_id"} for e in board_store.get_board(category)]
+
+
+def _assert_replayed(boards: dict[str, list[dict]]) -> None:
+    for category in (REGULAR, GUEST):
+        assert boards.get(category, []) == _public_board(category)
+
+
+def test_insert_delete_pos_replay_matches_get_board(store):
+    boards: dict[str, list[dict]] = {}
+
+    _apply(REGULAR, "u3", 300.0)
+    _apply(REGULAR, "u1", 100.0)
+    _apply(REGULAR, "u2", 200.0)
+    _apply(GUEST, "guest_u1_1", 150.0, "친구")
+    _apply(GUEST, "guest_u2_1", 250.0, "선배(OB)")  # 늦게 왔어도 맨 앞
+    version, changes = board_store.get_changes_since(0)
+    _replay(boards, changes)
+    _assert_replayed(boards)
+    assert [e["name"] for e in boards[GUEST]] == ["guest_u2_1", "guest_u1_1"]
+
+    # 중간·맨 앞·맨 뒤 삭제와 그 사이 삽입을 이어서 재생
+    assert board_store.remove_entry(REGULAR, "u2")
+    _apply(REGULAR, "u4", 50.0)
+    assert board_store.remove_entry(REGULAR, "u3")
+    _apply(GUEST, "guest_u3_1", 10.0, "교류(교류전)")
+    assert board_store.remove_entry(GUEST, "guest_u1_1")
+    latest, changes = board_store.get_changes_since(version)
+    assert [c["seq"] for c in changes] == list(range(version + 1, latest + 1))
+    _replay(boards, changes)
+    _assert_replayed(boards)
+
+    assert board_store.get_changes_since(latest) == (latest, [])
+
+
+def test_update_is_not_logged_and_legacy_trigger_is_dropped(store):
+    conn = sqlite3.connect(store)
+    # 이전 버전이 만든 update 트리거 — 삭제 pos를 수정 후 행 기준으로 계산하던 것
+    conn.execute("""
+        CREATE TRIGGER trg_applications_log_update AFTER UPDATE ON applications
+        BEGIN INSERT INTO board_changes (op) VALUES ('insert'); END
+    """)
+    board_store.ensure_schema(conn)
+    conn.commit()
+    triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert "trg_applications_log_update" not in triggers
+    assert {"trg_applications_log_insert", "trg_applications_log_delete"} <= triggers
+    conn.close()
+
+
+def test_pruned_since_requires_resync(store, monkeypatch):
+    monkeypatch.setattr(board_store, "_CHANGE_LOG_KEEP", 10)
+    monkeypatch.setattr(board_store, "_CHANGE_LOG_PRUNE_EVERY", 8)
+    conn = sqlite3.connect(store)
+    conn.execute("DROP TRIGGER trg_board_changes_prune")
+    board_store.ensure_schema(conn)
+    conn.commit()
+    conn.close()
+
+    for i in range(24):
+        _apply(REGULAR, f"u{i:02d}", float(i))
+
+    # seq 16에서 seq <= 6, seq 24에서 seq <= 14가 잘렸다
+    latest, changes = board_store.get_changes_since(0)
+    assert latest == 24 and changes is None
+    assert board_store.get_changes_since(13) == (24, None)
+
+    latest, changes = board_store.get_changes_since(14)
+    assert [c["seq"] for c in changes] == list(range(15, 25))
+
+    # 보관 구간 안이라도 limit를 넘으면 재동기화
+    assert board_store.get_changes_since(14, limit=5) == (24, None)
+    # 클라이언트가 서버보다 앞선 버전(서버 DB 교체 등)
+    assert board_store.get_changes_since(25) == (24, None)
+
+
+def test_reset_marker_replays_as_board_clear(store):
+    boards: dict[str, list[dict]] = {}
+    _apply(REGULAR, "u1", 100.0)
+    _apply(GUEST, "guest_u1_1", 100.0, "친구")
+    _apply(REGULAR, "u2", 200.0)
+    before_reset, changes = board_store.get_changes_since(0)
+    _replay(boards, changes)
+
+    board_store.reset_all()
+    _apply(REGULAR, "u3", 300.0)
+
+    # 로그가 reset 표식으로 시작하므로 잘린 since여도 재동기화 대신 표식부터 내려준다
+    for since in (0, before_reset - 1, before_reset):
+        latest, changes = board_store.get_changes_since(since)
+        assert [c["op"] for c in changes] == ["reset", "insert"]
+        assert set(changes[0]) == {"seq", "op"}
+
+    _replay(boards, changes)
+    _assert_replayed(boards)
+    assert boards[GUEST] == [] and [e["name"] for e in boards[REGULAR]] == ["u3"]
+    assert board_store.get_changes_since(latest) == (latest, [])
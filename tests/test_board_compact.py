@@ -0,0 +1,147 @@
+# tests/test_board_compact.py — /api/all-boards compact 형식 (board_compact, board_store.get_columns_snapshot)
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask import Flask, request
+
+from time_control import board_store
+from time_control.board_compact import COMPACT_MEDIA_TYPE, FIELDS, parse_fields, wants_compact
+from time_control.scheduler_logic import get_week_start_ts
+
+# 이번 주 신청 (user_already_applied 판정 대상)
+T0 = get_week_start_ts(datetime.now(timezone(timedelta(hours=9)))) + 60
+ENTRIES = [
+    ("WED_REGULAR", {"user_id": "u1", "name": "홍길동", "type": "member", "timestamp": T0 + 0.5}),
+    ("WED_REGULAR", {"user_id": "m1", "name": "김철수", "type": "member", "timestamp": T0 + 0.0371}),
+    ("WED_GUEST", {"user_id": "guest_u1_a", "name": "홍길동", "type": "guest",
+                   "guest_name": "친구", "timestamp": T0 + 10.25}),
+    ("WED_GUEST", {"user_id": "guest_m1_b", "name": "김철수", "type": "guest",
+                   "guest_name": "선배(OB)", "timestamp": T0 + 20.999}),
+]
+
+
+@pytest.fixture
+def boards(db_path, monkeypatch):
+    monkeypatch.setattr(board_store, "_after_commit", lambda: None)
+    monkeypatch.setattr(board_store, "_columns", None)
+    for category, entry in ENTRIES:
+        ok, reason = board_store.apply_entry(category, entry)
+        assert ok, reason
+
+
+@pytest.mark.parametrize("query, accept, expected", [
+    ("", None, False),
+    ("", "application/json", False),
+    ("", COMPACT_MEDIA_TYPE, True),
+    ("", f"application/json;q=0.5, {COMPACT_MEDIA_TYPE}", True),
+    ("", f"application/json, {COMPACT_MEDIA_TYPE};q=0.5", False),
+    ("", "*/*", False),
+    ("?format=compact", None, True),
+    ("?format=json", COMPACT_MEDIA_TYPE, False),  # ?format=이 Accept보다 우선
+])
+def test_wants_compact(query, accept, expected):
+    headers = {"Accept": accept} if accept else {}
+    with Flask(__name__).test_request_context(f"/api/all-boards{query}", headers=headers):
+        assert wants_compact(request) is expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (None, FIELDS),
+    ("", FIELDS),
+    ("type,name", ("name", "type")),  # FIELDS 순서로 정규화
+    (" timestamp , name ,", ("name", "timestamp")),
+    ("name,name", ("name",)),
+    ("name,user_id", None),
+    ("bogus", None),
+    (",", None),
+])
+def test_parse_fields(raw, expected):
+    assert parse_fields(raw) == expected
+
+
+def test_unknown_field_is_400(api):
+    resp = api.get("/api/all-boards?format=compact&fields=name,user_id", headers=api.auth)
+    assert resp.status_code == 400
+
+
+def test_columns_snapshot_base_and_offsets(boards):
+    version, base_ms, columns = board_store.get_columns_snapshot()
+
+    assert base_ms == math.floor(min(e["timestamp"] for _, e in ENTRIES) * 1000)
+    for category in ("WED_REGULAR", "WED_GUEST"):
+        expected = board_store.get_board(category)
+        col = columns[category]
+        assert col["name"] == [e["name"] for e in expected]
+        assert col["guest_name"] == [e.get("guest_name") for e in expected]
+        assert [board_store.BOARD_TYPES[t] for t in col["type"]] == [e["type"] for e in expected]
+        assert [base_ms + off for off in col["timestamp"]] == [
+            math.floor(e["timestamp"] * 1000) for e in expected]
+    assert columns["FRI_REGULAR"] == {"name": [], "guest_name": [], "type": [], "timestamp": []}
+
+    # 같은 버전이면 캐시된 객체, 쓰기 후에는 새로 만든다
+    assert board_store.get_columns_snapshot()[2] is columns
+    board_store.remove_entry("WED_REGULAR", "m1")
+    assert board_store.get_columns_snapshot()[0] > version
+
+
+def test_columns_snapshot_of_empty_board(db_path, monkeypatch):
+    monkeypatch.setattr(board_store, "_columns", None)
+    _, base_ms, columns = board_store.get_columns_snapshot()
+    assert base_ms == 0
+    assert all(col["name"] == [] for col in columns.values())
+
+
+def _expand(body: dict) -> dict:
+    """compact 응답을 기본 형식(카테고리별 항목 dict 목록)으로 되돌린다 — 클라이언트 디코더와 같은 규칙."""
+    result = {}
+    for category, board in body["boards"].items():
+        entries = []
+        guest_names = board.get("guest_name")
+        for i in range(len(board[body["fields"][0]])):
+            entry = {}
+            if "name" in board:
+                entry["name"] = board["name"][i]
+            if "type" in board:
+                entry["type"] = body["types"][board["type"][i]]
+            if "timestamp" in board:
+                entry["timestamp"] = (body["base"] + board["timestamp"][i]) / 1000
+            if guest_names and guest_names[i] is not None:
+                entry["guest_name"] = guest_names[i]
+            entries.append(entry)
+        result[category] = {"status": board["status"],
+                            "user_already_applied": board["user_already_applied"],
+                            "applications": entries}
+    return result
+
+
+def _ms(board: dict, to_int) -> dict:
+    """timestamp를 ms 정수로 바꾼다 (compact 형식은 ms 내림 정밀도)."""
+    return {**board, "applications": [
+        {**e, "timestamp": to_int(e["timestamp"] * 1000)} for e in board["applications"]]}
+
+
+def test_compact_round_trip_matches_default_format(boards, api):
+    default = api.get("/api/all-boards", headers=api.auth)
+    compact = api.get("/api/all-boards?format=compact", headers=api.auth)
+
+    assert compact.mimetype == COMPACT_MEDIA_TYPE
+    assert compact.headers["X-Board-Seq"] == default.headers["X-Board-Seq"]
+    assert "Accept" in compact.headers["Vary"]
+    expanded = _expand(compact.get_json())
+    expected = default.get_json()
+    assert expanded.keys() == expected.keys()
+    for category in expected:
+        # 되돌린 값 = (base + 오프셋) / 1000 이므로 반올림하면 원래 ms 값
+        assert _ms(expanded[category], round) == _ms(expected[category], math.floor), category
+    assert expanded["WED_REGULAR"]["user_already_applied"] is True
+
+
+def test_field_subset(boards, api):
+    body = api.get("/api/all-boards?format=compact&fields=type,name", headers=api.auth).get_json()
+
+    assert body["fields"] == ["name", "type"]
+    guest = body["boards"]["WED_GUEST"]
+    assert set(guest) == {"status", "user_already_applied", "name", "type"}
+    assert guest["name"] == ["김철수", "홍길동"]  # OB 게스트가 앞
@@ -0,0 +1,143 @@
+# tests/test_board_rank.py — 잠정 순번 재동기화(worker._reconcile_ranks)와 consumer 커밋의 경합
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import worker
+from time_control import apply as apply_mod
+from time_control import applied_set, board_rank, board_store
+from time_control.apply_stream import DATA_FIELD, stream_key
+
+CATEGORY = "WED_REGULAR"
+
+
+def _insert(conn: sqlite3.Connection, user_id: str, timestamp: float) -> None:
+    conn.execute(
+        "INSERT INTO applications (user_id, name, category, type, guest_name, timestamp, priority)"
+        " VALUES (?, ?, ?, 'member', NULL, ?, 0)",
+        (user_id, user_id, CATEGORY, timestamp),
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def main_conn(fake_redis, db_path, monkeypatch):
+    monkeypatch.setattr(worker, "_redis_client", fake_redis)
+    monkeypatch.setattr(board_rank._RECONCILE_SCRIPT, "registered_client", fake_redis)
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def _members(client) -> list[str]:
+    return client.zrange(board_rank.rank_key(CATEGORY), 0, -1)
+
+
+def test_reconcile_keeps_applicant_committed_during_read(main_conn, fake_redis, db_path, monkeypatch):
+    _insert(main_conn, "u1", time.time())
+    key = stream_key(CATEGORY)
+    consumer_done = threading.Event()
+
+    def consumer_commit(msg_id: str) -> None:
+        # worker consumer와 같은 순서: _write_lock 안에서 커밋 → 락 밖에서 XACK + XDEL
+        with worker._write_lock:
+            conn = sqlite3.connect(db_path)
+            _insert(conn, "u2", time.time())
+            conn.close()
+        fake_redis.xdel(key, msg_id)
+        consumer_done.set()
+
+    real_load = worker.load_rank_rows
+
+    def load_then_race(conn):
+        rows = real_load(conn)
+        # SQLite를 읽은 직후 새 신청이 적재되고(잠정 순번 ZADD 포함) consumer가 처리를 시작한다
+        msg_id = fake_redis.xadd(key, {DATA_FIELD: '{"user_id": "u2"}'})
+        fake_redis.zadd(board_rank.rank_key(CATEGORY), {"u2": board_rank.score(0, time.time())})
+        threading.Thread(target=consumer_commit, args=(msg_id,), daemon=True).start()
+        consumer_done.wait(0.5)  # 락이 없으면 여기서 커밋·XDEL까지 끝난다
+        return rows
+
+    monkeypatch.setattr(worker, "load_rank_rows", load_then_race)
+    assert worker._reconcile_ranks(main_conn, None) is None  # 대기 항목이 보여 건너뛴다
+    assert consumer_done.wait(2)
+    assert "u2" in _members(fake_redis)
+
+    # 스트림이 비면 다음 점검에서 SQLite 기준으로 교체된다
+    monkeypatch.setattr(worker, "load_rank_rows", real_load)
+    version = worker._reconcile_ranks(main_conn, None)
+    assert version == worker._board_version(main_conn)
+    assert _members(fake_redis) == [board_rank.WARM_MARKER, "u1", "u2"]
+
+
+# ── 잠정 순번 = 커밋 후 게시판 위치 ───────────────────────────────────────────
+
+GUEST = "WED_GUEST"
+
+
+@pytest.fixture
+def pipeline(fake_redis, db_path, monkeypatch):
+    """신청 스크립트(_ENQUEUE_SCRIPT) → worker consumer 커밋을 같은 fakeredis·임시 DB로 잇는다."""
+    for script in (apply_mod._ENQUEUE_SCRIPT, applied_set._WARM_SCRIPT, board_rank._WARM_SCRIPT):
+        monkeypatch.setattr(script, "registered_client", fake_redis)
+    monkeypatch.setattr(board_store, "_snapshot", None)
+    monkeypatch.setattr(worker, "_redis_client", fake_redis)
+    monkeypatch.setattr(worker, "_DB_PATH", db_path)
+    monkeypatch.setattr(worker, "refresh_board_view", lambda *a, **k: None)
+    monkeypatch.setattr(worker, "publish_board_changed", lambda *a, **k: None)
+    consumer = worker._Consumer(0, [CATEGORY, GUEST])
+    consumer.ensure_groups()
+    consumer.conn = sqlite3.connect(db_path)
+    now = apply_mod._now_kst()
+
+    def apply(category: str, user_id: str, timestamp: float, guest_name: str | None = None) -> int:
+        entry = {"user_id": user_id, "name": user_id, "type": "guest" if guest_name else "member",
+                 "category": category, "timestamp": timestamp, "receipt": f"r-{user_id}"}
+        if guest_name:
+            entry["guest_name"] = guest_name
+        status, rank = apply_mod._enqueue(category, entry, now)
+        assert status == apply_mod._ENQUEUED
+        consumer.process(*consumer.read(">", 10))
+        return rank
+
+    yield apply
+    consumer.conn.close()
+
+
+def _board_position(category: str, user_id: str) -> int:
+    return [e["user_id"] for e in board_store.get_board(category)].index(user_id)
+
+
+@pytest.mark.parametrize("category, applicants", [
+    (CATEGORY, [("u3", 300.0, None), ("u1", 100.0, None), ("u4", 400.0, None), ("u2", 200.0, None)]),
+    (GUEST, [("g1", 100.0, "친구"), ("g2", 200.0, "선배(OB)"), ("g3", 50.0, "후배"),
+             ("g4", 300.0, "교류(교류전)"), ("g5", 250.0, "동기(ob)")]),
+])
+def test_provisional_rank_matches_committed_board_position(pipeline, category, applicants):
+    for user_id, timestamp, guest_name in applicants:
+        rank = pipeline(category, user_id, timestamp, guest_name)
+        assert rank == _board_position(category, user_id)
+
+
+def test_warm_rank_matches_board_position(main_conn, fake_redis, monkeypatch):
+    monkeypatch.setattr(board_rank._WARM_SCRIPT, "registered_client", fake_redis)
+    monkeypatch.setattr(board_store, "_snapshot", None)
+    rows = [("g1", 100.0, "친구"), ("g2", 200.0, "선배(OB)"), ("g3", 50.0, "후배"), ("g4", 150.0, "(교류전)")]
+    for user_id, timestamp, guest_name in rows:
+        main_conn.execute(
+            "INSERT INTO applications (user_id, name, category, type, guest_name, timestamp, priority)"
+            " VALUES (?, ?, ?, 'guest', ?, ?, ?)",
+            (user_id, user_id, GUEST, guest_name, timestamp,
+             board_store.compute_priority(GUEST, guest_name)),
+        )
+    main_conn.commit()
+
+    board_rank.warm(GUEST)
+
+    key = board_rank.rank_key(GUEST)
+    board = [e["user_id"] for e in board_store.get_board(GUEST)]
+    assert board == ["g4", "g2", "g3", "g1"]
+    assert [fake_redis.zrank(key, user_id) - 1 for user_id in board] == list(range(len(board)))
@@ -0,0 +1,41 @@
+# tests/test_board_view.py — Redis 공개 뷰 경로와 SQLite 폴백의 응답 일치 (board_view, application_routes)
+
+import time
+
+import pytest
+
+import application_routes
+from time_control import board_store
+
+ENTRIES = [
+    ("WED_REGULAR", {"user_id": "u1", "name": "홍길동", "type": "member"}),
+    ("WED_REGULAR", {"user_id": "m1", "name": 'Kim "KS"', "type": "member"}),
+    ("WED_GUEST", {"user_id": "guest_u1_a", "name": "홍길동", "type": "guest", "guest_name": "친구&amp;동생"}),
+    ("WED_GUEST", {"user_id": "guest_u1_b", "name": "홍길동", "type": "guest", "guest_name": "선배(OB)"}),
+    ("WED_LESSON", {"user_id": "u1", "name": "홍길동", "type": "member"}),
+]
+
+
+def _both_paths(api, path: str, monkeypatch):
+    """같은 보드 버전에서 뷰 경로와 SQLite 폴백 응답을 차례로 받는다."""
+    via_view = api.get(path, headers=api.auth)
+    with monkeypatch.context() as m:
+        m.setattr(application_routes, "get_board_view", lambda categories=None: None)
+        via_sqlite = api.get(path, headers=api.auth)
+    return via_view, via_sqlite
+
+
+@pytest.mark.parametrize("path", ["/api/board-data?category=WED_GUEST", "/api/all-boards"])
+def test_view_and_sqlite_fallback_bodies_are_identical(api, path, monkeypatch):
+    for category, entry in ENTRIES:
+        ok, reason = board_store.apply_entry(category, {**entry, "timestamp": time.time()})
+        assert ok, reason
+    assert application_routes.get_board_view() is not None  # 커밋 후 뷰가 렌더링되었다
+
+    via_view, via_sqlite = _both_paths(api, path, monkeypatch)
+
+    assert via_view.status_code == via_sqlite.status_code == 200
+    assert via_view.headers["X-Board-Seq"] == via_sqlite.headers["X-Board-Seq"]
+    assert via_view.get_data() == via_sqlite.get_data()
+    assert via_view.headers["ETag"] == via_sqlite.headers["ETag"]
+    assert b"user_id" not in via_view.get_data()
@@ -0,0 +1,88 @@
+# tests/test_category_states.py — /api/category-states 사전 렌더링 본문 (time_handler._states_tail)
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from time_control import time_handler
+from time_control.scheduler_logic import Category, Status, get_current_status, get_next_change
+
+KST = timezone(timedelta(hours=9))
+OPEN_AT = datetime(2026, 10, 10, 22, 0, tzinfo=KST)  # 토 22:00 — 수/금 운동 OPEN 전환
+
+
+def _full_render(now: datetime) -> dict:
+    """캐시 없이 요청 시각 그대로 만든 응답 (사전 렌더링 도입 전 형태)."""
+    result: dict = {"serverTime": int(now.timestamp() * 1000), "수": {}, "금": {}}
+    for category, day, board in time_handler._CATEGORY_MAP:
+        status = get_current_status(category, now)
+        next_time, next_status = get_next_change(category, now)
+        result[day][board] = {
+            "status":            time_handler._STATUS_MAP[status][0],
+            "statusText":        time_handler._STATUS_MAP[status][1],
+            "deadlineTimestamp": int(next_time.timestamp() * 1000),
+            "nextStatus":        time_handler._STATUS_MAP[next_status][0],
+        }
+    return result
+
+
+@pytest.fixture
+def states(api, monkeypatch):
+    """시각을 고정할 수 있는 /api/category-states 호출기. renders = 실제 렌더링 횟수."""
+    clock = {"now": OPEN_AT}
+    monkeypatch.setattr(time_handler, "_now_kst", lambda: clock["now"])
+    monkeypatch.setattr(time_handler, "_states_body", None)
+    real_render = time_handler._render_states
+    renders = []
+    monkeypatch.setattr(time_handler, "_render_states", lambda now: renders.append(now) or real_render(now))
+
+    def get(now: datetime) -> dict:
+        clock["now"] = now
+        resp = api.get("/api/category-states", headers=api.auth)
+        assert resp.status_code == 200
+        return json.loads(resp.get_data())  # 이어 붙인 본문이 올바른 JSON이어야 한다
+
+    get.renders = renders
+    return get
+
+
+def test_spliced_body_equals_full_render(states):
+    for now in (OPEN_AT - timedelta(hours=3), OPEN_AT - timedelta(seconds=1), OPEN_AT,
+                OPEN_AT + timedelta(minutes=5), OPEN_AT + timedelta(days=4, hours=20)):
+        assert states(now) == _full_render(now)
+
+
+def test_rerenders_at_valid_until(states):
+    before = states(OPEN_AT - timedelta(minutes=10))
+    assert before["수"]["운동"]["status"] == "before-open"
+    assert before["수"]["운동"]["deadlineTimestamp"] == int(OPEN_AT.timestamp() * 1000)
+
+    # 구간 안: serverTime만 바뀌고 다시 렌더링하지 않는다
+    just_before = states(OPEN_AT - timedelta(microseconds=1))
+    assert len(states.renders) == 1
+    assert just_before["serverTime"] > before["serverTime"]
+    assert {k: v for k, v in just_before.items() if k != "serverTime"} == {
+        k: v for k, v in before.items() if k != "serverTime"}
+
+    # valid_until(전환 시각)과 같은 첫 요청이 다시 렌더링한다
+    opened = states(OPEN_AT)
+    assert len(states.renders) == 2
+    assert opened["수"]["운동"]["status"] == "open"
+    assert opened["금"]["운동"]["status"] == "open"
+    assert opened["수"]["게스트"]["status"] == "before-open"  # 22:01 오픈
+    assert opened == _full_render(OPEN_AT)
+
+    # 다음 전환(22:01) 직후에도 한 번만
+    states(OPEN_AT + timedelta(minutes=1))
+    states(OPEN_AT + timedelta(minutes=2))
+    assert len(states.renders) == 3
+
+
+def test_earlier_time_than_cached_range_rerenders(states):
+    states(OPEN_AT)
+    earlier = OPEN_AT - timedelta(seconds=1)
+
+    assert states(earlier) == _full_render(earlier)
+    assert len(states.renders) == 2
+    assert get_current_status(Category.WED_REGULAR, earlier) == Status.BEFORE_OPEN
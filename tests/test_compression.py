@@ -0,0 +1,104 @@
+# tests/test_compression.py — 응답 압축 협상·임계값·(ETag, 인코딩) 캐시 (time_control/compression.py)
+
+import gzip
+
+import pytest
+from flask import Flask, Response, request
+
+from time_control import compression
+
+BODY = b'{"applications":[' + b",".join(b'{"name":"n%03d"}' % i for i in range(60)) + b"]}"
+
+needs_brotli = pytest.mark.skipif(compression.brotli is None, reason="brotli 미설치 (선택 의존성)")
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(compression, "_cache", type(compression._cache)())
+    return compression._cache
+
+
+def _compress(body: bytes, accept: str | None, etag: str | None = "e1", status: int = 200) -> Response:
+    headers = {"Accept-Encoding": accept} if accept is not None else {}
+    with Flask(__name__).test_request_context(headers=headers):
+        resp = Response(body, status=status, mimetype="application/json")
+        if etag is not None:
+            resp.set_etag(etag)
+        return compression.compress_response(request, resp, etag)
+
+
+@pytest.mark.parametrize("accept, expected", [
+    pytest.param("gzip, deflate, br", "br", marks=needs_brotli),
+    ("gzip", "gzip"),
+    ("br;q=0.5, gzip", "gzip"),
+    pytest.param("gzip;q=0, br;q=0.1", "br", marks=needs_brotli),
+    ("identity", None),
+    ("deflate", None),
+    (None, None),
+])
+def test_negotiation(cache, accept, expected):
+    resp = _compress(BODY, accept)
+
+    assert resp.headers.get("Content-Encoding") == expected
+    if expected == "br":
+        assert compression.brotli.decompress(resp.get_data()) == BODY
+    elif expected == "gzip":
+        assert gzip.decompress(resp.get_data()) == BODY
+    else:
+        assert resp.get_data() == BODY
+    assert resp.headers["ETag"] == (f'"e1-{expected}"' if expected else '"e1"')
+    assert "Accept-Encoding" in resp.headers["Vary"]
+
+
+def test_threshold(cache, monkeypatch):
+    monkeypatch.setattr(compression, "_MIN_BYTES", 512)
+    small = b"x" * 511
+
+    assert "Content-Encoding" not in _compress(small, "gzip").headers
+    assert _compress(small + b"x", "gzip").headers["Content-Encoding"] == "gzip"
+    # 압축하지 않은 응답도 인코딩별로 다를 수 있음을 캐시에 알린다
+    assert "Accept-Encoding" in _compress(small, "gzip").headers["Vary"]
+
+
+def test_non_200_is_not_compressed(cache):
+    resp = _compress(BODY, "gzip", status=404)
+
+    assert "Content-Encoding" not in resp.headers
+    assert "Accept-Encoding" in resp.headers["Vary"]
+
+
+def test_cache_reuses_by_etag_and_encoding(cache, monkeypatch):
+    calls = []
+    real = compression._compress
+    monkeypatch.setattr(compression, "_compress", lambda body, enc: calls.append(enc) or real(body, enc))
+
+    first = _compress(BODY, "gzip", etag="v1").get_data()
+    # 같은 ETag = 같은 본문이므로 다시 압축하지 않는다 (본문이 달라도 캐시를 믿는다)
+    assert _compress(b"ignored" * 100, "gzip", etag="v1").get_data() == first
+    _compress(BODY, "gzip", etag="v2")
+    assert calls == ["gzip", "gzip"]
+    assert set(cache) == {("v1", "gzip"), ("v2", "gzip")}
+
+    # ETag 없는 응답(매번 본문이 다른 응답)은 캐시하지 않는다
+    _compress(BODY, "gzip", etag=None)
+    assert len(calls) == 3 and len(cache) == 2
+
+
+@needs_brotli
+def test_cache_keeps_encodings_apart(cache):
+    gz = _compress(BODY, "gzip", etag="v1")
+    br = _compress(BODY, "br", etag="v1")
+
+    assert gzip.decompress(gz.get_data()) == compression.brotli.decompress(br.get_data()) == BODY
+    assert set(cache) == {("v1", "gzip"), ("v1", "br")}
+
+
+def test_cache_evicts_least_recently_used(cache, monkeypatch):
+    monkeypatch.setattr(compression, "_CACHE_SIZE", 2)
+
+    _compress(BODY, "gzip", etag="a")
+    _compress(BODY, "gzip", etag="b")
+    _compress(BODY, "gzip", etag="a")  # a를 최근 사용으로
+    _compress(BODY, "gzip", etag="c")
+
+    assert list(cache) == [("a", "gzip"), ("c", "gzip")]
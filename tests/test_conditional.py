@@ -0,0 +1,149 @@
+# tests/test_conditional.py — ETag / If-None-Match 304 (/api/board-data, /api/all-boards, /api/capacities)
+
+import sqlite3
+import time
+
+import pytest
+
+import application_routes
+from time_control import board_store
+from time_control.scheduler_logic import Status
+
+CATEGORY = "WED_REGULAR"
+
+
+def _apply(user_id: str, category: str = CATEGORY, name: str = "홍길동") -> None:
+    ok, reason = board_store.apply_entry(
+        category, {"user_id": user_id, "name": name, "type": "member", "timestamp": time.time()})
+    assert ok, reason
+
+
+def _fill(count: int) -> None:
+    """압축 임계값(512 bytes)을 넘기는 보드."""
+    for i in range(count):
+        _apply(f"m{i:03d}", name=f"회원{i:03d}")
+
+
+def _get(api, path: str, etag: str | None = None, encoding: str | None = None, user: str = "u1"):
+    headers = dict(api.auth_for(user))
+    if etag is not None:
+        headers["If-None-Match"] = f'"{etag}"'
+    if encoding is not None:
+        headers["Accept-Encoding"] = encoding
+    return api.get(path, headers=headers)
+
+
+@pytest.fixture(params=["view", "sqlite"])
+def board_api(request, api, redis_server, monkeypatch):
+    """Redis 공개 뷰 경로와 SQLite 폴백 경로 모두에서 검사한다."""
+    if request.param == "sqlite":
+        monkeypatch.setattr(application_routes, "get_board_view", lambda categories=None: None)
+    return api
+
+
+BOARD_PATHS = [f"/api/board-data?category={CATEGORY}", "/api/all-boards"]
+
+
+@pytest.mark.parametrize("path", BOARD_PATHS)
+def test_matching_etag_returns_empty_304(board_api, path):
+    _apply("u1")
+    first = _get(board_api, path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"].strip('"')
+
+    resp = _get(board_api, path, etag)
+
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == f'"{etag}"'
+    assert resp.headers["X-Board-Seq"] == first.headers["X-Board-Seq"]
+    assert resp.headers["Cache-Control"] == "private, no-cache"
+
+
+@pytest.mark.parametrize("path", BOARD_PATHS)
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_encoded_etag_still_matches(board_api, path, encoding):
+    _fill(20)
+    first = _get(board_api, path, encoding=encoding)
+    assert first.headers["Content-Encoding"] == encoding
+    encoded = first.headers["ETag"].strip('"')
+    assert encoded.endswith(f"-{encoding}")
+
+    # 압축 표현의 ETag를 그대로 보내도, 다른 인코딩으로 재검증해도 304
+    for accept in (encoding, "identity"):
+        resp = _get(board_api, path, encoded, encoding=accept)
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == f'"{encoded}"'
+
+    plain = encoded[: -len(encoding) - 1]
+    assert _get(board_api, path, plain, encoding=encoding).status_code == 304
+
+
+@pytest.mark.parametrize("path", BOARD_PATHS)
+def test_board_version_change_changes_etag(board_api, path):
+    _apply("u1")
+    etag = _get(board_api, path).headers["ETag"].strip('"')
+
+    _apply("m001")
+    resp = _get(board_api, path, etag)
+
+    assert resp.status_code == 200
+    assert resp.headers["ETag"].strip('"') != etag
+    assert "m001" not in resp.get_data(as_text=True)  # user_id는 공개되지 않는다
+
+
+@pytest.mark.parametrize("path", BOARD_PATHS)
+def test_status_change_changes_etag(board_api, path, monkeypatch):
+    etag = _get(board_api, path).headers["ETag"].strip('"')
+    status = application_routes.get_current_status(CATEGORY, application_routes._now_kst())
+    other = Status.CLOSED if status != Status.CLOSED else Status.OPEN
+    monkeypatch.setattr(application_routes, "get_current_status", lambda category, now: other)
+
+    resp = _get(board_api, path, etag)
+
+    assert resp.status_code == 200
+    assert resp.headers["ETag"].strip('"') != etag
+
+
+def test_applied_categories_change_all_boards_etag(board_api, db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO users VALUES ('u2', '김철수', 'x', 'user', 1)")
+    conn.commit()
+    conn.close()
+    _apply("u1")
+
+    mine = _get(board_api, "/api/all-boards")
+    theirs = _get(board_api, "/api/all-boards", user="u2")
+
+    # 같은 보드 버전·상태라도 본인 신청 여부가 다르면 다른 ETag — 다른 사람의 304를 받지 않는다
+    assert mine.headers["X-Board-Seq"] == theirs.headers["X-Board-Seq"]
+    assert mine.headers["ETag"] != theirs.headers["ETag"]
+    assert mine.get_json()[CATEGORY]["user_already_applied"] is True
+    assert theirs.get_json()[CATEGORY]["user_already_applied"] is False
+    etag = mine.headers["ETag"].strip('"')
+    assert _get(board_api, "/api/all-boards", etag, user="u2").status_code == 200
+
+
+# ── /api/capacities ───────────────────────────────────────────────────────────
+
+def test_capacities_etag(api, fake_redis):
+    fake_redis.set("capacity:wed", 40)
+    first = api.get("/api/capacities", headers=api.auth)
+    assert first.status_code == 200
+    assert first.get_json()["수"]["total"] == 40
+    etag = first.headers["ETag"].strip('"')
+
+    resp = api.get("/api/capacities", headers={**api.auth, "If-None-Match": f'"{etag}"'})
+    assert resp.status_code == 304 and resp.data == b""
+
+    # 정원이 바뀌면 새 ETag
+    fake_redis.set("capacity:wed", 41)
+    resp = api.get("/api/capacities", headers={**api.auth, "If-None-Match": f'"{etag}"'})
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"].strip('"')
+
+    # 보드가 바뀌면(특수 게스트 인원이 바뀔 수 있으므로) 새 ETag
+    _apply("g1", category="WED_GUEST")
+    resp = api.get("/api/capacities", headers={**api.auth, "If-None-Match": f'"{etag}"'})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"].strip('"') != etag
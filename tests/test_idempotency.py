@@ -0,0 +1,70 @@
+# tests/test_idempotency.py — Idempotency-Key 재시도 (time_control/idempotency.py)
+
+import pytest
+from flask import Flask, jsonify
+
+from time_control import idempotency
+from time_control.idempotency import HEADER, idempotent
+
+
+@pytest.fixture
+def app(fake_redis, monkeypatch):
+    monkeypatch.setattr(idempotency, "_redis_client", fake_redis)
+    app = Flask(__name__)
+    app.config["PROPAGATE_EXCEPTIONS"] = False  # 핸들러 예외 → 500 (운영과 같은 동작)
+    calls = []
+
+    @app.route("/api/apply", methods=["POST"])
+    @idempotent
+    def apply():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("첫 실행 실패")
+        return jsonify({"message": "신청이 접수되었습니다.", "attempt": len(calls)}), 200
+
+    app.calls = calls
+    return app
+
+
+def _post(client, key="k-1"):
+    return client.post("/api/apply", json={"category": "WED_REGULAR"},
+                       headers={HEADER: key, "Authorization": "Bearer t"})
+
+
+def test_retry_after_view_exception_runs_again(app, fake_redis):
+    client = app.test_client()
+
+    assert _post(client).status_code == 500
+    assert fake_redis.keys(idempotency._KEY_PREFIX + "*") == []  # 처리 중 표시가 남지 않는다
+
+    retry = _post(client)
+    assert retry.status_code == 200
+    assert retry.json["attempt"] == 2
+    assert "Idempotent-Replayed" not in retry.headers
+
+    replay = _post(client)
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.json["attempt"] == 2
+    assert len(app.calls) == 2
+
+
+def test_stale_pending_marker_is_retried_in_a_loop(app, fake_redis, monkeypatch):
+    # 먼저 온 요청이 저장하지 않는 응답으로 끝나 표시가 사라진 경우 — 재귀 없이 다시 예약한다
+    waits = iter([None, None])
+    monkeypatch.setattr(idempotency, "_wait_done", lambda key: next(waits))
+    real_set = fake_redis.set
+    attempts = []
+
+    def set_nx_fails_twice(*args, **kwargs):
+        if kwargs.get("nx"):
+            attempts.append(1)
+            if len(attempts) <= 2:
+                return None
+        return real_set(*args, **kwargs)
+
+    monkeypatch.setattr(fake_redis, "set", set_nx_fails_twice)
+    app.calls.append(1)  # 첫 실행 실패 분기를 건너뛴다
+
+    response = _post(app.test_client(), key="k-2")
+    assert response.status_code == 200
+    assert len(attempts) == 3
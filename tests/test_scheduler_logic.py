@@ -0,0 +1,91 @@
+# tests/test_scheduler_logic.py — 주간 전환 색인(_WeekIndex)과 기존 _get_transitions 선형 탐색의 결과 일치
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from time_control.scheduler_logic import (
+    Category,
+    Status,
+    _get_transitions,
+    _get_week_start,
+    get_current_status,
+    get_next_change,
+    get_week_id,
+    get_week_start_ts,
+)
+
+KST = timezone(timedelta(hours=9))
+EPS = timedelta(microseconds=1)
+CATEGORIES = [cat.value for cat in Category] + ["UNKNOWN"]
+
+# 기준 주: 토 2026-10-10 00:00 KST (월·연 경계를 포함하도록 앞뒤 주도 함께 본다)
+WEEK = datetime(2026, 10, 10, tzinfo=KST)
+WEEKS = [WEEK + timedelta(days=7 * i) for i in (-1, 0, 1)] + [datetime(2026, 12, 26, tzinfo=KST)]
+
+
+# ── 기존 구현 (색인 도입 전) ─────────────────────────────────────────────────
+
+def legacy_current_status(category: str, now: datetime) -> str:
+    current_status = Status.CLOSED
+    for transition_time, status in _get_transitions(category, _get_week_start(now)):
+        if now >= transition_time:
+            current_status = status
+        else:
+            break
+    return current_status
+
+
+def legacy_next_change(category: str, now: datetime) -> tuple[datetime, str]:
+    week_start = _get_week_start(now)
+    for transition_time, status in _get_transitions(category, week_start):
+        if now < transition_time:
+            return transition_time, status
+    return week_start + timedelta(days=7), Status.BEFORE_OPEN
+
+
+def _assert_same(now: datetime) -> None:
+    for cat in CATEGORIES:
+        assert get_current_status(cat, now) == legacy_current_status(cat, now), (cat, now)
+        assert get_next_change(cat, now) == legacy_next_change(cat, now), (cat, now)
+    week_start = _get_week_start(now)
+    assert get_week_start_ts(now) == week_start.timestamp(), now
+    assert get_week_id(now) == f"{week_start:%Y%m%d}", now
+
+
+def _transition_instants(week_start: datetime) -> list[datetime]:
+    """모든 카테고리 전환 시각과 그 ±1µs, 주 경계(이번 주 시작·다음 주 시작)의 ±1µs."""
+    times = []
+    for cat in CATEGORIES:
+        for t, _ in _get_transitions(cat, week_start):
+            times.extend((t - EPS, t, t + EPS))
+    next_week = week_start + timedelta(days=7)
+    times.extend((next_week - EPS, next_week, next_week + EPS))
+    return times
+
+
+def test_every_minute_of_the_week():
+    for minute in range(7 * 24 * 60 + 1):
+        _assert_same(WEEK + timedelta(minutes=minute))
+
+
+@pytest.mark.parametrize("week_start", WEEKS, ids=lambda w: f"{w:%Y%m%d}")
+def test_transition_instants_and_week_boundaries(week_start):
+    for now in _transition_instants(week_start):
+        _assert_same(now)
+
+
+def test_interleaved_weeks_rebuild_index():
+    # 주가 번갈아 들어와도(색인 교체) 이전 주 색인의 값을 돌려주지 않는다
+    times = [t for week_start in WEEKS for t in _transition_instants(week_start)]
+    random.Random(0).shuffle(times)
+    for now in times:
+        _assert_same(now)
+
+
+def test_other_timezone_rebuilds_index():
+    # KST 기준 주 경계가 UTC로 들어오면 그 tz의 주로 계산한다 (기존 구현과 동일)
+    for now in _transition_instants(WEEK):
+        _assert_same(now)
+        _assert_same(now.astimezone(timezone.utc))
@@ -0,0 +1,81 @@
+# tests/test_token_cache.py — token_version 캐시의 워커 간 무효화와 구독 장애 시 DB 직행
+
+import importlib.util
+import sqlite3
+import time
+
+import fakeredis
+import pytest
+
+from smash_db import token_cache
+
+
+def _wait_until(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _bump(db_path: str, student_id: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE users SET token_version = token_version + 1 WHERE student_id = ?", (student_id,))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def workers(db_path, redis_server, monkeypatch):
+    """같은 Redis를 쓰는 워커 프로세스 2개의 token_cache (B는 모듈을 따로 적재한 사본)."""
+    spec = importlib.util.spec_from_file_location("token_cache_worker_b", token_cache.__file__)
+    other = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(other)
+
+    for module in (token_cache, other):
+        monkeypatch.setattr(module, "_redis_client",
+                            fakeredis.FakeRedis(server=redis_server, decode_responses=True))
+        monkeypatch.setattr(module, "_subscriber_client",
+                            fakeredis.FakeRedis(server=redis_server, decode_responses=True))
+    monkeypatch.setattr(token_cache, "_PING_INTERVAL", 0.2)
+    monkeypatch.setattr(token_cache, "_RETRY_DELAY", 0.1)
+    token_cache.start_token_cache()
+    assert _wait_until(lambda: token_cache._healthy)
+    return token_cache, other
+
+
+def test_invalidate_from_another_worker_evicts(workers, db_path):
+    a, b = workers
+    assert a.get_token_version("u1", 1) == 1
+    assert a.get_token_version("u1", 1) == 1
+    assert a.get_stats()["hits"] == 1
+
+    _bump(db_path, "u1")        # 워커 B에서 로그인 → 버전 2
+    b.invalidate("u1")
+
+    assert _wait_until(lambda: "u1" not in a._cache)
+    assert a.get_token_version("u1", 1) == 2   # 구 토큰(ver 1)은 호출자가 불일치로 거부
+
+
+def test_subscriber_outage_bypasses_cache(workers, db_path, redis_server):
+    a, _ = workers
+    assert a.get_token_version("u1", 1) == 1
+    assert "u1" in a._cache
+
+    redis_server.connected = False
+    assert _wait_until(lambda: not a._healthy)
+    assert a._cache == {}
+
+    # 구독이 끊긴 동안 올라간 버전 — 무효화는 전달되지 않았지만 DB에서 바로 읽는다
+    _bump(db_path, "u1")
+    misses = a.get_stats()["misses"]
+    assert a.get_token_version("u1", 1) == 2
+    assert a.get_token_version("u1", 1) == 2
+    assert a.get_stats()["misses"] == misses + 2
+
+    redis_server.connected = True
+    assert _wait_until(lambda: a._healthy)
+    assert a.get_token_version("u1", 2) == 2
+    assert a.get_token_version("u1", 2) == 2
+    assert a.get_stats()["hits"] >= 1
@@ -0,0 +1,140 @@
+# tests/test_worker.py — worker.py consumer 오류 경로
+
+import sqlite3
+
+import pytest
+import redis
+
+import worker
+from time_control import apply_receipt, board_store, json_codec
+from time_control.apply_stream import DATA_FIELD, GROUP, SEQ_FIELD, stream_key
+
+CATEGORY = "WED_REGULAR"
+
+
+@pytest.fixture
+def consumer(fake_redis, db_path, monkeypatch):
+    monkeypatch.setattr(worker, "_redis_client", fake_redis)
+    monkeypatch.setattr(worker, "_DB_PATH", db_path)
+    monkeypatch.setattr(worker, "refresh_board_view", lambda *a, **k: None)
+    monkeypatch.setattr(worker, "publish_board_changed", lambda *a, **k: None)
+    c = worker._Consumer(0, [CATEGORY])
+    c.ensure_groups()
+    c.conn = sqlite3.connect(db_path)
+    yield c
+    c.conn.close()
+
+
+def test_read_acks_non_object_payloads(consumer, fake_redis):
+    key = stream_key(CATEGORY)
+    bad_ids = [
+        fake_redis.xadd(key, {DATA_FIELD: "[1, 2]", SEQ_FIELD: "1"}),
+        fake_redis.xadd(key, {DATA_FIELD: "5"}),
+        fake_redis.xadd(key, {DATA_FIELD: '"text"', SEQ_FIELD: "3"}),
+    ]
+    good_id = fake_redis.xadd(key, {DATA_FIELD: '{"user_id": "u1"}', SEQ_FIELD: "4"})
+
+    ids, entries = consumer.read(">", 10)
+
+    assert ids == {key: [*bad_ids, good_id]}
+    assert entries == [{"user_id": "u1", "seq": 4}]
+
+    # 잘못된 메시지는 entry 없이 ID만 남아 ACK + XDEL된다 (재전달 반복 없음)
+    consumer.process({key: bad_ids}, [])
+    assert fake_redis.xpending(key, GROUP)["pending"] == 1
+    assert fake_redis.xrange(key) == [(good_id, {DATA_FIELD: '{"user_id": "u1"}', SEQ_FIELD: "4"})]
+
+
+def test_connect_retries_until_db_opens(consumer, monkeypatch):
+    calls = []
+    sleeps = []
+
+    def flaky_init_db():
+        calls.append(1)
+        if len(calls) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return sqlite3.connect(":memory:")
+
+    monkeypatch.setattr(worker, "_init_db", flaky_init_db)
+    monkeypatch.setattr(worker.time, "sleep", sleeps.append)
+
+    consumer.connect(delay=1.0)
+
+    assert len(calls) == 3
+    assert sleeps == [1.0, 2.0, 4.0]
+    assert consumer.conn.execute("SELECT 1").fetchone() == (1,)
+
+
+def _enqueue(client, entry: dict) -> str:
+    client.set(apply_receipt.receipt_key(entry["receipt"]), apply_receipt.PENDING_VALUE)
+    return client.xadd(stream_key(CATEGORY), {DATA_FIELD: json_codec.dumps(entry)})
+
+
+def _receipt(client, receipt_id: str) -> dict:
+    return json_codec.loads(client.get(apply_receipt.receipt_key(receipt_id)))
+
+
+def test_receipts_record_each_outcome(consumer, fake_redis):
+    entry = {"user_id": "u1", "name": "홍길동", "category": CATEGORY, "type": "member", "timestamp": 1.0}
+    _enqueue(fake_redis, {**entry, "receipt": "r-ok"})
+    _enqueue(fake_redis, {**entry, "timestamp": 2.0, "receipt": "r-dup"})
+    _enqueue(fake_redis, {"user_id": "u2", "category": CATEGORY, "receipt": "r-bad"})
+
+    consumer.process(*consumer.read(">", 10))
+
+    assert _receipt(fake_redis, "r-ok") == {"status": apply_receipt.INSERTED}
+    assert _receipt(fake_redis, "r-dup") == {"status": apply_receipt.DUPLICATE}
+    assert _receipt(fake_redis, "r-bad")["status"] == apply_receipt.REJECTED
+    assert fake_redis.xlen(stream_key(CATEGORY)) == 0
+
+
+def test_receipt_failure_leaves_entry_pending_until_recorded(consumer, fake_redis, monkeypatch):
+    entry = {"user_id": "u1", "name": "홍길동", "category": CATEGORY, "type": "member",
+             "timestamp": 1.0, "receipt": "r-1"}
+    _enqueue(fake_redis, entry)
+
+    def redis_down(*args, **kwargs):
+        raise redis.ConnectionError("down")
+
+    with monkeypatch.context() as m:
+        m.setattr(apply_receipt, "record", redis_down)
+        with pytest.raises(redis.ConnectionError):
+            consumer.process(*consumer.read(">", 10))
+    assert fake_redis.xpending(stream_key(CATEGORY), GROUP)["pending"] == 1  # ACK하지 않았다
+
+    # 재처리: 이미 커밋된 자기 자신(같은 timestamp)이므로 중복이 아니라 inserted로 기록한다
+    assert consumer.recover() == 1
+    assert _receipt(fake_redis, "r-1") == {"status": apply_receipt.INSERTED}
+    assert fake_redis.xlen(stream_key(CATEGORY)) == 0
+
+
+def test_equal_timestamps_follow_arrival_seq(consumer, fake_redis, monkeypatch):
+    monkeypatch.setattr(board_store, "_snapshot", None)
+    key = stream_key(CATEGORY)
+    # 같은 timestamp — user_id 순(a < b < c)과 반대로 Redis에 도착했다
+    for user_id, seq in (("c", 7), ("b", 8), ("a", 9)):
+        entry = {"user_id": user_id, "name": user_id, "category": CATEGORY, "type": "member",
+                 "timestamp": 5.0}
+        fake_redis.xadd(key, {DATA_FIELD: json_codec.dumps(entry), SEQ_FIELD: str(seq)})
+    # 한 배치에 a가 먼저 INSERT되어도 게시판 순서는 arrival_seq
+    ids, entries = consumer.read(">", 10)
+    consumer.process(ids, list(reversed(entries)))
+
+    assert [e["user_id"] for e in board_store.get_board(CATEGORY)] == ["c", "b", "a"]
+    ranks = [p["rank"] for user_id in ("c", "b", "a") for p in board_store.get_user_positions(user_id)]
+    assert ranks == [0, 1, 2]
+
+    # 변경 로그 pos를 순서대로 재생해도 같은 목록
+    _, changes = board_store.get_changes_since(0)
+    replayed: list[str] = []
+    for change in changes:
+        replayed.insert(change["pos"], change["entry"]["name"])
+    assert replayed == ["c", "b", "a"]
+
+    # 전체 게시판 조회(_load_all_boards)는 idx_applications_board 순서 그대로 읽는다 (정렬 단계 없음)
+    plan = consumer.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT user_id, name, category, type, guest_name, timestamp"
+        " FROM applications ORDER BY category, priority, timestamp, arrival_seq, user_id"
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_applications_board" in details and "TEMP B-TREE" not in details
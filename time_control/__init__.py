@@ -3,7 +3,20 @@
 # 모듈 구성:
 #   scheduler_logic.py  — 카테고리별 상태 전환 규칙 + 주간 초기화 스케줄러
 #   time_handler.py     — 프론트엔드 폴링 API + 시간 검증 게이트키퍼
-#   board_store.py      — 인메모리 딕셔너리 저장소 + 더티 플래그 배치 백업
+#   board_store.py      — SQLite 게시판 저장소 + 변경 로그 + 버전 기반 스냅샷 캐시
+#   applied_set.py      — 주간 신청자 Redis 집합 (중복 신청 검사, 신청 큐 적재와 원자적)
+#   board_rank.py       — 카테고리별 잠정 순번 Redis Sorted Set (신청 응답의 rank, worker가 재동기화)
+#   apply_stream.py     — 카테고리별 신청 스트림 키 + worker consumer 배정 (shard_categories)
+#   apply_receipt.py    — 신청 접수증 (worker가 기록하는 신청별 결과 키, stream_server long-poll)
+#   apply_ticket.py     — 오픈 직전 발급하는 서명 신청권 (신청 시 토큰 검증·DB 조회 생략)
 #   rate_limiter.py     — 인메모리 슬라이딩 윈도우 Rate Limiter
+#   conditional.py      — ETag / If-None-Match 조건부 응답 헬퍼
+#   idempotency.py      — Idempotency-Key 재시도 응답 캐시 (신청·취소 POST)
+#   admission.py        — 22:00 입장 제어 (Redis 공유 토큰 버킷 + 대기 순번, 신청·게시판 조회)
+#   compression.py      — gzip/brotli 응답 압축 (ETag 단위 압축 결과 캐시)
+#   board_events.py     — 보드 변경 알림 발행 (Redis pub/sub → stream_server.py)
+#   board_view.py       — 공개 게시판 문서 사전 렌더링 (Redis board:view, 조회 API가 그대로 응답)
+#   board_compact.py    — /api/all-boards 컬럼형(compact) 응답 형식
+#   json_codec.py       — JSON 인코딩/디코딩 (orjson 선택, 표준 json 폴백)
 #   apply/              — 운동 신청 핵심 로직 (handle_apply)
 #   cancel/             — 운동 취소 핵심 로직 (handle_cancel)
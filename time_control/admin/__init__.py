@@ -14,6 +14,7 @@
 #      - 없음(운동/레슨): name=회원이름, type=member
 #   5.5. 중복 신청 검증 (UNIQUE_APPLY_CATEGORIES 카테고리만, role 무관)
 #   6. apply_entry() 원자적 조작
+#   7. Redis 주간 신청자 집합(applied_set) + 잠정 순번 집합(board_rank)에 반영
 #
 # handle_admin_cancel 처리 순서:
 #   1. role == 'manager' 검증 (실패 → 403)
@@ -22,36 +23,30 @@
 #      → 실패 시 "guest_{target_user_id}_*" prefix 탐색 후 삭제
 #   3.5. 빈자리 감지를 위한 취소 전 보드 위치 기록
 #   4. remove_entry() 원자적 조작 → is_board_changed = True
+#      (잠정 순번 집합에서 제거, 일반 회원 항목이면 Redis 주간 신청자 집합에서도 제거)
 #   5. 빈자리 알림 트리거 (정원 확정 상태 + 정원 내 인원이었을 때만)
 
 import html
-import os
 import sqlite3
 import time
 
 from flask import request
 
+from smash_db.connections import read_conn
+from .. import board_rank
+from ..applied_set import mark_applied, unmark_applied
 from ..board_store import apply_entry, get_board, is_already_applied, remove_entry, UNIQUE_APPLY_CATEGORIES
 from ..cancel import _check_and_notify_vacancy
-
-
-_DB_PATH = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), "..", "..", "smash_db", "users.db"
-)
+from ..time_handler import _now_kst
 
 
 def _lookup_member(student_id: str) -> dict | None:
     """users.db에서 회원을 조회한다. 없으면 None 반환."""
     try:
-        conn = sqlite3.connect(_DB_PATH, timeout=10)  # Gunicorn timeout(30s)보다 낮게
-        conn.row_factory = sqlite3.Row
-        try:
-            row = conn.execute(
-                "SELECT student_id, name FROM users WHERE student_id = ?",
-                (student_id,),
-            ).fetchone()
-        finally:
-            conn.close()
+        row = read_conn().execute(
+            "SELECT student_id, name FROM users WHERE student_id = ?",
+            (student_id,),
+        ).fetchone()
         if row:
             return {"student_id": row["student_id"], "name": row["name"]}
     except sqlite3.Error:
@@ -132,6 +127,11 @@ def handle_admin_apply(category: str) -> tuple[dict, int]:
     if not success:
         return {"error": reason}, 409
 
+    # Step 7: Redis 주간 신청자 집합 반영 — 이후 본인 신청이 큐에 들어가기 전에 409
+    #         잠정 순번 집합에도 넣어 이후 신청자의 순번이 대리 신청분을 포함하게 한다.
+    mark_applied(category, entry["user_id"], _now_kst())
+    board_rank.add(category, entry)
+
     return {"message": f"{member_name}({member_id}) 대리 신청이 완료되었습니다."}, 200
 
 
@@ -185,6 +185,8 @@ def handle_admin_cancel(category: str) -> tuple[dict, int]:
         -1,
     )
     if remove_entry(category, target_user_id):
+        unmark_applied(category, target_user_id, _now_kst())
+        board_rank.remove(category, target_user_id)
         _check_and_notify_vacancy(category, cancel_pos)
         return {"message": f"{target_user_id} 대리 취소가 완료되었습니다."}, 200
 
@@ -215,5 +217,6 @@ def handle_admin_cancel(category: str) -> tuple[dict, int]:
     if not success:
         return {"error": "취소할 신청 내역이 존재하지 않습니다."}, 404
 
+    board_rank.remove(category, guest_user_id)
     _check_and_notify_vacancy(category, cancel_pos)
     return {"message": f"{target_user_id} 대리 취소가 완료되었습니다."}, 200
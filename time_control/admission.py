@@ -0,0 +1,201 @@
+# admission.py — 22:00 오픈 입장 제어 (공유 토큰 버킷 + 대기실)
+#
+# 오픈 순간에는 GEN(12) + VIP(16) 스레드 슬롯을 넘는 요청이 Node 프록시에 쌓이다가
+# 타임아웃으로 끝난다. 신청·게시판 조회 앞에서 요청 수를 측정된 처리량에 맞춰 입장시키고,
+# 넘치는 요청에는 대기 순번과 예상 대기 시간을 즉시 돌려주어 "타임아웃" 대신 "줄 서기"가 되게 한다.
+#
+# [상태] Redis 해시 admission:state — 모든 Gunicorn 워커, GEN·VIP 인스턴스가 공유
+#   tokens / ts : 토큰 버킷 (초당 ADMISSION_RATE개 충전, 최대 ADMISSION_BURST개)
+#   issued      : 마지막으로 발급한 대기 번호
+#   serving     : 입장 가능한 마지막 대기 번호 — 충전된 토큰만큼 앞으로 나아간다
+#   gen         : 상태 세대 (조용한 시간이 _STATE_TTL 지나 상태가 사라지면 새로 시작)
+#   admission:used (bitmap) : 입장에 사용된 대기 번호 — 번호 하나로 한 번만 입장
+#
+# [입장 판정] 요청마다 Lua 스크립트 1회 (_ADMIT_SCRIPT)
+#   1. 경과 시간만큼 토큰 충전 → 대기 중인 사람이 있으면 토큰을 serving 전진에 먼저 쓴다 (FIFO)
+#   2. 대기표가 있고 번호 ≤ serving(처음 사용)  → 입장 (토큰은 serving 전진 때 이미 소비)
+#      대기표가 있고 번호 > serving            → 계속 대기 (같은 번호 유지)
+#      대기표 없음·사용됨·다른 세대, 줄이 비었고 토큰 있음 → 토큰 1개 소비 후 입장
+#      그 외                                  → 새 대기 번호 발급
+#   대기 응답: 게시판 조회 200, 신청 503 — {"waiting": true, "position", "estimated_wait", "retry_after"}
+#     + Retry-After, X-Admission: waiting, X-Admission-Ticket: 대기표 (다음 요청에 그대로 첨부)
+#   입장 응답에는 X-Admission: admitted (클라이언트는 사용한 대기표를 버린다)
+#
+# [대기표] "{번호}.{세대}.{서명}" — SECRET_KEY HMAC. 번호를 위조해 줄 앞으로 갈 수 없다.
+#
+# [한계] 대기 번호를 받고 돌아오지 않은 요청 몫의 토큰도 serving 전진에 쓰인다 (이탈 비율만큼 처리량 손실).
+#        클라이언트는 Retry-After마다 다시 요청하므로 오픈 직후 이탈은 적다.
+#
+# ADMISSION_ENABLED=true일 때만 동작한다 (.env.xlarge). Redis 장애 시에는 모두 입장시킨다.
+# 사용: @token_required보다 바깥에 둔다 — 대기 응답은 토큰 검증(SQLite)조차 하지 않는다.
+
+import hashlib
+import hmac
+import math
+import os
+from functools import wraps
+
+import redis
+from flask import jsonify, make_response, request
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+TICKET_HEADER = "X-Admission-Ticket"
+STATUS_HEADER = "X-Admission"
+
+ENABLED = os.environ.get("ADMISSION_ENABLED", "false").lower() == "true"
+# 초당 입장 요청 수 / 순간 허용량 — stress_test.py 결과(포화 직전 처리량)에 맞춰 조정한다
+RATE = float(os.environ.get("ADMISSION_RATE", "400"))
+BURST = float(os.environ.get("ADMISSION_BURST", "200"))
+
+_STATE_KEY = "admission:state"
+_USED_KEY = "admission:used"
+_STATE_TTL = 600            # 초 — 이 시간 동안 요청이 없으면 상태(번호·세대)를 새로 시작
+_MAX_RETRY_AFTER = 10       # 초 — 대기가 길어도 이 간격으로는 다시 확인해 순번을 갱신한다
+
+_SECRET = (os.environ.get("SECRET_KEY") or "").encode()
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # 입장 판정이 Redis 장애로 지연되지 않도록 (장애 시 입장)
+)
+
+#   KEYS[1] = admission:state, KEYS[2] = admission:used
+#   ARGV[1] = RATE, ARGV[2] = BURST, ARGV[3] = 대기 번호 (0 = 없음), ARGV[4] = 대기표 세대, ARGV[5] = TTL
+#   반환: {1, 세대} = 입장, {0, 세대, 대기 번호, 앞선 인원 포함 순번}
+_ADMIT_SCRIPT = _redis_client.register_script("""
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+local s = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'serving', 'issued', 'gen')
+local gen = s[5]
+local tokens, ts, serving, issued
+if not gen then
+    gen = t[1] .. t[2]
+    tokens, ts, serving, issued = burst, now, 0, 0
+    redis.call('DEL', KEYS[2])
+else
+    tokens, ts = tonumber(s[1]), tonumber(s[2])
+    serving, issued = tonumber(s[3]), tonumber(s[4])
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+if issued > serving then
+    local advance = math.min(issued - serving, math.floor(tokens))
+    serving = serving + advance
+    tokens = tokens - advance
+end
+
+local ticket = tonumber(ARGV[3])
+if ARGV[4] ~= gen or ticket > issued then
+    ticket = 0
+end
+local admitted, number = 0, 0
+if ticket > 0 then
+    if ticket > serving then
+        number = ticket
+    elseif redis.call('SETBIT', KEYS[2], ticket, 1) == 0 then
+        admitted = 1
+    end
+end
+if admitted == 0 and number == 0 then
+    if issued == serving and tokens >= 1 then
+        tokens = tokens - 1
+        admitted = 1
+    else
+        issued = issued + 1
+        number = issued
+    end
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now, 'serving', serving, 'issued', issued, 'gen', gen)
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+if admitted == 1 then
+    return {1, gen}
+end
+return {0, gen, number, number - serving}
+""")
+
+
+def _sign(number: int, gen: str) -> str:
+    return hmac.new(_SECRET, f"{number}.{gen}".encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def _make_ticket(number: int, gen: str) -> str:
+    return f"{number}.{gen}.{_sign(number, gen)}"
+
+
+def _parse_ticket(ticket: str | None) -> tuple[int, str]:
+    """요청의 대기표를 검증해 (번호, 세대)를 반환한다. 없거나 위조됐으면 (0, "")."""
+    if not ticket:
+        return 0, ""
+    try:
+        number_str, gen, sig = ticket.split(".")
+        number = int(number_str)
+    except ValueError:
+        return 0, ""
+    if number <= 0 or not hmac.compare_digest(sig, _sign(number, gen)):
+        return 0, ""
+    return number, gen
+
+
+def admit() -> tuple[dict, str] | None:
+    """현재 요청의 입장 여부를 판정한다.
+
+    Returns:
+        None — 입장 (Redis 장애 시 포함)
+        (대기 응답 본문, 대기표) — 대기
+    """
+    number, gen = _parse_ticket(request.headers.get(TICKET_HEADER))
+    try:
+        result = _ADMIT_SCRIPT(keys=[_STATE_KEY, _USED_KEY], args=[RATE, BURST, number, gen, _STATE_TTL])
+    except redis.RedisError:
+        return None
+    if result[0] == 1:
+        return None
+
+    gen, number, position = result[1], int(result[2]), int(result[3])
+    wait = position / RATE
+    return {
+        "waiting":        True,
+        "position":       position,
+        "estimated_wait": round(wait, 1),
+        "retry_after":    max(1, math.ceil(min(wait, _MAX_RETRY_AFTER))),
+        "message":        f"접속자가 많아 대기 중입니다. (대기 순번 {position}번)",
+    }, _make_ticket(number, gen)
+
+
+def admission_gate(waiting_status: int):
+    """입장 제어 데코레이터.
+
+    Args:
+        waiting_status: 대기 응답 코드 — 게시판 조회는 200(클라이언트가 기존 화면 유지),
+                        신청은 503(Retry-After 후 같은 Idempotency-Key로 재시도)
+    """
+    def decorator(f):
+        if not ENABLED:
+            return f
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            waiting = admit()
+            if waiting is None:
+                response = make_response(f(*args, **kwargs))
+                response.headers[STATUS_HEADER] = "admitted"
+                return response
+
+            body, ticket = waiting
+            response = jsonify(body)
+            response.status_code = waiting_status
+            response.headers["Retry-After"] = str(body["retry_after"])
+            response.headers["Cache-Control"] = "no-store"
+            response.headers[STATUS_HEADER] = "waiting"
+            response.headers[TICKET_HEADER] = ticket
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+# applied_set.py — 주간 신청자 집합 (Redis SET, 중복 신청 검사용)
+#
+# UNIQUE_APPLY_CATEGORIES(한 주 1회 신청)의 중복 검사를 SQLite 대신 Redis에서 한다.
+# 일반 신청(handle_apply)은 Lua 스크립트 한 번으로 "집합 확인 → 표시 → 큐 적재"를
+# 원자적으로 수행하므로, 아직 worker가 INSERT하지 않은(큐에 있는) 중복도 409로 거절된다.
+#
+# [키]
+#   applied:{주 시작일 YYYYMMDD}:{category}  — 이번 주 신청자 user_id 집합
+#     · 주 시작 = 토요일 00:00 KST (scheduler_logic._get_week_start)
+#     · 다음 주 시작 + 1일에 만료 (EXPIREAT) — 주간 리셋 후에는 새 키를 쓴다
+#     · WARM_MARKER 원소 = "SQLite에서 적재 완료" 표시 (신청자가 0명이어도 키가 존재)
+#
+# [적재 (warm)]
+#   키가 없으면(첫 신청, Redis 재시작) 신청 스크립트가 -1을 돌려주고,
+#   호출자는 warm()으로 SQLite의 이번 주 신청자를 적재한 뒤 다시 시도한다.
+#
+# [갱신 지점]
+#   - handle_apply        : Lua 스크립트가 SADD (apply/__init__.py)
+#   - handle_admin_apply  : mark_applied()   — SQLite 직접 INSERT 성공 후
+#   - handle_cancel       : unmark_applied() — 삭제 성공 후
+#   - handle_admin_cancel : unmark_applied() — 삭제 성공 후
+#
+# Redis 장애 시 mark/unmark는 조용히 실패한다. 신청 경로는 SQLite 검사로 폴백하며,
+# 최종 안전망은 applications의 UNIQUE(category, user_id) 제약이다.
+
+import os
+from datetime import datetime, timedelta
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from .board_store import UNIQUE_APPLY_CATEGORIES, get_week_applicants
+from .scheduler_logic import _get_week_start, get_week_id
+
+WARM_MARKER = "__warm__"
+
+# 다음 주 시작 이후 하루 더 보관 (주간 리셋 직후 늦게 도착한 취소 처리 여유)
+_EXPIRE_AFTER = timedelta(days=8)
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # 취소·대리 신청 응답이 Redis 장애로 지연되지 않도록
+)
+
+# 이미 적재된 키에만 반영한다 — 키가 없으면 다음 warm()이 SQLite에서 읽어 온다.
+_MARK_SCRIPT = _redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('SADD', KEYS[1], ARGV[1])
+end
+return -1
+""")
+
+# 다른 요청이 먼저 적재했으면 건너뛴다.
+_WARM_SCRIPT = _redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('SADD', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIREAT', KEYS[1], ARGV[1])
+return 1
+""")
+
+
+def applied_key(category: str, now: datetime) -> str:
+    """now가 속한 주의 신청자 집합 키."""
+    return f"applied:{get_week_id(now)}:{category}"
+
+
+def warm(category: str, now: datetime) -> None:
+    """SQLite의 이번 주 신청자로 집합을 만든다 (키가 이미 있으면 아무것도 하지 않음).
+
+    Raises:
+        redis.RedisError — 호출자(handle_apply)가 SQLite 경로로 폴백한다.
+    """
+    week_start = _get_week_start(now)
+    user_ids = get_week_applicants(category, week_start.timestamp())
+    expire_at = int((week_start + _EXPIRE_AFTER).timestamp())
+    _WARM_SCRIPT(keys=[applied_key(category, now)], args=[expire_at, WARM_MARKER, *user_ids])
+
+
+def mark_applied(category: str, user_id: str, now: datetime) -> None:
+    """SQLite에 직접 INSERT한 신청을 집합에 반영한다. 실패해도 예외를 던지지 않는다."""
+    if category not in UNIQUE_APPLY_CATEGORIES:
+        return
+    try:
+        _MARK_SCRIPT(keys=[applied_key(category, now)], args=[user_id])
+    except redis.RedisError:
+        pass
+
+
+def unmark_applied(category: str, user_id: str, now: datetime) -> None:
+    """취소된 신청을 집합에서 뺀다. 실패해도 예외를 던지지 않는다.
+
+    Redis 장애로 빠지지 못한 user_id는 다음 주 키로 넘어가면 사라진다.
+    그 사이 재신청은 409로 거절될 수 있으므로, 장애 복구 후 키를 지우면 warm()이 다시 적재한다.
+    """
+    if category not in UNIQUE_APPLY_CATEGORIES:
+        return
+    try:
+        _redis_client.srem(applied_key(category, now), user_id)
+    except redis.RedisError:
+        pass
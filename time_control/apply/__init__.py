@@ -6,34 +6,47 @@
 #   1. 타임스탬프 즉시 채번 (time.time(), 밀리초 정밀도)
 #   2. 토큰에서 사용자 정보 추출 (token_required 보장)
 #   3. 시간 검증 — 항상 수행, 바이패스 없음
-#   3.5. 중복 신청 검증 — SQLite에서 기존 신청 여부 확인 (UNIQUE 인덱스 활용, ~0.3ms)
 #   4. 카테고리별 신청 항목 구성
-#   5. Redis apply_queue에 lpush (DB 쓰기 없음, Lock 없음)
-#   6. 즉시 200 OK 응답 반환
+#   5. Lua 스크립트 1회: 주간 신청자 집합 확인·표시 + 전역 도착 순번 채번(INCR)
+#      + 카테고리 신청 스트림에 xadd + 잠정 순번 집합(board_rank)에 zadd
+#      + 접수증(apply_receipt) pending 기록 (원자적)
+#      — 중복(큐에서 처리 대기 중인 신청 포함)이면 409, SQLite 조회 없음
+#   6. 즉시 200 OK 응답 반환 — 잠정 순번(rank)과 정원 내 여부(in_capacity), 접수 번호(receipt) 포함
+#      (최종 순서는 worker.py가 SQLite 기준으로 board_rank를 재동기화한다)
+#      (최종 반영 여부는 worker가 접수증에 기록 → /api/apply/receipt/<id>로 대기·조회)
 #
 # 기존 board_store.apply_entry() 호출을 제거하고
 # Redis In-memory Queue로 대체하여 I/O 병목을 완전 해소한다.
-# 실제 SQLite 쓰기는 별도의 worker.py가 brpop으로 처리한다.
+# 실제 SQLite 쓰기는 별도의 worker.py가 Consumer Group(XREADGROUP)으로 읽어 처리하고,
+# SQLite 커밋 후에만 XACK하므로 worker가 중간에 죽어도 항목이 유실되지 않는다.
 #
 # [분리 원칙]
 #   매니저 대리 신청은 /admin/apply 엔드포인트(time_control/admin/)가 전담한다.
 #   이 모듈은 오직 "로그인한 본인" 신청만 처리하며, role 분기가 존재하지 않는다.
 
 import html
-import json
 import os
+import threading
 import time
 
 import redis
 from flask import request
 
+from .. import json_codec
+from .. import board_rank
+from ..apply_receipt import PENDING_VALUE, RECEIPT_TTL, new_receipt_id, receipt_key
+from ..apply_stream import DATA_FIELD, SEQ_FIELD, SEQ_KEY, stream_key
+from ..applied_set import applied_key, warm as _warm_applied
 from ..board_store import is_already_applied, UNIQUE_APPLY_CATEGORIES
 from ..time_handler import validate_apply_time, _now_kst
 
 
 _GUEST_CATEGORIES = {"WED_GUEST", "FRI_GUEST", "WED_LEFTOVER", "FRI_LEFTOVER"}
 
-_QUEUE_KEY = "apply_queue"
+# 신청 스트림 (카테고리별 Redis Stream, apply_stream.py). 메시지 = {"d": entry JSON, "s": 도착 순번}
+# 처리된 항목은 worker가 XACK + XDEL로 지우므로 XLEN = 처리 대기 건수.
+# MAXLEN ~ 은 worker 장기 중단 시 메모리 상한 (정상 운영에서는 도달하지 않는 값).
+_STREAM_MAXLEN = int(os.environ.get("APPLY_STREAM_MAXLEN", "100000"))
 
 # ── Redis 연결 ────────────────────────────────────────────────────────────────
 # preload_app=True(Gunicorn) 환경에서는 모듈이 fork() 전 마스터에서 로드된다.
@@ -49,6 +62,97 @@ _redis_client = redis.Redis(
 )
 
 
+# 중복 검사 + 도착 순번 + 큐 적재 + 잠정 순번 + 접수증
+# (applied_set.py, apply_stream.py, board_rank.py, apply_receipt.py 참고)
+#   KEYS[1] = applied:{week}:{category}, KEYS[2] = apply_stream:{category}, KEYS[3] = board:rank:{category}
+#   KEYS[4] = apply:receipt:{id}, KEYS[5] = apply:seq
+#   ARGV[1] = 중복 검사할 user_id ("" = 검사 없음: 게스트/잔여석), ARGV[2] = 스트림 메시지
+#   ARGV[3] = 게시판 user_id, ARGV[4] = 정렬 score, ARGV[5] = 스트림 MAXLEN
+#   ARGV[6] = 접수증 pending 값, ARGV[7] = 접수증 TTL, ARGV[8] = 메시지 필드, ARGV[9] = 순번 필드
+#   반환: {1, 순번} = 적재, {0} = 이미 신청됨,
+#         {-1, mask} = 집합 미적재 (mask 1 = 신청자 집합, 2 = 순번 집합 → warm 후 재시도)
+_ENQUEUE_SCRIPT = _redis_client.register_script("""
+local cold = 0
+if ARGV[1] ~= '' and redis.call('EXISTS', KEYS[1]) == 0 then
+    cold = cold + 1
+end
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    cold = cold + 2
+end
+if cold > 0 then
+    return {-1, cold}
+end
+if ARGV[1] ~= '' and redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return {0}
+end
+local seq = redis.call('INCR', KEYS[5])
+redis.call('SET', KEYS[4], ARGV[6], 'EX', ARGV[7])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[5], '*', ARGV[8], ARGV[2], ARGV[9], seq)
+redis.call('ZADD', KEYS[3], 'NX', ARGV[4], ARGV[3])
+return {1, redis.call('ZRANK', KEYS[3], ARGV[3]) - 1}
+""")
+
+_ENQUEUED, _DUPLICATE, _COLD = 1, 0, -1
+_COLD_APPLIED, _COLD_RANK = 1, 2
+
+
+def _enqueue(category: str, entry: dict, now) -> tuple[int, int | None]:
+    """entry를 중복 검사와 함께 카테고리 신청 스트림에 적재하고 잠정 순번을 받는다.
+
+    entry["receipt"]의 접수증을 pending으로 함께 기록한다 (worker가 커밋 후 결과로 덮어씀).
+
+    집합이 비어 있으면 해당 집합만 1회 적재 후 재시도한다.
+
+    Returns:
+        (상태, 0-based 잠정 순번) — 적재되지 않았으면 순번은 None
+
+    Raises:
+        redis.RedisError — 호출자가 SQLite 직접 쓰기로 폴백한다.
+    """
+    check_id = entry["user_id"] if category in UNIQUE_APPLY_CATEGORIES else ""
+    keys = [applied_key(category, now), stream_key(category), board_rank.rank_key(category),
+            receipt_key(entry["receipt"]), SEQ_KEY]
+    args = [check_id, json_codec.dumps_bytes(entry),
+            entry["user_id"], board_rank.entry_score(category, entry), _STREAM_MAXLEN,
+            PENDING_VALUE, RECEIPT_TTL, DATA_FIELD, SEQ_FIELD]
+
+    result = _ENQUEUE_SCRIPT(keys=keys, args=args)
+    if result[0] == _COLD:
+        if result[1] & _COLD_APPLIED:
+            _warm_applied(category, now)
+        if result[1] & _COLD_RANK:
+            board_rank.warm(category)
+        result = _ENQUEUE_SCRIPT(keys=keys, args=args)
+    if result[0] == _ENQUEUED:
+        return _ENQUEUED, result[1]
+    return result[0], None
+
+
+# ── 유효 정원 캐시 ────────────────────────────────────────────────────────────
+# get_effective_capacity()는 Redis 정원 조회 + SQLite 특수 게스트 COUNT를 하므로
+# 신청 응답마다 부르면 큐로 덜어낸 SQLite 부하가 되돌아온다.
+# 정원은 관리자가 바꿀 때만 변하므로 프로세스별로 짧게 캐시한다.
+_CAPACITY_TTL = 2.0
+_capacity_lock = threading.Lock()
+_capacity_cache: dict[str, tuple[float, int | None]] = {}
+
+
+def _get_capacity(category: str) -> int | None:
+    now = time.monotonic()
+    with _capacity_lock:
+        cached = _capacity_cache.get(category)
+    if cached is not None and now - cached[0] < _CAPACITY_TTL:
+        return cached[1]
+    try:
+        from admin.capacity.calculator import get_effective_capacity
+        capacity = get_effective_capacity(category)
+    except Exception:
+        return None
+    with _capacity_lock:
+        _capacity_cache[category] = (now, capacity)
+    return capacity
+
+
 def _is_guest_category(category: str) -> bool:
     return category in _GUEST_CATEGORIES
 
@@ -63,9 +167,19 @@ def handle_apply(category: str) -> tuple[dict, int]:
     [Level 3] Redis 큐 아키텍처:
       1) 타임스탬프 즉시 채번
       2) 시간 검증 (항상 수행)
-      3) 중복 신청 검증 (WED_REGULAR, FRI_REGULAR, WED_LESSON)
-      4) 신청 정보를 Redis apply_queue에 lpush
-      5) DB 쓰기를 기다리지 않고 즉시 200 OK 반환
+      3) 신청 항목 구성
+      4) Lua 스크립트로 중복 검사(WED_REGULAR, FRI_REGULAR, WED_LESSON) + 도착 순번 채번
+         + 카테고리 스트림 xadd + 잠정 순번 집합 zadd/zrank + 접수증 pending 기록
+      5) DB 쓰기를 기다리지 않고 즉시 200 OK 반환 (잠정 순번·정원·접수 번호 포함)
+
+    Response (200):
+        {"message": ..., "timestamp": ts,
+         "rank": 12, "capacity": 40, "in_capacity": true, "provisional": true,
+         "receipt": "..."}
+        rank: 0-based 잠정 순번 (worker 반영 전 값). Redis 장애로 SQLite에 직접 쓴 경우 생략.
+        capacity / in_capacity: 유효 정원 미설정·정원 없는 카테고리(레슨)는 null.
+        receipt: 접수 번호 — /api/apply/receipt/<id>?wait=초 로 최종 결과
+                 (inserted / duplicate / rejected)를 기다린다. SQLite에 직접 쓴 경우 생략 (이미 반영됨).
 
     /apply 엔드포인트 전용. manager 바이패스 로직 없음.
     """
@@ -84,12 +198,6 @@ def handle_apply(category: str) -> tuple[dict, int]:
     if time_error:
         return {"error": time_error}, 400
 
-    # Step 3.5: 중복 신청 검증 (WED_REGULAR, FRI_REGULAR, WED_LESSON)
-    # role 무관 — 카테고리 타입으로 결정. 게스트/잔여석은 중복 허용.
-    if category in UNIQUE_APPLY_CATEGORIES:
-        if is_already_applied(category, user_id):
-            return {"error": "이미 신청되어 있습니다."}, 409
-
     # Step 4: 카테고리별 신청 항목 구성
     if _is_guest_category(category):
         guest_name = data.get("guest_name", "").strip()
@@ -115,16 +223,37 @@ def handle_apply(category: str) -> tuple[dict, int]:
             "timestamp": ts,
         }
 
-    # Step 5: Redis 큐에 즉시 밀어넣기 (DB 쓰기 대기 없음, Lock 없음)
+    entry["receipt"] = new_receipt_id()
+
+    # Step 5: 중복 검사 + Redis 큐 적재를 한 번에 (DB 쓰기 대기 없음, Lock 없음)
+    # role 무관 — 중복 검사 대상은 카테고리 타입으로 결정. 게스트/잔여석은 중복 허용.
     # Redis 장애 시 SQLite 직접 쓰기로 폴백하여 서비스 가용성을 보장한다.
     try:
-        _redis_client.lpush(_QUEUE_KEY, json.dumps(entry, ensure_ascii=False))
+        result, rank = _enqueue(category, entry, now)
     except Exception:
-        # Redis 장애 → SQLite 직접 INSERT (매니저 대리 신청과 동일 경로)
+        result, rank = None, None
+
+    if result == _DUPLICATE:
+        return {"error": "이미 신청되어 있습니다."}, 409
+
+    if result != _ENQUEUED:
+        # Redis 장애 → SQLite 중복 검사 + 직접 INSERT (매니저 대리 신청과 동일 경로)
+        if category in UNIQUE_APPLY_CATEGORIES and is_already_applied(category, user_id):
+            return {"error": "이미 신청되어 있습니다."}, 409
         from ..board_store import apply_entry as _direct_apply
         success, reason = _direct_apply(category, entry)
         if not success:
             return {"error": reason}, 409
 
     # Step 6: 즉시 200 OK 반환
-    return {"message": "신청이 접수되었습니다.", "timestamp": ts}, 200
+    response = {"message": "신청이 접수되었습니다.", "timestamp": ts}
+    if rank is not None:
+        capacity = _get_capacity(category)
+        response.update({
+            "rank":        rank,
+            "capacity":    capacity,
+            "in_capacity": rank < capacity if capacity is not None else None,
+            "provisional": True,
+            "receipt":     entry["receipt"],
+        })
+    return response, 200
@@ -0,0 +1,111 @@
+# apply_receipt.py — 신청 접수증 (신청별 처리 결과 Redis 키)
+#
+# /api/apply의 200은 "큐에 적재됨"까지만 보장한다. worker.py의 INSERT OR IGNORE가
+# 중복으로 행을 버려도 신청자는 알 수 없어 게시판 전체를 다시 조회해야 했다.
+# 적재되는 신청마다 접수 번호(receipt)를 붙이고, worker가 커밋 후 결과를 기록한다.
+#
+# [키]
+#   apply:receipt:{id}  — JSON {"status": ...[, "reason": ...]}, RECEIPT_TTL 후 만료
+#     pending    — 신청 스크립트가 큐 적재와 같은 원자 단위로 기록 (apply/__init__.py)
+#     inserted   — SQLite에 반영됨
+#     duplicate  — 같은 (category, user_id) 행이 이미 있어 무시됨
+#     rejected   — 항목 형식 오류 등으로 반영 불가 (reason = 사용자 표시 문구)
+#   접수 번호는 추측 불가능한 128bit 난수이므로 번호 자체가 조회 권한이다 (토큰 검증 없음).
+#
+# [알림]
+#   worker는 결과를 기록한 스크립트 안에서 RECEIPT_CHANNEL로 접수 번호 목록을 발행한다.
+#   stream_server.py의 /api/apply/receipt/<id>?wait=초 (long-poll)가 구독하다가 깨어나
+#   키를 다시 읽는다 — 알림이 유실되어도 키가 진실의 원천이다.
+#
+# [재처리]
+#   pending일 때만 결과를 덮어쓴다. 커밋 후 ACK 전에 죽어 같은 항목을 다시 처리해도
+#   이미 기록된 결과(inserted)가 duplicate로 바뀌지 않는다.
+
+import os
+import secrets
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from . import json_codec
+
+RECEIPT_PREFIX = "apply:receipt:"
+RECEIPT_CHANNEL = os.environ.get("APPLY_RECEIPT_CHANNEL", "apply:receipts")
+# worker 장애로 처리가 늦어져도 결과를 기록할 수 있을 만큼 보관한다 (초)
+RECEIPT_TTL = int(os.environ.get("APPLY_RECEIPT_TTL", "600"))
+
+PENDING = "pending"
+INSERTED = "inserted"
+DUPLICATE = "duplicate"
+REJECTED = "rejected"
+
+# 신청 스크립트가 그대로 SET하는 값 (기록 스크립트가 문자열 비교로 pending 여부를 판단)
+PENDING_VALUE = json_codec.dumps({"status": PENDING})
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),
+)
+
+# pending인 키에만 결과를 기록하고 기록한 접수 번호를 한 번에 발행한다.
+#   KEYS = 접수증 키, ARGV[1] = PENDING_VALUE, ARGV[2] = TTL, ARGV[3] = 채널,
+#   ARGV[4..] = 키 순서대로 (접수 번호, 결과 JSON) 쌍
+_RECORD_SCRIPT = _redis_client.register_script("""
+local done = {}
+for k = 1, #KEYS do
+    if redis.call('GET', KEYS[k]) == ARGV[1] then
+        redis.call('SET', KEYS[k], ARGV[3 + k * 2], 'EX', ARGV[2])
+        done[#done + 1] = ARGV[2 + k * 2]
+    end
+end
+if #done > 0 then
+    redis.call('PUBLISH', ARGV[3], table.concat(done, ' '))
+end
+return #done
+""")
+
+
+def new_receipt_id() -> str:
+    """접수 번호 (URL-safe, 22자)."""
+    return secrets.token_urlsafe(16)
+
+
+def receipt_key(receipt_id: str) -> str:
+    """접수증 키."""
+    return f"{RECEIPT_PREFIX}{receipt_id}"
+
+
+def is_valid_id(receipt_id: str) -> bool:
+    """조회 경로에서 받은 접수 번호의 형식 검사 (키 주입·과도한 길이 방지)."""
+    return 0 < len(receipt_id) <= 64 and all((c.isascii() and c.isalnum()) or c in "-_" for c in receipt_id)
+
+
+def record(client: redis.Redis, outcomes: dict[str, tuple[str, str | None]]) -> int:
+    """worker 커밋 결과를 접수증에 기록하고 알린다 (왕복 1회).
+
+    Args:
+        client: worker.py의 Redis 클라이언트
+        outcomes: {접수 번호: (결과, 사유)} — 사유는 rejected일 때만
+
+    Returns:
+        기록한 접수증 수 (만료됐거나 이미 결과가 있는 항목은 제외)
+
+    Raises:
+        redis.RedisError — 호출자는 ACK하지 않고 다음 재처리에서 다시 기록한다.
+    """
+    if not outcomes:
+        return 0
+    keys, args = [], [PENDING_VALUE, RECEIPT_TTL, RECEIPT_CHANNEL]
+    for receipt_id, (status, reason) in outcomes.items():
+        body = {"status": status}
+        if reason:
+            body["reason"] = reason
+        keys.append(receipt_key(receipt_id))
+        args.extend((receipt_id, json_codec.dumps(body)))
+    return _RECORD_SCRIPT(keys=keys, args=args, client=client)
@@ -0,0 +1,68 @@
+# apply_stream.py — 신청 스트림 키 (카테고리별 샤딩)
+#
+# 일반 신청(handle_apply)은 카테고리마다 별도의 Redis Stream에 적재된다.
+#   apply_stream:{category}  — 메시지 = {"d": entry JSON, "s": 도착 순번}
+#   apply:seq                — 도착 순번 카운터 (INCR, 모든 카테고리·GEN·VIP 인스턴스 공유)
+#     신청 스크립트가 XADD와 같은 왕복에서 채번하므로 Redis에 도착한 순서 그대로 단조 증가한다.
+#     worker가 applications.arrival_seq에 저장 → 동시각 신청의 게시판 순서를 정한다 (board_store.py).
+#     주간 리셋에도 지우지 않는다 (순번은 비교만 하므로 계속 증가해도 된다).
+#
+# 하나의 스트림을 쓰면 22:00 WED_REGULAR·FRI_REGULAR 동시 오픈 때
+# 두 요일 신청이 한 줄로 서서 처리된다. 카테고리별로 나누면 worker.py의
+# consumer 여러 개가 서로 다른 스트림을 나눠 맡아 동시에 읽고, 한쪽 적체가
+# 다른 쪽 신청의 반영을 늦추지 않는다 (SQLite 커밋은 worker 안에서 순서대로 넘겨받는다).
+#
+# [consumer 배정] shard_categories(i, n)
+#   SHARD_ORDER를 n개씩 건너뛰며 나눈다. 신청이 몰리는 정규 운동을 앞에 두어
+#   n = 2이면 수요일 / 금요일, n = 7이면 카테고리마다 consumer 하나가 된다.
+#
+# 사용처:
+#   - time_control/apply      : 적재 (Lua 스크립트의 XADD)
+#   - worker.py               : Consumer Group 읽기·ACK
+#   - application_routes.py   : 서킷 브레이커 (pending_count)
+#   - board_rank.py           : 재동기화 조건 (모든 스트림이 비었을 때)
+#   - scheduler_logic.py      : 주간 리셋 시 삭제
+
+import redis
+
+from .scheduler_logic import Category
+
+STREAM_PREFIX = "apply_stream:"
+GROUP = "apply_workers"
+SEQ_KEY = "apply:seq"
+DATA_FIELD = "d"
+SEQ_FIELD = "s"
+
+SHARD_ORDER: tuple[str, ...] = (
+    Category.WED_REGULAR.value,
+    Category.FRI_REGULAR.value,
+    Category.WED_GUEST.value,
+    Category.FRI_GUEST.value,
+    Category.WED_LEFTOVER.value,
+    Category.FRI_LEFTOVER.value,
+    Category.WED_LESSON.value,
+)
+
+
+def stream_key(category: str) -> str:
+    """카테고리 신청 스트림 키."""
+    return f"{STREAM_PREFIX}{category}"
+
+
+STREAM_KEYS: tuple[str, ...] = tuple(stream_key(cat) for cat in SHARD_ORDER)
+
+
+def shard_categories(index: int, count: int) -> list[str]:
+    """count개 consumer 중 index번째가 맡을 카테고리 목록."""
+    return list(SHARD_ORDER[index::count])
+
+
+def pending_count(client: redis.Redis) -> int:
+    """모든 신청 스트림의 처리 대기 건수 합 (왕복 1회).
+
+    worker는 SQLite 커밋 후 XACK + XDEL하므로 XLEN 합 = 아직 SQLite에 없는 신청 수.
+    """
+    pipe = client.pipeline(transaction=False)
+    for key in STREAM_KEYS:
+        pipe.xlen(key)
+    return sum(pipe.execute())
@@ -0,0 +1,158 @@
+# apply_ticket.py — 오픈 직전 발급하는 서명 신청권 (apply ticket)
+#
+# 22:00 신청 요청 하나가 거치는 인증 비용:
+#   check_global_ip_limit → JWT 디코딩 1회, @token_required → JWT 디코딩 + SQLite token_version 조회.
+# 오픈 전 APPLY_TICKET_WINDOW초 동안 로그인한 회원에게 (user, category, week) 범위의
+# 짧은 신청권을 미리 발급해 두고, 오픈 순간의 /api/apply는 HMAC 1회와 token_version 캐시
+# (smash_db/token_cache.py) 확인만 한다 — JWT 디코딩 없음, 캐시 적중 시 DB 조회 없음.
+#
+# [형식] X-Apply-Ticket: "{base64url(JSON)}.{서명}"
+#   JSON = {"id", "name", "role", "v": token_version, "c": 카테고리, "w": 주 시작일 YYYYMMDD,
+#           "exp": 만료 Unix 초}
+#   서명 = HMAC-SHA256(SECRET_KEY, "apply-ticket\n" + base64 부분) — JWT·대기표 서명과 구분된다.
+#
+# [발급] GET /api/apply/ticket?category=...  (@token_required — 평소 경로로 한 번 검증)
+#   카테고리가 BEFORE_OPEN이고 다음 전환(OPEN)까지 APPLY_TICKET_WINDOW초 이내일 때만 발급.
+#   만료 = 오픈 시각 + APPLY_TICKET_TTL초.
+#
+# [검증] /api/apply의 @ticket_or_token
+#   서명·만료 → 본문 category와 "c" 일치 → 현재 주 시작일과 "w" 일치
+#   → "v"가 현재 token_version과 같음 → request.current_user 설정.
+#   비밀번호 변경·다른 기기 로그인으로 버전이 오르면 신청권도 즉시 무효가 된다 (JWT와 같은 규칙).
+#   헤더가 없거나 무효한 신청권이면 기존 @token_required로 처리한다 (신청권은 선택 사항).
+#   시간 검증(validate_apply_time)은 신청권과 무관하게 handle_apply가 그대로 수행한다.
+#
+# 서명 확인을 마친 신청권은 flask.g에 보관한다 — before_request의 글로벌 rate limit
+# (rate_limiter._get_global_key)이 먼저 검증하고, 데코레이터는 그 결과를 재사용한다.
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+from datetime import datetime
+from functools import wraps
+
+from flask import g, request
+
+from smash_db.token_cache import get_token_version
+
+from . import json_codec
+from .scheduler_logic import Status, get_current_status, get_next_change, get_week_id
+
+HEADER = "X-Apply-Ticket"
+
+# 오픈 몇 초 전부터 발급하는지 / 오픈 후 몇 초까지 유효한지
+ISSUE_WINDOW = int(os.environ.get("APPLY_TICKET_WINDOW", "600"))
+TICKET_TTL = int(os.environ.get("APPLY_TICKET_TTL", "300"))
+
+_DOMAIN = b"apply-ticket\n"
+_MAX_LENGTH = 512
+_UNSET = object()
+
+
+def _secret() -> bytes:
+    return (os.environ.get("SECRET_KEY") or "").encode()
+
+
+def _now() -> datetime:
+    # time_handler → smash_db.auth → rate_limiter → 이 모듈 순으로 import되므로 지연 import
+    from .time_handler import _now_kst
+    return _now_kst()
+
+
+def _sign(body: str) -> str:
+    return base64.urlsafe_b64encode(
+        hmac.new(_secret(), _DOMAIN + body.encode(), hashlib.sha256).digest()
+    ).rstrip(b"=").decode()
+
+
+def week_id(now: datetime) -> str:
+    """신청권의 주 식별자 (주 시작 토요일 YYYYMMDD)."""
+    return get_week_id(now)
+
+
+def issue(user: dict, category: str, now: datetime) -> tuple[dict | None, str | None]:
+    """신청권을 발급한다.
+
+    Returns:
+        ({"ticket", "category", "expiresAt"(Unix ms)}, None) — 발급
+        (None, 오류 메시지) — 발급 가능한 시간이 아님
+
+    user는 @token_required를 방금 통과했으므로 현재 token_version이 곧 토큰의 버전이다.
+    """
+    if get_current_status(category, now) != Status.BEFORE_OPEN:
+        return None, "신청권은 오픈 전에만 발급됩니다."
+    open_time, next_status = get_next_change(category, now)
+    if next_status != Status.OPEN or (open_time - now).total_seconds() > ISSUE_WINDOW:
+        return None, f"신청권은 오픈 {ISSUE_WINDOW // 60}분 전부터 발급됩니다."
+
+    exp = int(open_time.timestamp()) + TICKET_TTL
+    payload = {
+        "id":   user["id"],
+        "name": user["name"],
+        "role": user["role"],
+        "v":    get_token_version(user["id"]),
+        "c":    category,
+        "w":    week_id(now),
+        "exp":  exp,
+    }
+    body = base64.urlsafe_b64encode(json_codec.dumps_bytes(payload)).rstrip(b"=").decode()
+    return {"ticket": f"{body}.{_sign(body)}", "category": category, "expiresAt": exp * 1000}, None
+
+
+def _verify(ticket: str) -> dict | None:
+    """서명과 만료만 확인한다 (범위 검사는 호출자). 무효면 None."""
+    if len(ticket) > _MAX_LENGTH:
+        return None
+    body, _, sig = ticket.partition(".")
+    if not sig or not hmac.compare_digest(sig, _sign(body)):
+        return None
+    try:
+        payload = json_codec.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("exp"), int) or payload["exp"] <= time.time():
+        return None
+    return payload
+
+
+def current_ticket() -> dict | None:
+    """요청의 X-Apply-Ticket을 서명 확인해 반환한다 (요청당 1회, flask.g에 보관)."""
+    cached = g.get("apply_ticket", _UNSET)
+    if cached is not _UNSET:
+        return cached
+    ticket = request.headers.get(HEADER)
+    payload = _verify(ticket) if ticket else None
+    g.apply_ticket = payload
+    return payload
+
+
+def _version_current(payload: dict) -> bool:
+    """신청권의 token_version이 현재 버전과 같은지 확인한다 (캐시 우선 — token_cache 판정 규칙)."""
+    version = payload.get("v")
+    return isinstance(version, int) and get_token_version(payload["id"], version) == version
+
+
+def ticket_or_token(f):
+    """신청권이 본문 category·현재 주·현재 token_version에 맞으면 토큰 검증 없이 통과,
+    아니면 @token_required."""
+    from smash_db.auth import token_required
+    token_checked = token_required(f)
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        payload = current_ticket()
+        if payload is not None:
+            data = request.get_json(silent=True) or {}
+            if (payload.get("c") == data.get("category")
+                    and payload.get("w") == week_id(_now())
+                    and _version_current(payload)):
+                request.current_user = {
+                    "id":   payload["id"],
+                    "name": payload["name"],
+                    "role": payload["role"],
+                }
+                return f(*args, **kwargs)
+        return token_checked(*args, **kwargs)
+    return wrapper
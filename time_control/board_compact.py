@@ -0,0 +1,87 @@
+# board_compact.py — /api/all-boards 컬럼형(compact) 응답 형식
+#
+# 기본 JSON 형식은 항목마다 "name"/"type"/"timestamp"/"guest_name" 키를 반복하고
+# 타임스탬프를 float 전체 자릿수로 보낸다. compact 형식은 카테고리마다 필드별
+# 평행 배열을 보내고, 타임스탬프는 공통 기준(base, ms) 대비 밀리초 정수 오프셋으로 줄인다.
+#
+# [선택 방법 — 기본 형식은 그대로, opt-in]
+#   ?format=compact                                   또는
+#   Accept: application/vnd.smash.board-compact+json  (application/json보다 우선할 때)
+#
+# [필드 선택]
+#   ?fields=name,type  — 필요한 열만 받는다 (기본: 전체 FIELDS)
+#
+# [응답]
+#   {
+#     "format": "compact",
+#     "base": 1718600000123,               // ms, timestamp 열의 기준
+#     "types": ["member", "guest"],        // type 열의 코드표
+#     "fields": ["name", "guest_name", "type", "timestamp"],
+#     "boards": {
+#       "WED_REGULAR": {
+#         "status": "OPEN", "user_already_applied": false,
+#         "name": ["홍길동", ...], "guest_name": [null, ...],
+#         "type": [0, ...], "timestamp": [0, 13, ...]
+#       },
+#       ...
+#     }
+#   }
+#   i번째 항목 = 각 열의 i번째 값. timestamp(초) = (base + timestamp[i]) / 1000.
+#
+# 열 배열은 board_store.get_columns_snapshot()이 SQLite 행에서 바로 만들어
+# 보드 버전 단위로 캐시하며, 요청마다 상태·신청 여부만 덧붙여 인코딩한다.
+
+from flask import Request
+
+from . import json_codec
+from .board_store import BOARD_TYPES
+
+COMPACT_MEDIA_TYPE = "application/vnd.smash.board-compact+json"
+
+FIELDS: tuple[str, ...] = ("name", "guest_name", "type", "timestamp")
+
+_TYPES_JSON = list(BOARD_TYPES)
+
+
+def wants_compact(req: Request) -> bool:
+    """요청이 compact 형식을 원하는지 판단한다 (?format= 우선, 다음 Accept)."""
+    fmt = req.args.get("format")
+    if fmt is not None:
+        return fmt == "compact"
+    return req.accept_mimetypes.best_match(
+        ["application/json", COMPACT_MEDIA_TYPE]
+    ) == COMPACT_MEDIA_TYPE
+
+
+def parse_fields(raw: str | None) -> tuple[str, ...] | None:
+    """?fields= 값을 FIELDS 순서의 튜플로 정규화한다. 알 수 없는 필드가 있으면 None."""
+    if not raw:
+        return FIELDS
+    requested = {f.strip() for f in raw.split(",") if f.strip()}
+    if not requested or not requested <= set(FIELDS):
+        return None
+    return tuple(f for f in FIELDS if f in requested)
+
+
+def render_compact(
+    base_ms: int,
+    columns: dict[str, dict[str, list]],
+    statuses: dict[str, str],
+    applied_cats: set[str],
+    fields: tuple[str, ...],
+) -> bytes:
+    """열 배열 스냅샷과 사용자별 값으로 compact 응답 본문을 만든다."""
+    boards = {}
+    for cat, status in statuses.items():
+        col = columns.get(cat, {})
+        board = {"status": status, "user_already_applied": cat in applied_cats}
+        for field in fields:
+            board[field] = col.get(field, [])
+        boards[cat] = board
+    return json_codec.dumps_bytes({
+        "format": "compact",
+        "base": base_ms,
+        "types": _TYPES_JSON,
+        "fields": list(fields),
+        "boards": boards,
+    })
@@ -0,0 +1,52 @@
+# board_events.py — 보드 변경 알림 (Redis pub/sub 발행)
+#
+# applications에 커밋이 일어나면 BOARD_EVENTS_CHANNEL로 짧은 "깨우기" 메시지를 보낸다.
+# 변경 내용 자체는 싣지 않는다 — 구독자(stream_server.py)는 메시지를 받으면
+# board_changes 로그(board_store.get_changes_since)에서 실제 변경분을 읽는다.
+#   → 메시지가 유실되거나 여러 건이 합쳐져도 로그가 진실의 원천이므로 정합성이 유지된다.
+#
+# 발행 지점:
+#   - worker.py         : 배치 커밋 직후 (일반 신청)
+#   - board_store       : apply_entry / remove_entry / reset_all 직후 (관리자·폴백 경로)
+#
+# Redis 장애는 조용히 무시한다. 구독자는 주기적으로 보드 버전을 재확인하므로
+# 알림이 빠져도 최대 한 주기 늦게 반영될 뿐이다.
+
+import os
+import time
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+CHANNEL = os.environ.get("BOARD_EVENTS_CHANNEL", "board:events")
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,         # 알림 발행이 쓰기 응답을 지연시키지 않도록 짧게
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # 재시도 없이 즉시 실패 — 알림은 best-effort
+)
+
+# 발행 실패 후 이 시간 동안은 시도하지 않는다 (Redis 장애 중 쓰기마다 연결 대기 방지)
+_COOLDOWN = 5.0
+_down_until = 0.0
+
+
+def publish_board_changed(client: redis.Redis | None = None) -> None:
+    """보드 변경 알림을 발행한다. 실패해도 예외를 던지지 않는다.
+
+    Args:
+        client: 이미 연결을 가진 호출자(worker.py)는 자신의 Redis 클라이언트를 넘긴다.
+    """
+    global _down_until
+    if client is None and time.monotonic() < _down_until:
+        return
+    try:
+        (client or _redis_client).publish(CHANNEL, "changed")
+    except redis.RedisError:
+        if client is None:
+            _down_until = time.monotonic() + _COOLDOWN
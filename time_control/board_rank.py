@@ -0,0 +1,162 @@
+# board_rank.py — 신청 즉시 잠정 순번 (카테고리별 Redis Sorted Set)
+#
+# 일반 신청은 큐를 거쳐 worker.py가 SQLite에 INSERT하므로, 응답 시점에는
+# 자신의 순번을 알 수 없어 클라이언트가 /api/all-boards를 연타하게 된다.
+# 신청 스크립트(apply/__init__.py)가 큐 적재와 같은 원자 단위로 이 집합에 ZADD하고
+# ZRANK를 돌려주므로, 응답에 잠정 순번을 바로 실을 수 있다.
+#
+# [키]
+#   board:rank:{category}  — member = 게시판 user_id, score = 게시판 정렬 키
+#     score = priority × 1e10 + timestamp
+#       → (priority, timestamp) 순서. 동점이면 Redis가 member(user_id) 사전순으로 정렬한다.
+#         SQLite 게시판 순서는 동점일 때 arrival_seq가 먼저지만, score(double)에는 순번을 담을
+#         자리가 없어 여기서는 user_id 순이다 — timestamp까지 같은 드문 경우에만 잠정 순번이
+#         게시판과 다를 수 있다 (최종 순서는 SQLite).
+#     WARM_MARKER(score -inf) = "SQLite에서 적재 완료" 표시 → 순번 = ZRANK - 1
+#
+# [정합성]
+#   - 키가 없으면(첫 신청, Redis 재시작) 신청 스크립트가 cold를 알리고,
+#     호출자는 warm()으로 SQLite 행을 적재한 뒤 다시 시도한다.
+#   - 취소·대리 신청(SQLite 직접 쓰기)은 remove()/add()로 반영한다.
+#   - worker.py는 큐가 비었을 때 reconcile()로 SQLite 기준 전체를 다시 써서
+#     누락·잔여 항목을 바로잡는다 (신청 스트림이 모두 빈 순간에만 원자적으로 교체 — 처리 대기 항목 보존).
+#     SQLite 읽기부터 교체까지 worker의 _write_lock을 쥐므로, 그 사이 커밋·XDEL된 신청이 빠진 행으로
+#     덮어쓰지 않는다.
+#   - 주간 리셋 시 신청 스트림과 함께 삭제된다 (scheduler_logic._flush_apply_queue).
+
+import os
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from .apply_stream import STREAM_KEYS
+from .board_store import compute_priority, get_rank_rows
+from .scheduler_logic import Category
+
+WARM_MARKER = "__warm__"
+
+_KEY_PREFIX = "board:rank:"
+_PRIORITY_WEIGHT = 1e10
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # 취소·대리 신청 응답이 Redis 장애로 지연되지 않도록
+)
+
+# 다른 요청이 먼저 적재했으면 건너뛴다. ARGV = score, member, score, member, ...
+_WARM_SCRIPT = _redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('ZADD', KEYS[1], '-inf', ARGV[1])
+for i = 2, #ARGV, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+""")
+
+# 이미 적재된 키에만 반영한다 — 키가 없으면 다음 warm()이 SQLite에서 읽어 온다.
+_ADD_SCRIPT = _redis_client.register_script("""
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('ZADD', KEYS[1], 'NX', ARGV[1], ARGV[2])
+end
+return -1
+""")
+
+# 신청 스트림이 모두 비어 있을 때만 카테고리 집합 전체를 교체한다.
+# worker는 SQLite 커밋 후 XACK + XDEL하므로 XLEN = 0이면 모든 신청이 SQLite에 있다.
+#   KEYS[1..n] = 신청 스트림, KEYS[n+1..] = 카테고리 키 (ARGV[1] = n)
+#   ARGV[2] = 마커, ARGV[3..] = 카테고리별 "개수, score, member, ..."
+_RECONCILE_SCRIPT = _redis_client.register_script("""
+local n = tonumber(ARGV[1])
+for k = 1, n do
+    if redis.call('XLEN', KEYS[k]) > 0 then
+        return 0
+    end
+end
+local i = 3
+for k = n + 1, #KEYS do
+    redis.call('DEL', KEYS[k])
+    redis.call('ZADD', KEYS[k], '-inf', ARGV[2])
+    local rows = tonumber(ARGV[i])
+    i = i + 1
+    for _ = 1, rows do
+        redis.call('ZADD', KEYS[k], ARGV[i], ARGV[i + 1])
+        i = i + 2
+    end
+end
+return 1
+""")
+
+
+def rank_key(category: str) -> str:
+    """카테고리 잠정 순번 집합 키."""
+    return f"{_KEY_PREFIX}{category}"
+
+
+def score(priority: int, timestamp: float) -> float:
+    """게시판 정렬 키(priority, timestamp)를 하나의 score로 합친다."""
+    return priority * _PRIORITY_WEIGHT + timestamp
+
+
+def entry_score(category: str, entry: dict) -> float:
+    """큐 메시지(entry)의 score."""
+    return score(compute_priority(category, entry.get("guest_name")), entry["timestamp"])
+
+
+def _flatten(rows: list[tuple[str, int, float]]) -> list:
+    args: list = []
+    for user_id, priority, timestamp in rows:
+        args.extend((score(priority, timestamp), user_id))
+    return args
+
+
+def warm(category: str) -> None:
+    """SQLite의 카테고리 행으로 집합을 만든다 (키가 이미 있으면 아무것도 하지 않음).
+
+    Raises:
+        redis.RedisError — 호출자(handle_apply)가 SQLite 경로로 폴백한다.
+    """
+    rows = get_rank_rows(category)[category]
+    _WARM_SCRIPT(keys=[rank_key(category)], args=[WARM_MARKER, *_flatten(rows)])
+
+
+def add(category: str, entry: dict) -> None:
+    """SQLite에 직접 INSERT한 항목을 집합에 반영한다. 실패해도 예외를 던지지 않는다."""
+    try:
+        _ADD_SCRIPT(keys=[rank_key(category)], args=[entry_score(category, entry), entry["user_id"]])
+    except redis.RedisError:
+        pass
+
+
+def remove(category: str, user_id: str) -> None:
+    """취소된 항목을 집합에서 뺀다. 실패해도 예외를 던지지 않는다 (worker reconcile이 복구)."""
+    try:
+        _redis_client.zrem(rank_key(category), user_id)
+    except redis.RedisError:
+        pass
+
+
+def reconcile(boards: dict[str, list[tuple[str, int, float]]]) -> bool:
+    """SQLite 기준 행 목록으로 모든 카테고리 집합을 교체한다 (신청 스트림이 모두 비어 있을 때만).
+
+    Args:
+        boards: get_rank_rows() 결과 — {category: [(user_id, priority, timestamp), ...]}
+
+    Returns:
+        True — 교체함, False — 스트림에 대기 항목이 있어 건너뜀
+    """
+    cats = [cat.value for cat in Category]
+    args: list = [len(STREAM_KEYS), WARM_MARKER]
+    for cat in cats:
+        rows = boards.get(cat, [])
+        args.append(len(rows))
+        args.extend(_flatten(rows))
+    return bool(_RECONCILE_SCRIPT(keys=[*STREAM_KEYS, *(rank_key(cat) for cat in cats)], args=args))
+
@@ -4,25 +4,31 @@
 # 기존 인메모리 딕셔너리 + threading.Lock 방식을 완전히 제거하고,
 # SQLite WAL 모드 기반의 프로세스 간 안전한 저장소로 전환한다.
 #
-# - 읽기(GET): 각 요청마다 SQLite SELECT (WAL 모드로 쓰기와 비블로킹)
+# - 읽기(GET): 보드 버전(board_changes MAX(seq)) 비교 후 변경 시에만 SQLite SELECT
+#              (프로세스별 스냅샷 캐시)
+# - 증분(GET): board_changes 변경 로그에서 since 이후 항목만 조회 (/api/board-delta)
 # - 쓰기(Admin Apply): 직접 SQLite INSERT (저빈도, WAL로 worker와 공존)
 # - 삭제(Cancel): 직접 SQLite DELETE
 # - 대량 쓰기(일반 Apply): Redis 큐 → worker.py가 처리 (이 모듈 밖)
+# - 쓰기 커밋 후 공개 뷰 재렌더링(board_view) + 변경 알림 발행(board_events)
 #
 # threading.Lock이 없으므로 Gunicorn Workers 간 데이터 정합성이 보장된다.
 
 import json
+import math
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-from .scheduler_logic import Category
+from smash_db.connections import read_conn, write_conn
+from .board_events import publish_board_changed
+from .scheduler_logic import Category, get_week_start_ts
 
 # ── 설정 ──────────────────────────────────────────────────────────────────────
 
 _BASE_DIR = Path(__file__).resolve().parent.parent
-_DB_PATH = str(_BASE_DIR / "smash_db" / "users.db")
 _BACKUP_PATH = _BASE_DIR / "board_backup.json"
 
 _KST = timezone(timedelta(hours=9))
@@ -39,49 +45,213 @@ UNIQUE_APPLY_CATEGORIES: frozenset[str] = frozenset({
     "WED_LESSON",
 })
 
+# 게시판 정렬 우선순위 (applications.priority)
+# 게스트 카테고리의 OB/교류전 인원은 SPECIAL_PRIORITY로 저장되어 목록 맨 앞에 온다.
+# 그 외 모든 항목은 NORMAL_PRIORITY이므로 ORDER BY priority, timestamp가
+# 모든 카테고리에서 기존 정렬 규칙과 동일한 결과를 낸다.
+#
+# 게시판 순서 = (priority, timestamp, arrival_seq, user_id)
+#   arrival_seq: 신청 스크립트가 큐 적재와 같은 왕복에서 Redis 카운터(apply_stream.SEQ_KEY)로
+#   채번한 전역 도착 순번. timestamp는 요청을 받은 GEN·VIP 워커 프로세스의 시계라
+#   같은 값이 나올 수 있으므로, 동시각이면 Redis에 먼저 도착한 신청이 앞선다.
+#   Redis를 거치지 않은 행(대리 신청, Redis 장애 폴백, 이전 데이터)은 0.
+SPECIAL_PRIORITY = 0
+NORMAL_PRIORITY = 1
+_SPECIAL_GUEST_MARKERS = ("(ob)", "(교류전)")
 
-# ── SQLite 연결 ───────────────────────────────────────────────────────────────
 
-def _get_conn() -> sqlite3.Connection:
-    """WAL 모드의 SQLite 연결을 반환한다.
+def compute_priority(category: str, guest_name: str | None) -> int:
+    """INSERT 시점에 1회 계산하는 정렬 우선순위를 반환한다.
 
-    요청마다 새 연결을 생성한다. SQLite 연결 생성은 ~0.1ms로 경량이며,
-    커넥션 풀링보다 Gunicorn fork 환경에서 안전하다.
+    게스트 카테고리에서 게스트명에 (ob)/(교류전)이 포함되면 SPECIAL_PRIORITY.
+    apply_entry, worker._insert_batch, load_from_backup이 공통으로 사용한다.
     """
-    conn = sqlite3.connect(_DB_PATH, timeout=10)  # Gunicorn timeout(30s)보다 낮게: lock 시 JSON 500 반환 보장
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    return conn
+    if category in _GUEST_CATEGORIES and guest_name:
+        lowered = guest_name.lower()
+        if any(marker in lowered for marker in _SPECIAL_GUEST_MARKERS):
+            return SPECIAL_PRIORITY
+    return NORMAL_PRIORITY
+
+
+# ── SQLite 연결 ───────────────────────────────────────────────────────────────
+# 연결은 smash_db.connections가 관리한다.
+#   - 읽기: read_conn()  — 스레드당 영속 연결 (close 하지 않음)
+#   - 쓰기: write_conn() — 프로세스 전용 writer, 블록 종료 시 자동 commit/rollback
 
 
 # ── 테이블 초기화 ─────────────────────────────────────────────────────────────
 
+# 변경 로그(board_changes) 보관 건수. 가장 오래된 기록부터 잘라내며,
+# 클라이언트의 since가 잘린 구간을 가리키면 전체 재동기화(resync)를 요구한다.
+_CHANGE_LOG_KEEP = int(os.environ.get("BOARD_CHANGE_LOG_KEEP", "2000"))
+_CHANGE_LOG_PRUNE_EVERY = 256
+
+# 변경 로그에 남기는 공개 필드 (user_id 제외 — 공개 API와 동일)
+_CHANGE_COLUMNS = "category, name, type, guest_name, timestamp, priority, pos"
+
+
+def _rank_sql(ref: str) -> str:
+    """ref 행의 게시판 내 위치(0부터)를 구하는 스칼라 서브쿼리.
+
+    = 같은 카테고리에서 게시판 순서(priority, timestamp, arrival_seq, user_id)상 앞선 행 수.
+    idx_applications_board 범위 스캔(COUNT)으로 계산되어 목록을 만들지 않는다.
+    """
+    return f"""(SELECT COUNT(*) FROM applications
+                     WHERE category = {ref}.category
+                       AND (priority < {ref}.priority
+                            OR (priority = {ref}.priority
+                                AND (timestamp < {ref}.timestamp
+                                     OR (timestamp = {ref}.timestamp
+                                         AND (arrival_seq < {ref}.arrival_seq
+                                              OR (arrival_seq = {ref}.arrival_seq
+                                                  AND user_id < {ref}.user_id)))))))"""
+
+
+def _log_change_sql(op: str, ref: str) -> str:
+    """트리거 본문용: ref(NEW/OLD) 행의 변경을 board_changes에 남기는 INSERT 문.
+
+    pos = _rank_sql(ref). AFTER 트리거에서 계산하므로 insert는 "들어간 위치",
+    delete는 "빠지기 전 위치"가 되어 클라이언트는 정렬 키를 몰라도
+    seq 순서대로 splice만 하면 서버와 같은 목록을 얻는다.
+    """
+    return f"""
+            INSERT INTO board_changes (op, {_CHANGE_COLUMNS})
+            VALUES ('{op}', {ref}.category, {ref}.name, {ref}.type,
+                    {ref}.guest_name, {ref}.timestamp, {ref}.priority,
+                    {_rank_sql(ref)});"""
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """applications 테이블 + 변경 로그(board_changes)를 생성한다 (없을 때만).
+
+    API 서버(ensure_table)와 worker.py(_init_db)가 동일한 스키마를 쓰도록
+    DDL을 이 함수 하나로 일원화한다. commit은 호출자가 수행한다.
+
+    board_changes:
+      applications의 INSERT/DELETE를 트리거가 같은 트랜잭션 안에서 기록하는
+      append-only 로그. seq(AUTOINCREMENT)는 단조 증가하며,
+      MAX(seq)가 곧 보드 버전(get_board_version)이다.
+      → 쓰기 경로(worker 배치, apply_entry, remove_entry, reset_all)가 무엇이든
+        로그·버전이 누락 없이 갱신된다.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS applications (
+            id         INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id    TEXT    NOT NULL,
+            name       TEXT    NOT NULL,
+            category   TEXT    NOT NULL,
+            type       TEXT    NOT NULL,
+            guest_name TEXT,
+            timestamp  REAL    NOT NULL,
+            priority   INTEGER NOT NULL DEFAULT 1,
+            arrival_seq INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT    DEFAULT (datetime('now', '+9 hours')),
+            UNIQUE(category, user_id)
+        )
+    """)
+    # 기존 테이블이 UNIQUE 제약 없이 생성된 경우를 대비해 명시적 인덱스도 보장
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_category_user
+        ON applications(category, user_id)
+    """)
+    _migrate_priority_column(conn)
+    _migrate_arrival_seq_column(conn)
+    # 게시판 조회용 커버링 인덱스: (category, priority, timestamp, arrival_seq) 순서가 곧 게시판 순서.
+    # 조회 컬럼까지 포함하여 테이블 접근 없이 인덱스 범위 스캔만으로 정렬된 결과를 얻는다.
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_applications_board
+        ON applications(category, priority, timestamp, arrival_seq, user_id, name, type, guest_name)
+    """)
+
+    # 구버전 단일 행 카운터 → board_changes.seq로 대체
+    for event in ("insert", "update", "delete"):
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_applications_version_{event}")
+    conn.execute("DROP TABLE IF EXISTS board_version")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS board_changes (
+            seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+            op         TEXT    NOT NULL,   -- 'insert' | 'delete' | 'reset'
+            category   TEXT,
+            name       TEXT,
+            type       TEXT,
+            guest_name TEXT,
+            timestamp  REAL,
+            priority   INTEGER,
+            pos        INTEGER             -- 변경 시점의 게시판 내 위치 (0부터)
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_applications_log_insert
+        AFTER INSERT ON applications
+        BEGIN
+            {_log_change_sql("insert", "NEW")}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_applications_log_delete
+        AFTER DELETE ON applications
+        BEGIN
+            {_log_change_sql("delete", "OLD")}
+        END
+    """)
+    # applications는 INSERT/DELETE만 한다 (수정이 필요하면 delete + insert).
+    # AFTER UPDATE 시점에는 OLD의 "빠지기 전 위치"를 구할 수 없으므로 update 로그 트리거는 두지 않고,
+    # 이전 버전이 만든 트리거는 지운다.
+    conn.execute("DROP TRIGGER IF EXISTS trg_applications_log_update")
+    # 로그 절단: _CHANGE_LOG_PRUNE_EVERY건마다 최근 _CHANGE_LOG_KEEP건만 남긴다.
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_board_changes_prune
+        AFTER INSERT ON board_changes
+        WHEN NEW.seq % {_CHANGE_LOG_PRUNE_EVERY} = 0
+        BEGIN
+            DELETE FROM board_changes WHERE seq <= NEW.seq - {_CHANGE_LOG_KEEP};
+        END
+    """)
+
+
+def _migrate_priority_column(conn: sqlite3.Connection) -> None:
+    """priority 컬럼이 없는 기존 테이블에 컬럼을 추가하고 기존 행을 채운다.
+
+    SQL lower()는 ASCII만 변환하지만 마커의 비ASCII 부분("교류전")은
+    대소문자 구분이 없으므로 compute_priority()와 같은 결과를 낸다.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(applications)")}
+    if "priority" in columns:
+        return
+
+    conn.execute(
+        f"ALTER TABLE applications ADD COLUMN priority INTEGER NOT NULL DEFAULT {NORMAL_PRIORITY}"
+    )
+    conn.execute(
+        f"""UPDATE applications SET priority = {SPECIAL_PRIORITY}
+            WHERE category IN ({",".join("?" * len(_GUEST_CATEGORIES))})
+              AND (lower(guest_name) LIKE '%(ob)%'
+                   OR lower(guest_name) LIKE '%(교류전)%')""",
+        tuple(_GUEST_CATEGORIES),
+    )
+
+
+def _migrate_arrival_seq_column(conn: sqlite3.Connection) -> None:
+    """arrival_seq 컬럼이 없는 기존 테이블에 컬럼을 추가한다 (기존 행은 0).
+
+    게시판 순서가 바뀌므로 정렬 키를 담은 인덱스와 pos를 계산하는 변경 로그 트리거를 지워
+    ensure_schema()가 새 정의로 다시 만들게 한다.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(applications)")}
+    if "arrival_seq" in columns:
+        return
+
+    conn.execute("ALTER TABLE applications ADD COLUMN arrival_seq INTEGER NOT NULL DEFAULT 0")
+    conn.execute("DROP INDEX IF EXISTS idx_applications_board")
+    for event in ("insert", "delete"):
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_applications_log_{event}")
+
+
 def ensure_table() -> None:
     """applications 테이블이 없으면 생성한다. 서버 시작 시 1회 호출."""
-    conn = _get_conn()
-    try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS applications (
-                id         INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id    TEXT    NOT NULL,
-                name       TEXT    NOT NULL,
-                category   TEXT    NOT NULL,
-                type       TEXT    NOT NULL,
-                guest_name TEXT,
-                timestamp  REAL    NOT NULL,
-                created_at TEXT    DEFAULT (datetime('now', '+9 hours')),
-                UNIQUE(category, user_id)
-            )
-        """)
-        # 기존 테이블이 UNIQUE 제약 없이 생성된 경우를 대비해 명시적 인덱스도 보장
-        conn.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_category_user
-            ON applications(category, user_id)
-        """)
-        conn.commit()
-    finally:
-        conn.close()
+    with write_conn() as conn:
+        ensure_schema(conn)
 
 
 # ── 내부 유틸 ─────────────────────────────────────────────────────────────────
@@ -99,74 +269,241 @@ def _row_to_dict(row: sqlite3.Row) -> dict:
     return entry
 
 
+# ── 스냅샷 캐시 ───────────────────────────────────────────────────────────────
+# 2초 폴링마다 전체 SELECT + 게스트 정렬을 반복하지 않도록, 프로세스별로
+# (보드 버전, 전체 보드) 스냅샷을 보관한다.
+# 매 요청은 board_changes의 MAX(seq)만 읽고, 값이 같으면 메모리에서 즉시 반환한다.
+# 실제 쓰기가 발생해 버전이 바뀐 경우에만 전체 재조회한다.
+#
+# 버전은 SQLite 트리거가 쓰기 트랜잭션 안에서 증가시키므로
+# 다른 Gunicorn 워커나 worker.py의 쓰기도 모두 감지된다.
+
+_snapshot_lock = threading.Lock()
+_snapshot: tuple[int, dict[str, list[dict]]] | None = None
+
+
+def _read_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(seq) FROM board_changes").fetchone()
+    return row[0] or 0
+
+
+def get_board_version() -> int:
+    """현재 보드 버전(변경 로그의 최신 seq)을 반환한다. 쓰기가 있을 때마다 증가한다."""
+    return _read_version(read_conn())
+
+
+def _load_all_boards(conn: sqlite3.Connection) -> dict[str, list[dict]]:
+    """단일 쿼리로 전체 데이터를 가져와 카테고리별로 분류한다.
+
+    idx_applications_board 순서(category, priority, timestamp, arrival_seq, user_id)로 읽으므로
+    게스트 카테고리의 OB/교류전 우선 정렬까지 SQLite 인덱스가 처리한다.
+    동시각 항목도 arrival_seq, user_id로 순서가 고정되어 변경 로그의 pos와 일치한다.
+    """
+    rows = conn.execute(
+        """SELECT user_id, name, category, type, guest_name, timestamp
+           FROM applications ORDER BY category, priority, timestamp, arrival_seq, user_id"""
+    ).fetchall()
+
+    result: dict[str, list[dict]] = {cat.value: [] for cat in Category}
+    for row in rows:
+        cat = row["category"]
+        if cat in result:
+            result[cat].append(_row_to_dict(row))
+
+    return result
+
+
+def _row_to_public_dict(row: sqlite3.Row) -> dict:
+    """user_id를 제외한 공개 필드만 dict로 변환한다 (변경 로그용)."""
+    entry = {
+        "name":      row["name"],
+        "type":      row["type"],
+        "timestamp": row["timestamp"],
+    }
+    if row["guest_name"]:
+        entry["guest_name"] = row["guest_name"]
+    return entry
+
+
+def _after_commit() -> None:
+    """직접 쓰기 커밋 후 처리: Redis 공개 뷰 재렌더링 → 변경 알림.
+
+    알림 수신자(stream_server)가 새 뷰를 보도록 렌더링을 먼저 한다.
+    """
+    from .board_view import refresh_board_view  # 순환 import 방지 (board_view → board_store)
+    refresh_board_view()
+    publish_board_changed()
+
+
 # ── 공개 API (읽기) ───────────────────────────────────────────────────────────
 
 def get_board(category: str) -> list[dict]:
     """특정 카테고리의 신청 목록을 반환한다.
 
-    게스트 카테고리는 OB/교류전 우선 정렬 후 타임스탬프순,
+    게스트 카테고리는 OB/교류전 우선 정렬 후 타임스탬프순(priority 컬럼),
     나머지 카테고리는 순수 타임스탬프순으로 정렬한다.
+    스냅샷 리스트의 얕은 복사본을 반환하므로 호출자가 리스트를 수정해도 안전하다.
     """
-    conn = _get_conn()
-    try:
-        if category in _GUEST_CATEGORIES:
-            rows = conn.execute(
-                """SELECT user_id, name, type, guest_name, timestamp
-                   FROM applications WHERE category = ?
-                   ORDER BY
-                     CASE WHEN lower(guest_name) LIKE '%(ob)%'
-                               OR lower(guest_name) LIKE '%(교류전)%'
-                          THEN 0 ELSE 1 END,
-                     timestamp""",
-                (category,),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """SELECT user_id, name, type, guest_name, timestamp
-                   FROM applications WHERE category = ?
-                   ORDER BY timestamp""",
-                (category,),
-            ).fetchall()
-        return [_row_to_dict(r) for r in rows]
-    finally:
-        conn.close()
+    return list(get_all_boards().get(category, []))
+
+
+def count_entries(category: str, priority: int | None = None) -> int:
+    """카테고리 신청 인원수를 인덱스 COUNT로 반환한다.
+
+    priority를 지정하면 해당 우선순위 항목만 센다.
+    (예: SPECIAL_PRIORITY → 게스트 보드의 OB/교류전 인원수)
+    """
+    if priority is None:
+        row = read_conn().execute(
+            "SELECT COUNT(*) FROM applications WHERE category = ?",
+            (category,),
+        ).fetchone()
+    else:
+        row = read_conn().execute(
+            "SELECT COUNT(*) FROM applications WHERE category = ? AND priority = ?",
+            (category, priority),
+        ).fetchone()
+    return row[0]
+
+
+def get_user_positions(user_id: str) -> list[dict]:
+    """user_id 본인 항목과 본인이 신청한 게스트 항목("guest_{user_id}_*")의 게시판 위치를 반환한다.
+
+    get_board()처럼 목록을 만들지 않고, 본인 행마다 앞선 행 수를 인덱스 COUNT로 센다.
+    본인 행은 (category, user_id) 인덱스로 찾는다.
+
+    Returns:
+        [{"category": str, "rank": int (0부터), "guest_name"?: str}, ...]
+        — 카테고리, 게시판 순서대로 정렬
+    """
+    # "guest_{id}_" 접두사 범위: '_' 다음 문자('`')까지의 반열린 구간
+    guest_lo = f"guest_{user_id}_"
+    guest_hi = f"guest_{user_id}`"
+    # OR의 양쪽에 category 조건을 각각 두어야 SQLite가 두 범위 모두
+    # idx_applications_category_user로 찾는다 (MULTI-INDEX OR).
+    categories = sorted(_VALID_CATEGORIES)
+    in_cats = ",".join("?" * len(categories))
+    rows = read_conn().execute(
+        f"""SELECT a.category, a.guest_name, {_rank_sql("a")} AS rank
+            FROM applications AS a
+            WHERE (a.category IN ({in_cats}) AND a.user_id = ?)
+               OR (a.category IN ({in_cats}) AND a.user_id >= ? AND a.user_id < ?)
+            ORDER BY a.category, rank""",
+        (*categories, user_id, *categories, guest_lo, guest_hi),
+    ).fetchall()
+
+    positions = []
+    for row in rows:
+        pos = {"category": row["category"], "rank": row["rank"]}
+        if row["guest_name"]:
+            pos["guest_name"] = row["guest_name"]
+        positions.append(pos)
+    return positions
 
 
 def get_all_boards() -> dict[str, list[dict]]:
     """전체 카테고리 데이터의 스냅샷을 반환한다.
 
-    단일 연결 + 단일 쿼리로 전체 데이터를 가져온 뒤
-    카테고리별로 분류하여 반환한다.
+    보드 버전이 캐시된 스냅샷과 같으면 SQLite 재조회 없이 그대로 반환한다.
+    반환값은 프로세스 내 공유 스냅샷이므로 호출자는 수정하지 않아야 한다.
+    """
+    return get_snapshot()[1]
+
+
+def get_snapshot() -> tuple[int, dict[str, list[dict]]]:
+    """(보드 버전, 전체 보드) 스냅샷을 반환한다.
+
+    ETag 계산처럼 버전과 데이터가 서로 일치해야 하는 호출자가 사용한다.
     """
-    conn = _get_conn()
+    global _snapshot
+
+    conn = read_conn()
+    version = _read_version(conn)
+    snap = _snapshot
+    if snap is not None and snap[0] == version:
+        return snap
+
+    # 버전과 데이터를 하나의 읽기 트랜잭션(WAL 스냅샷)에서 읽어 정확히 일치시킨다.
+    # → 클라이언트가 이 버전을 since로 /api/board-delta를 호출해도 중복·누락이 없다.
+    conn.execute("BEGIN")
     try:
-        rows = conn.execute(
-            """SELECT user_id, name, category, type, guest_name, timestamp
-               FROM applications ORDER BY timestamp"""
-        ).fetchall()
+        version = _read_version(conn)
+        boards = _load_all_boards(conn)
+    finally:
+        conn.execute("COMMIT")
 
-        result: dict[str, list[dict]] = {cat.value: [] for cat in Category}
-        for row in rows:
-            cat = row["category"]
-            if cat in result:
-                result[cat].append(_row_to_dict(row))
-
-        # 게스트 카테고리만 OB/교류전 우선 정렬 적용
-        for cat in _GUEST_CATEGORIES:
-            if result[cat]:
-                result[cat].sort(
-                    key=lambda x: (
-                        not (
-                            "(ob)" in x.get("guest_name", "").lower()
-                            or "(교류전)" in x.get("guest_name", "").lower()
-                        ),
-                        x["timestamp"],
-                    )
-                )
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot[0] <= version:
+            _snapshot = (version, boards)
+    return version, boards
+
+
+# ── 컬럼 스냅샷 (compact 응답용) ──────────────────────────────────────────────
+# /api/all-boards?format=compact 는 카테고리마다 필드별 평행 배열을 내보낸다.
+# SQLite 행에서 바로 열 배열을 채우고(항목별 dict 없음), 스냅샷 캐시와 같은 방식으로
+# 보드 버전이 바뀔 때만 다시 만든다.
+#
+#   name       : [str, ...]
+#   guest_name : [str | None, ...]
+#   type       : [int, ...]   — BOARD_TYPES의 인덱스
+#   timestamp  : [int, ...]   — base_ms 기준 밀리초 오프셋
+
+# type 코드표. 코드는 이 튜플의 인덱스이며 순서를 바꾸면 안 된다 (클라이언트 호환).
+BOARD_TYPES: tuple[str, ...] = ("member", "guest")
+_TYPE_CODES = {t: i for i, t in enumerate(BOARD_TYPES)}
+
+_columns_lock = threading.Lock()
+_columns: tuple[int, int, dict[str, dict[str, list]]] | None = None
+
+
+def _load_all_columns(conn: sqlite3.Connection) -> tuple[int, dict[str, dict[str, list]]]:
+    """전체 보드를 (base_ms, 카테고리별 열 배열)로 읽는다. 정렬은 _load_all_boards와 같다."""
+    rows = conn.execute(
+        """SELECT category, name, guest_name, type, timestamp
+           FROM applications ORDER BY category, priority, timestamp, arrival_seq, user_id"""
+    ).fetchall()
+
+    columns: dict[str, dict[str, list]] = {
+        cat.value: {"name": [], "guest_name": [], "type": [], "timestamp": []}
+        for cat in Category
+    }
+    base_ms = math.floor(min(row[4] for row in rows) * 1000) if rows else 0
+    for category, name, guest_name, type_, timestamp in rows:
+        col = columns.get(category)
+        if col is None:
+            continue
+        col["name"].append(name)
+        col["guest_name"].append(guest_name or None)
+        col["type"].append(_TYPE_CODES.get(type_, _TYPE_CODES["member"]))
+        col["timestamp"].append(math.floor(timestamp * 1000) - base_ms)
+    return base_ms, columns
+
+
+def get_columns_snapshot() -> tuple[int, int, dict[str, dict[str, list]]]:
+    """(보드 버전, base_ms, 카테고리별 열 배열) 스냅샷을 반환한다.
+
+    get_snapshot()과 같이 버전과 데이터를 하나의 읽기 트랜잭션에서 읽는다.
+    반환값은 프로세스 내 공유 객체이므로 호출자는 수정하지 않아야 한다.
+    """
+    global _columns
 
-        return result
+    conn = read_conn()
+    version = _read_version(conn)
+    cols = _columns
+    if cols is not None and cols[0] == version:
+        return cols
+
+    conn.execute("BEGIN")
+    try:
+        version = _read_version(conn)
+        base_ms, columns = _load_all_columns(conn)
     finally:
-        conn.close()
+        conn.execute("COMMIT")
+
+    with _columns_lock:
+        if _columns is None or _columns[0] <= version:
+            _columns = (version, base_ms, columns)
+    return version, base_ms, columns
 
 
 # ── 공개 API (쓰기) ───────────────────────────────────────────────────────────
@@ -183,27 +520,26 @@ def apply_entry(category: str, entry: dict) -> tuple[bool, str | None]:
     if category not in _VALID_CATEGORIES:
         return False, "유효하지 않은 카테고리입니다."
 
-    conn = _get_conn()
     try:
-        conn.execute(
-            """INSERT INTO applications
-                   (user_id, name, category, type, guest_name, timestamp)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (
-                entry["user_id"],
-                entry["name"],
-                category,
-                entry["type"],
-                entry.get("guest_name"),
-                entry["timestamp"],
-            ),
-        )
-        conn.commit()
+        with write_conn() as conn:
+            conn.execute(
+                """INSERT INTO applications
+                       (user_id, name, category, type, guest_name, timestamp, priority)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    entry["user_id"],
+                    entry["name"],
+                    category,
+                    entry["type"],
+                    entry.get("guest_name"),
+                    entry["timestamp"],
+                    compute_priority(category, entry.get("guest_name")),
+                ),
+            )
+        _after_commit()
         return True, None
     except sqlite3.IntegrityError:
         return False, "이미 신청되어 있습니다."
-    finally:
-        conn.close()
 
 
 def remove_entry(category: str, user_id: str) -> bool:
@@ -212,16 +548,15 @@ def remove_entry(category: str, user_id: str) -> bool:
     Returns:
         True — 삭제 성공, False — 항목 없음
     """
-    conn = _get_conn()
-    try:
+    with write_conn() as conn:
         cursor = conn.execute(
             "DELETE FROM applications WHERE category = ? AND user_id = ?",
             (category, user_id),
         )
-        conn.commit()
-        return cursor.rowcount > 0
-    finally:
-        conn.close()
+    if cursor.rowcount > 0:
+        _after_commit()
+        return True
+    return False
 
 
 def is_already_applied(category: str, user_id: str) -> bool:
@@ -235,53 +570,137 @@ def is_already_applied(category: str, user_id: str) -> bool:
     → UNIQUE 제약이 최종 안전망으로 중복을 차단하므로 데이터 정합성에 영향 없음.
     """
     try:
-        now = datetime.now(_KST)
-        days_since_saturday = (now.weekday() - 5) % 7
-        week_start_ts = (now - timedelta(days=days_since_saturday)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ).timestamp()
-
-        conn = _get_conn()
-        try:
-            row = conn.execute(
-                "SELECT 1 FROM applications"
-                " WHERE category = ? AND user_id = ? AND timestamp >= ?"
-                " LIMIT 1",
-                (category, user_id, week_start_ts),
-            ).fetchone()
-            return row is not None
-        finally:
-            conn.close()
+        week_start_ts = get_week_start_ts(datetime.now(_KST))
+
+        row = read_conn().execute(
+            "SELECT 1 FROM applications"
+            " WHERE category = ? AND user_id = ? AND timestamp >= ?"
+            " LIMIT 1",
+            (category, user_id, week_start_ts),
+        ).fetchone()
+        return row is not None
     except Exception:
         return False
 
 
-def get_applied_categories(user_id: str) -> set[str]:
+def get_week_applicants(category: str, week_start_ts: float) -> list[str]:
+    """week_start_ts 이후 category에 신청한 user_id 목록 (applied_set 적재용)."""
+    rows = read_conn().execute(
+        "SELECT user_id FROM applications WHERE category = ? AND timestamp >= ?",
+        (category, week_start_ts),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def load_rank_rows(conn: sqlite3.Connection,
+                   category: str | None = None) -> dict[str, list[tuple[str, int, float]]]:
+    """카테고리별 (user_id, priority, timestamp) 목록 (board_rank 적재·재동기화용).
+
+    worker.py는 자신의 연결로 호출하므로 conn을 받는다.
+    """
+    if category is None:
+        rows = conn.execute(
+            "SELECT category, user_id, priority, timestamp FROM applications"
+        ).fetchall()
+        result: dict[str, list[tuple[str, int, float]]] = {cat.value: [] for cat in Category}
+    else:
+        rows = conn.execute(
+            "SELECT category, user_id, priority, timestamp FROM applications WHERE category = ?",
+            (category,),
+        ).fetchall()
+        result = {category: []}
+    for row in rows:
+        if row[0] in result:
+            result[row[0]].append((row[1], row[2], row[3]))
+    return result
+
+
+def get_rank_rows(category: str | None = None) -> dict[str, list[tuple[str, int, float]]]:
+    """load_rank_rows()의 읽기 전용 연결 버전."""
+    return load_rank_rows(read_conn(), category)
+
+
+def get_changes_since(since: int, limit: int = 500) -> tuple[int, list[dict] | None]:
+    """since 이후의 보드 변경 목록을 (최신 seq, 변경 목록)으로 반환한다.
+
+    변경 목록이 None이면 전체 재동기화가 필요하다는 뜻이다:
+      - since 직후 구간이 로그 절단으로 사라진 경우 (주간 리셋 표식으로 시작하는 로그는 예외)
+      - since가 최신 seq보다 큰 경우 (리셋·DB 교체 등)
+      - 변경이 limit건을 초과하여 전체 보드를 받는 편이 더 싼 경우
+
+    변경 항목:
+      {"seq": int, "op": "insert" | "delete" | "reset", "category": str,
+       "pos": int, "entry": {"name", "type", "timestamp", "guest_name"?}}
+      op == "reset"이면 category/entry 없이 전체 보드가 비워졌음을 뜻한다.
+    """
+    conn = read_conn()
+    conn.execute("BEGIN")
+    try:
+        lo, hi = conn.execute("SELECT MIN(seq), MAX(seq) FROM board_changes").fetchone()
+        latest = hi or 0
+        if since > latest:
+            return latest, None
+        if lo is not None and since < lo - 1:
+            # 로그가 'reset' 표식으로 시작하면 그 이전 이력은 어차피 모두 지워졌으므로
+            # 표식부터 내려주면 된다. 그 외에는 잘린 구간이 있어 전체 재동기화가 필요하다.
+            first_op = conn.execute(
+                "SELECT op FROM board_changes WHERE seq = ?", (lo,)
+            ).fetchone()[0]
+            if first_op != "reset":
+                return latest, None
+            since = lo - 1
+        if since == latest:
+            return latest, []
+
+        rows = conn.execute(
+            f"""SELECT seq, op, {_CHANGE_COLUMNS} FROM board_changes
+                WHERE seq > ? ORDER BY seq LIMIT ?""",
+            (since, limit + 1),
+        ).fetchall()
+    finally:
+        conn.execute("COMMIT")
+
+    if len(rows) > limit:
+        return latest, None
+
+    changes = []
+    for row in rows:
+        change = {"seq": row["seq"], "op": row["op"]}
+        if row["op"] != "reset":
+            change["category"] = row["category"]
+            change["pos"] = row["pos"]
+            change["entry"] = _row_to_public_dict(row)
+        changes.append(change)
+    return latest, changes
+
+
+def get_applied_categories(user_id: str, boards: dict[str, list[dict]] | None = None) -> set[str]:
     """이번 주에 해당 user_id가 신청한 UNIQUE_APPLY_CATEGORIES 집합을 반환한다.
 
-    is_already_applied()를 카테고리별로 3회 호출하는 대신 쿼리 1회로 통합한다.
+    is_already_applied()를 카테고리별로 3회 호출하는 대신 한 번에 계산한다.
+      - boards 전달: 호출자가 이미 들고 있는 스냅샷을 훑는다 (버전 조회도 생략).
+      - boards 생략: (category, user_id) 인덱스 조회 1회 — 전체 스냅샷을 만들지 않는다.
     SQLite 장애 시 빈 집합을 반환하여 버튼이 활성화된 상태로 유지한다.
     → 중복 신청 시도는 기존 서버-사이드 UNIQUE 제약이 최종 차단하므로 안전하다.
     """
     try:
-        now = datetime.now(_KST)
-        days_since_saturday = (now.weekday() - 5) % 7
-        week_start_ts = (now - timedelta(days=days_since_saturday)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ).timestamp()
-
-        placeholders = ",".join("?" * len(UNIQUE_APPLY_CATEGORIES))
-        conn = _get_conn()
-        try:
-            rows = conn.execute(
+        week_start_ts = get_week_start_ts(datetime.now(_KST))
+
+        if boards is None:
+            placeholders = ",".join("?" * len(UNIQUE_APPLY_CATEGORIES))
+            rows = read_conn().execute(
                 f"SELECT category FROM applications"
-                f" WHERE user_id = ? AND category IN ({placeholders})"
-                f" AND timestamp >= ?",
-                (user_id, *UNIQUE_APPLY_CATEGORIES, week_start_ts),
+                f" WHERE category IN ({placeholders}) AND user_id = ? AND timestamp >= ?",
+                (*sorted(UNIQUE_APPLY_CATEGORIES), user_id, week_start_ts),
             ).fetchall()
-            return {row["category"] for row in rows}
-        finally:
-            conn.close()
+            return {row[0] for row in rows}
+        return {
+            cat for cat in UNIQUE_APPLY_CATEGORIES
+            if any(
+                e["user_id"] == user_id and e["timestamp"] >= week_start_ts
+                for e in boards.get(cat, ())
+            )
+        }
     except Exception:
         return set()
 
@@ -290,13 +709,14 @@ def reset_all() -> None:
     """모든 카테고리의 데이터를 초기화한다.
 
     매주 토요일 00:00 스케줄러에서 호출된다.
+    행별 delete 로그 대신 변경 로그를 비우고 'reset' 표식 1건만 남겨,
+    델타 구독 클라이언트가 보드를 한 번에 비우도록 한다.
     """
-    conn = _get_conn()
-    try:
+    with write_conn() as conn:
         conn.execute("DELETE FROM applications")
-        conn.commit()
-    finally:
-        conn.close()
+        conn.execute("DELETE FROM board_changes")
+        conn.execute("INSERT INTO board_changes (op) VALUES ('reset')")
+    _after_commit()
 
     # 레거시 백업 파일 삭제
     try:
@@ -325,8 +745,7 @@ def load_from_backup() -> bool:
     except (json.JSONDecodeError, OSError):
         return False
 
-    conn = _get_conn()
-    try:
+    with write_conn() as conn:
         count = conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
         if count > 0:
             return True
@@ -336,8 +755,8 @@ def load_from_backup() -> bool:
                 try:
                     conn.execute(
                         """INSERT OR IGNORE INTO applications
-                               (user_id, name, category, type, guest_name, timestamp)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
+                               (user_id, name, category, type, guest_name, timestamp, priority)
+                           VALUES (?, ?, ?, ?, ?, ?, ?)""",
                         (
                             entry["user_id"],
                             entry["name"],
@@ -345,14 +764,12 @@ def load_from_backup() -> bool:
                             entry.get("type", "member"),
                             entry.get("guest_name"),
                             entry["timestamp"],
+                            compute_priority(category, entry.get("guest_name")),
                         ),
                     )
                 except (KeyError, sqlite3.Error):
                     continue
-        conn.commit()
-        return True
-    finally:
-        conn.close()
+    return True
 
 
 def start_background_saver() -> None:
@@ -0,0 +1,152 @@
+# board_view.py — 공개용 게시판 문서를 미리 렌더링해 Redis에 보관 (materialized view)
+#
+# [배경]
+#   쓰기는 worker.py(일반 신청)와 board_store 직접 쓰기(관리자·취소)뿐인데,
+#   기존에는 모든 Gunicorn 스레드가 같은 보드를 각자 조회·user_id 제거·json 직렬화했다.
+#
+# [구조]
+#   쓰기 커밋 직후 1회: refresh_board_view()
+#     └─ 스냅샷(board_store.get_snapshot) → 카테고리별 공개 목록을 JSON bytes로 인코딩
+#        └─ Redis 해시 board:view 에 버전과 함께 원자적으로 저장 (Lua — 더 새 버전만 기록)
+#
+#   읽기(/api/all-boards, /api/board-data): get_board_view()
+#     └─ HMGET 1회로 버전 + 카테고리별 bytes + 신청자 목록을 가져와
+#        상태·user_already_applied만 덧붙여 그대로 내보낸다 (SQLite·json.dumps 없음).
+#
+# 해시 필드:
+#   version           — 보드 버전 (board_changes MAX(seq))
+#   {category}        — 공개 신청 목록 JSON bytes (user_id 제외, 게시판 순서)
+#   applied:{category} — 이번 주 신청자 user_id 목록 (UNIQUE_APPLY_CATEGORIES만, \n 구분)
+#
+# Redis 장애·미생성 시 get_board_view()는 None을 반환하고, 호출자는 기존
+# SQLite 스냅샷 경로로 폴백한다.
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from . import json_codec
+from .board_store import UNIQUE_APPLY_CATEGORIES, get_board_version, get_snapshot
+from .scheduler_logic import Category, get_week_start_ts
+
+_VIEW_KEY = "board:view"
+
+_KST = timezone(timedelta(hours=9))
+
+_CATEGORIES = [cat.value for cat in Category]
+_APPLIED_FIELDS = {cat: f"applied:{cat}" for cat in UNIQUE_APPLY_CATEGORIES}
+
+# 응답 본문에 그대로 들어가는 bytes이므로 decode_responses=False
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=False,
+    socket_timeout=1,             # 조회 경로: 느리면 SQLite 폴백이 낫다
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),
+)
+
+# 더 새 버전일 때만 기록 — worker와 Gunicorn 직접 쓰기가 동시에 렌더링해도
+# 늦게 도착한 옛 버전이 새 버전을 덮어쓰지 않는다. ARGV[2] = "1"이면 강제 기록.
+_STORE_SCRIPT = _redis_client.register_script("""
+local cur = tonumber(redis.call('HGET', KEYS[1], 'version') or '-1')
+if ARGV[2] ~= '1' and cur >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'version', ARGV[1], unpack(ARGV, 3))
+return 1
+""")
+
+
+def render_applications(entries: list[dict]) -> bytes:
+    """카테고리 신청 목록을 공개용 JSON bytes로 인코딩한다 (user_id 제외).
+
+    SQLite 폴백 응답도 이 함수로 인코딩한다 — 같은 보드 버전이면 어느 경로든 본문 bytes가
+    같아야 버전 기반 strong ETag(과 ETag 키 압축 캐시)가 성립한다.
+    """
+    return json_codec.dumps_bytes([
+        {k: v for k, v in e.items() if k != "user_id"}
+        for e in entries
+    ])
+
+
+def render_board_view(boards: dict[str, list[dict]], now: datetime) -> dict[str, bytes]:
+    """스냅샷을 board:view 해시 필드로 렌더링한다."""
+    week_start_ts = get_week_start_ts(now)
+    fields: dict[str, bytes] = {}
+    for cat in _CATEGORIES:
+        entries = boards.get(cat, [])
+        fields[cat] = render_applications(entries)
+        if cat in _APPLIED_FIELDS:
+            fields[_APPLIED_FIELDS[cat]] = "\n".join(
+                e["user_id"] for e in entries if e["timestamp"] >= week_start_ts
+            ).encode()
+    return fields
+
+
+def refresh_board_view(force: bool = False) -> bool:
+    """현재 스냅샷을 렌더링해 Redis에 저장한다. 실패해도 예외를 던지지 않는다.
+
+    Args:
+        force: 버전 비교 없이 덮어쓴다 (worker 기동 시 — DB 교체로 버전이 줄어든 경우 대비).
+
+    Returns:
+        True — 저장됨, False — 더 새 버전이 이미 있거나 Redis/SQLite 장애
+    """
+    try:
+        version, boards = get_snapshot()
+        fields = render_board_view(boards, datetime.now(_KST))
+        args: list = [version, "1" if force else "0"]
+        for name, value in fields.items():
+            args.extend((name, value))
+        return bool(_STORE_SCRIPT(keys=[_VIEW_KEY], args=args))
+    except Exception:  # noqa: BLE001 — 뷰 갱신은 best-effort (Redis·SQLite 장애)
+        return False
+
+
+def sync_board_view() -> bool:
+    """Redis 뷰 버전이 SQLite 보드 버전과 다르면 다시 렌더링한다.
+
+    쓰기 직후 갱신이 Redis 장애로 빠졌거나 뷰가 만료·삭제된 경우를 복구한다.
+    worker.py가 유휴 시간에 주기적으로 호출한다.
+    """
+    try:
+        stored = _redis_client.hget(_VIEW_KEY, "version")
+        if stored is not None and int(stored) == get_board_version():
+            return False
+    except Exception:  # noqa: BLE001
+        return False
+    return refresh_board_view(force=True)
+
+
+def get_board_view(categories: list[str] | None = None) -> tuple[int, dict[str, bytes], dict[str, bytes]] | None:
+    """(버전, 카테고리별 목록 bytes, 카테고리별 신청자 bytes)를 반환한다.
+
+    Redis에 뷰가 없거나 장애 시 None.
+    """
+    cats = categories or _CATEGORIES
+    applied_cats = [cat for cat in cats if cat in _APPLIED_FIELDS]
+    names = ["version", *cats, *(_APPLIED_FIELDS[cat] for cat in applied_cats)]
+    try:
+        values = _redis_client.hmget(_VIEW_KEY, names)
+    except redis.RedisError:
+        return None
+    if values[0] is None or any(v is None for v in values[1:1 + len(cats)]):
+        return None
+
+    version = int(values[0])
+    docs = dict(zip(cats, values[1:1 + len(cats)]))
+    applied = dict(zip(applied_cats, values[1 + len(cats):]))
+    return version, docs, applied
+
+
+def user_in(applied: bytes | None, user_id: str) -> bool:
+    """신청자 목록 bytes에 user_id가 있는지 확인한다."""
+    if not applied:
+        return False
+    return user_id.encode() in applied.split(b"\n")
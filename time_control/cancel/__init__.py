@@ -8,6 +8,8 @@
 #      - 게스트 카테고리: "guest_{user_id}_*" prefix 탐색
 #   3.5. 빈자리 감지를 위한 취소 전 보드 위치 기록
 #   4. 동시성 제어: board_store.remove_entry() 원자적 조작
+#   4.5. Redis 주간 신청자 집합(applied_set)에서 제거 — 재신청 허용
+#        + 잠정 순번 집합(board_rank)에서 제거 — 뒤 신청자의 잠정 순번이 당겨짐
 #   5. 빈자리 알림 트리거 (정원 확정 상태 + 정원 내 인원이었을 때만)
 #   6. 응답 반환
 #
@@ -17,29 +19,24 @@
 
 from flask import request
 
+from .. import board_rank
+from ..applied_set import unmark_applied
 from ..board_store import get_board, remove_entry
 from ..time_handler import validate_cancel_time, _now_kst
 
 
 _GUEST_CATEGORIES = {"WED_GUEST", "FRI_GUEST", "WED_LEFTOVER", "FRI_LEFTOVER"}
 
-# [변경됨] 빈자리 알림을 지원하는 카테고리 → (요일_한글, 요일_영문, 게스트_카테고리)
-# 기존에는 정규 운동(WED_REGULAR, FRI_REGULAR)만 등록되어 있었으나,
-# 게스트(_GUEST)와 잔여석(_LEFTOVER) 카테고리를 추가하여 전 카테고리 알림을 지원한다.
-# 튜플 구조: (요일_한글, 요일_영문, 게스트_카테고리)
-#   · 요일_한글: get_capacities() 딕셔너리 조회 키 ("수" / "금")
-#   · 요일_영문: 확정 상태 플래그 선택 ("wed" / "fri")
-#   · 게스트_카테고리: count_special_guests() 호출 시 사용할 게스트 보드 카테고리명
-_VACANCY_CATEGORY_MAP: dict[str, tuple[str, str, str]] = {
-    # ── 정규 운동 ─────────────────────────────────────────────────────────────
-    "WED_REGULAR":  ("수", "wed", "WED_GUEST"),
-    "FRI_REGULAR":  ("금", "fri", "FRI_GUEST"),
-    # ── [추가] 게스트 ──────────────────────────────────────────────────────────
-    "WED_GUEST":    ("수", "wed", "WED_GUEST"),
-    "FRI_GUEST":    ("금", "fri", "FRI_GUEST"),
-    # ── [추가] 잔여석 ──────────────────────────────────────────────────────────
-    "WED_LEFTOVER": ("수", "wed", "WED_GUEST"),
-    "FRI_LEFTOVER": ("금", "fri", "FRI_GUEST"),
+# 빈자리 알림을 지원하는 카테고리 → 요일_영문 (확정 상태 플래그 선택: "wed" / "fri")
+# 정규 운동·게스트·잔여석 전 카테고리를 지원한다.
+# 요일별 총 정원·게스트 보드 매핑은 admin.capacity.calculator.CAPACITY_CATEGORY_MAP이 가진다.
+_VACANCY_CATEGORY_MAP: dict[str, str] = {
+    "WED_REGULAR":  "wed",
+    "FRI_REGULAR":  "fri",
+    "WED_GUEST":    "wed",
+    "FRI_GUEST":    "fri",
+    "WED_LEFTOVER": "wed",
+    "FRI_LEFTOVER": "fri",
 }
 
 # [추가] 카테고리 영문 키 → 한글 표시명 매핑 (알림 메시지 동적 생성에 사용)
@@ -122,6 +119,10 @@ def handle_cancel(category: str) -> tuple[dict, int]:
     if not success:
         return {"error": "취소할 신청 내역이 존재하지 않습니다."}, 404
 
+    # Step 4.5: Redis 주간 신청자 집합·잠정 순번 집합에서 제거 (재신청 허용)
+    unmark_applied(category, cancel_user_id, now)
+    board_rank.remove(category, cancel_user_id)
+
     # Step 5: 빈자리 알림 트리거
     # 정원 확정 상태이고, 취소한 인원이 정원 내에 있던 경우에만 알림을 발송한다.
     # Non-blocking: 큐에 추가만 하고 즉시 반환 (응답 지연 없음)
@@ -139,13 +140,9 @@ def _check_and_notify_vacancy(category: str, cancel_pos: int) -> None:
     처리 흐름:
       1) 카테고리 필터 — _VACANCY_CATEGORY_MAP 에 없는 카테고리는 즉시 리턴
       2) 해당 요일 정원 확정 여부 확인 (is_*_confirmed == True일 때만 진행)
-      3) admin/capacity/store에서 총 정원 조회
-      4) calculate_capacity_details()로 유효 정원 계산
-         · 카테고리 종류에 따라 effective_capacity를 다르게 분기:
-           - _REGULAR  : details["운동"] + details["잔여석"]
-           - _GUEST    : details["게스트"]["limit"] + details["게스트"]["special_count"]
-           - _LEFTOVER : details["잔여석"]
-      5) cancel_pos(0-based) < effective_capacity → 정원 내 인원이었음
+      3) get_effective_capacity()로 유효 정원 계산
+         (총 정원 조회 + calculate_capacity_details() + 카테고리 종류별 분기)
+      4) cancel_pos(0-based) < effective_capacity → 정원 내 인원이었음
          → enqueue_push_to_category_subscribers()로 타겟 알림 큐잉 (Non-blocking)
 
     Args:
@@ -160,7 +157,7 @@ def _check_and_notify_vacancy(category: str, cancel_pos: int) -> None:
     if cancel_pos < 0:
         return
 
-    day_korean, day_eng, guest_category = _VACANCY_CATEGORY_MAP[category]
+    day_eng = _VACANCY_CATEGORY_MAP[category]
 
     # ② 요일별 정원 확정 상태 확인 (Redis, 모든 워커가 동일한 값을 참조)
     import notifications.store as _nstore
@@ -168,34 +165,15 @@ def _check_and_notify_vacancy(category: str, cancel_pos: int) -> None:
     if not confirmed:
         return
 
-    # ③ 총 정원 조회 (In-Memory Write-Through 캐시, DB I/O 없음)
-    from admin.capacity.store import get_capacities
-    caps = get_capacities()
-    total_capacity = caps.get(day_korean)
-    if total_capacity is None:
-        return  # 아직 정원이 설정되지 않음
-
-    # ④ 유효 정원 계산
-    # calculate_capacity_details()는 취소 후 호출하지만,
-    # effective_capacity 는 총 유효 슬롯 수로 항상 일정하다
+    # ③ 유효 정원 계산
+    # 취소 후 호출하지만 effective_capacity 는 총 유효 슬롯 수로 항상 일정하다
     # (일반 보드 크기와 무관한 값 — total_capacity와 게스트 보드에만 의존)
-    from admin.capacity.calculator import calculate_capacity_details, count_special_guests
-    special_count = count_special_guests(guest_category)
-    details = calculate_capacity_details(day_korean, total_capacity, special_count)
-
-    # [변경됨] 기존의 하드코딩된 effective_capacity 식을 제거하고,
-    # 카테고리 종류(_REGULAR / _GUEST / _LEFTOVER)에 따라 동적으로 분기한다.
-    if category.endswith("_REGULAR"):
-        # 정규 운동: 운동 슬롯 + 잔여석 슬롯의 합 (총 유효 슬롯)
-        effective_capacity = details["운동"] + details["잔여석"]
-    elif category.endswith("_GUEST"):
-        # 게스트: 일반 게스트 정원 + 특수 인원(ob / 교류전) 수
-        effective_capacity = details["게스트"]["limit"] + details["게스트"]["special_count"]
-    else:
-        # 잔여석(_LEFTOVER): 잔여석 슬롯만
-        effective_capacity = details["잔여석"]
+    from admin.capacity.calculator import get_effective_capacity
+    effective_capacity = get_effective_capacity(category)
+    if effective_capacity is None:
+        return  # 아직 정원이 설정되지 않음
 
-    # ⑤ 정원 내 인원 판별 (0-based index: cancel_pos < effective_capacity)
+    # ④ 정원 내 인원 판별 (0-based index: cancel_pos < effective_capacity)
     if cancel_pos >= effective_capacity:
         return  # 대기 순번이었음 → 실제 빈자리 없음
 
@@ -0,0 +1,130 @@
+# compression.py — 조회 응답 압축 (gzip / brotli 협상 + 압축 결과 캐시)
+#
+# 피크 타임에는 같은 보드 상태의 응답 본문이 초당 수백 번 나간다.
+# 요청마다 압축하면 CPU를 그만큼 더 쓰므로, 압축 결과를 (ETag, 인코딩) 단위로 캐시한다.
+# ETag는 응답을 결정하는 값(보드 버전·상태·사용자별 플래그·형식)으로 만들어지므로
+# 같은 ETag = 같은 본문이고, 보드 상태 하나당 인코딩별로 1회만 압축된다.
+#
+# [협상]
+#   Accept-Encoding의 q 값에 따라 br(brotli 모듈이 설치된 경우) → gzip 순으로 고른다.
+#   COMPRESS_MIN_BYTES 미만 본문은 압축하지 않는다 (헤더·CPU 비용 > 절감량).
+#
+# [ETag]
+#   압축된 표현은 인코딩별로 다른 바이트이므로 ETag 뒤에 "-gzip" / "-br"을 붙인다.
+#   conditional.is_not_modified()는 접미사가 붙은 값도 같은 상태로 인정한다.
+#
+# 적용 지점:
+#   - conditional.with_etag() — ETag가 붙는 모든 조회 응답
+#     (/api/all-boards, /api/board-data, /api/capacities)
+#   - /api/category-states    — serverTime 때문에 본문이 매번 달라 캐시 없이 압축
+#     (본문 자체는 전환 구간마다 사전 렌더링된다 — time_handler._states_tail)
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+
+from flask import Request, Response
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 — 없으면 gzip만 협상한다
+    brotli = None
+
+_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", "512"))
+_CACHE_SIZE = int(os.environ.get("COMPRESS_CACHE_SIZE", "256"))
+
+# 압축 결과가 상태 단위로 캐시되므로 속도보다 압축률 쪽 설정을 쓴다.
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+
+ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+ETAG_SUFFIXES: dict[str, str] = {enc: f"-{enc}" for enc in ("br", "gzip")}
+
+_cache_lock = threading.Lock()
+_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+_stats_lock = threading.Lock()
+_stats: dict[str, int] = {
+    "hits":      0,   # 캐시된 압축 본문 재사용
+    "misses":    0,   # 새로 압축
+    "skipped":   0,   # 임계값 미만 또는 클라이언트 미지원
+    "bytes_in":  0,   # 압축 전 누적 바이트 (압축 응답만)
+    "bytes_out": 0,   # 압축 후 누적 바이트
+}
+
+
+def _bump(key: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[key] += amount
+
+
+def get_stats() -> dict[str, int]:
+    """압축 캐시 통계의 복사본을 반환한다."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def negotiate(req: Request) -> str | None:
+    """Accept-Encoding에서 사용할 인코딩을 고른다. 압축하지 않으면 None."""
+    return req.accept_encodings.best_match(ENCODINGS)
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def _get_compressed(etag: str, encoding: str, body: bytes) -> bytes:
+    key = (etag, encoding)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+    if cached is not None:
+        _bump("hits")
+        return cached
+
+    # 같은 상태를 여러 스레드가 동시에 압축할 수 있으나 결과가 같으므로 무해하다.
+    compressed = _compress(body, encoding)
+    with _cache_lock:
+        _cache[key] = compressed
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    _bump("misses")
+    return compressed
+
+
+def compress_response(req: Request, resp: Response, etag: str | None = None) -> Response:
+    """200 응답을 협상된 인코딩으로 압축한다 (조건 불충족 시 그대로).
+
+    Args:
+        etag: 응답의 ETag. 주어지면 압축 결과를 캐시하고 ETag에 인코딩 접미사를 붙인다.
+              None이면 요청마다 본문이 다른 응답(/api/category-states의 serverTime)으로 보고
+              캐시 없이 압축만 한다.
+    """
+    resp.vary.add("Accept-Encoding")
+    if resp.status_code != 200 or resp.direct_passthrough or "Content-Encoding" in resp.headers:
+        return resp
+
+    encoding = negotiate(req)
+    body = resp.get_data()
+    if encoding is None or len(body) < _MIN_BYTES:
+        _bump("skipped")
+        return resp
+
+    if etag is None:
+        compressed = _compress(body, encoding)
+        _bump("misses")
+    else:
+        compressed = _get_compressed(etag, encoding, body)
+    _bump("bytes_in", len(body))
+    _bump("bytes_out", len(compressed))
+
+    resp.set_data(compressed)
+    resp.headers["Content-Encoding"] = encoding
+    if etag is not None:
+        resp.set_etag(etag + ETAG_SUFFIXES[encoding])
+    return resp
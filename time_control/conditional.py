@@ -0,0 +1,65 @@
+# conditional.py — ETag / If-None-Match 조건부 응답 헬퍼
+#
+# 2초 폴링 엔드포인트(/api/all-boards, /api/board-data, /api/capacities)는
+# 보드가 바뀌지 않는 한 매번 같은 본문을 반환한다.
+# 응답을 결정하는 값(board_version, 상태, 사용자별 플래그 등)으로 강한 ETag를 만들고,
+# 클라이언트가 보낸 If-None-Match와 일치하면 본문 생성 없이 304를 반환한다.
+#
+# Cache-Control: private, no-cache
+#   → 브라우저가 응답을 저장하되 매 요청마다 재검증(If-None-Match 자동 첨부)하도록 한다.
+#     fetch()는 304를 캐시된 200 응답으로 투명하게 바꿔주므로 프론트엔드 수정이 필요 없다.
+#
+# with_etag()는 본문을 gzip/brotli로 압축한다 (compression.py — 압축 결과는 ETag 단위 캐시).
+# 압축된 표현의 ETag에는 "-gzip" / "-br" 접미사가 붙으며, If-None-Match 비교 시
+# 접미사를 뗀 값도 같은 상태로 본다.
+
+import hashlib
+
+from flask import Response, request
+
+from .compression import ETAG_SUFFIXES, compress_response
+
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """응답을 결정하는 값들로 강한 ETag(따옴표 제외)를 만든다."""
+    raw = "|".join(repr(p) for p in parts).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=12).hexdigest()
+
+
+def _matched_etag(etag: str) -> str | None:
+    """If-None-Match에 들어 있는 etag 표현(원본 또는 인코딩 접미사)을 반환한다."""
+    inm = request.if_none_match
+    if not inm:
+        return None
+    if inm.contains(etag):
+        return etag
+    for suffix in ETAG_SUFFIXES.values():
+        if inm.contains(etag + suffix):
+            return etag + suffix
+    return None
+
+
+def is_not_modified(etag: str) -> bool:
+    """요청의 If-None-Match가 etag(인코딩 접미사 포함)와 일치하면 True."""
+    return _matched_etag(etag) is not None
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없는 304 Not Modified 응답을 반환한다.
+
+    ETag는 클라이언트가 보낸 표현(압축 접미사 포함)을 그대로 돌려준다.
+    """
+    resp = Response(status=304)
+    resp.set_etag(_matched_etag(etag) or etag)
+    resp.vary.add("Accept-Encoding")
+    resp.headers["Cache-Control"] = _CACHE_CONTROL
+    return resp
+
+
+def with_etag(resp: Response, etag: str) -> Response:
+    """200 응답에 ETag와 재검증 캐시 헤더를 붙이고, 협상된 인코딩으로 압축한다."""
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = _CACHE_CONTROL
+    return compress_response(request, resp, etag)
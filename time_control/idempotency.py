@@ -0,0 +1,148 @@
+# idempotency.py — Idempotency-Key 헤더 기반 POST 재시도 응답 캐시
+#
+# 22:00 오픈 직후 불안정한 모바일 네트워크에서는 응답을 받지 못한 클라이언트가
+# 같은 POST를 다시 보낸다. 재시도마다 JWT 검증(SQLite token_version 조회), 시간 검증,
+# 중복 검사, 큐 적재를 다시 하고 5회/10초 rate limit까지 소모한다.
+# Idempotency-Key가 같은 재시도는 첫 응답을 Redis에서 꺼내 O(1)로 돌려준다.
+#
+# [키]
+#   idem:{sha256(Bearer 토큰 \n 경로 \n Idempotency-Key)}
+#     → 토큰이 키에 섞이므로 다른 사용자(다른 토큰)는 같은 Idempotency-Key로도 응답을 볼 수 없다.
+#       Authorization 없이 신청권(X-Apply-Ticket, apply_ticket.py)만 보낸 요청은 신청권을 대신 섞는다.
+#       토큰 검증보다 바깥에서 동작하므로 재시도는 SQLite를 전혀 거치지 않는다.
+#   값 = JSON {"fp": 본문 해시, "status": 응답 코드(처리 중이면 없음), "body", "ct"}
+#
+# [처리]
+#   1. SET NX로 "처리 중" 표시 → 성공한 요청만 핸들러 실행 후 응답을 IDEMPOTENCY_TTL 동안 저장
+#   2. 표시가 이미 있으면:
+#        본문 해시가 다름 → 422 (같은 키를 다른 요청에 재사용)
+#        처리 완료       → 저장된 응답 + Idempotent-Replayed: true
+#        처리 중         → _PENDING_WAIT초까지 기다렸다가 완료 응답, 그래도 진행 중이면 409
+#   3. 401·429·5xx와 핸들러 예외는 저장하지 않고 표시를 지운다 — 토큰 갱신·한도 회복·장애 복구 후
+#      재시도가 실행되어야 한다.
+#
+# Redis 장애 시에는 캐시 없이 핸들러를 그대로 실행한다 (중복은 각 핸들러의 검사가 막는다).
+#
+# 사용: @application_bp.route(...) 바로 아래, @token_required·@rate_limit보다 바깥에 둔다.
+
+import hashlib
+import os
+import time
+from functools import wraps
+
+import redis
+from flask import Response, jsonify, make_response, request
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from . import json_codec
+from .apply_ticket import HEADER as TICKET_HEADER
+
+HEADER = "Idempotency-Key"
+
+_KEY_PREFIX = "idem:"
+_MAX_KEY_LENGTH = 128
+IDEMPOTENCY_TTL = int(os.environ.get("IDEMPOTENCY_TTL", "3600"))   # 완료 응답 보관 (초)
+_PENDING_TTL = 30        # 처리 중 표시 — 핸들러가 죽어도 이 시간 후 다시 실행 가능
+_PENDING_WAIT = 2.0      # 처리 중인 같은 요청을 기다리는 최대 시간 (초)
+_PENDING_POLL = 0.05
+
+# 재시도 시 다시 실행되어야 하는 응답 (저장하지 않음)
+_UNCACHED_STATUS = {401, 429}
+
+_redis_client = redis.Redis(
+    host=os.environ.get("REDIS_HOST", "127.0.0.1"),
+    port=int(os.environ.get("REDIS_PORT", 6379)),
+    db=int(os.environ.get("REDIS_DB", 0)),
+    decode_responses=True,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),  # Redis 장애가 쓰기 응답을 지연시키지 않도록
+)
+
+
+def _cache_key(idem_key: str) -> str:
+    auth = request.headers.get("Authorization") or request.headers.get(TICKET_HEADER, "")
+    raw = f"{auth}\n{request.path}\n{idem_key}".encode("utf-8")
+    return _KEY_PREFIX + hashlib.sha256(raw).hexdigest()
+
+
+def _fingerprint() -> str:
+    return hashlib.sha256(request.get_data()).hexdigest()
+
+
+def _replay(record: dict) -> Response:
+    response = Response(record["body"], status=record["status"], content_type=record["ct"])
+    response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+def _wait_done(key: str) -> dict | None:
+    """처리 중인 같은 요청의 완료 기록을 _PENDING_WAIT초까지 기다린다 (None = 표시가 사라짐)."""
+    deadline = time.monotonic() + _PENDING_WAIT
+    while True:
+        raw = _redis_client.get(key)
+        if raw is None:
+            return None
+        record = json_codec.loads(raw)
+        if "status" in record or time.monotonic() >= deadline:
+            return record
+        time.sleep(_PENDING_POLL)
+
+
+def idempotent(f):
+    """Idempotency-Key 헤더가 있으면 첫 응답을 저장해 같은 키의 재시도에 그대로 돌려준다."""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        idem_key = request.headers.get(HEADER)
+        if idem_key is None:
+            return f(*args, **kwargs)
+        if not idem_key or len(idem_key) > _MAX_KEY_LENGTH or not idem_key.isascii():
+            return jsonify({"error": f"{HEADER} 헤더 형식이 올바르지 않습니다."}), 400
+
+        key = _cache_key(idem_key)
+        fp = _fingerprint()
+        while True:
+            try:
+                reserved = _redis_client.set(key, json_codec.dumps({"fp": fp}), nx=True, ex=_PENDING_TTL)
+                record = None if reserved else _wait_done(key)
+            except redis.RedisError:
+                return f(*args, **kwargs)
+            if reserved or record is not None:
+                break
+            # 먼저 온 요청이 저장하지 않는 응답(401·429·5xx·예외)으로 끝났다 — 다시 예약을 시도한다
+
+        if not reserved:
+            if record["fp"] != fp:
+                return jsonify({"error": f"{HEADER}가 다른 요청에 이미 사용되었습니다."}), 422
+            if "status" not in record:
+                response = jsonify({"error": "같은 요청을 처리 중입니다. 잠시 후 다시 시도해주세요."})
+                response.status_code = 409
+                response.headers["Retry-After"] = "1"
+                return response
+            return _replay(record)
+
+        try:
+            response = make_response(f(*args, **kwargs))
+        except BaseException:
+            # 핸들러 예외: 처리 중 표시를 지워 같은 키의 재시도가 _PENDING_TTL 동안 409를 받지 않게 한다
+            try:
+                _redis_client.delete(key)
+            except redis.RedisError:
+                pass
+            raise
+
+        try:
+            if response.status_code in _UNCACHED_STATUS or response.status_code >= 500:
+                _redis_client.delete(key)
+            else:
+                _redis_client.set(key, json_codec.dumps({
+                    "fp":     fp,
+                    "status": response.status_code,
+                    "body":   response.get_data(as_text=True),
+                    "ct":     response.content_type,
+                }), ex=IDEMPOTENCY_TTL)
+        except redis.RedisError:
+            pass
+        return response
+    return wrapper
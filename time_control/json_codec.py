@@ -0,0 +1,101 @@
+# json_codec.py — JSON 인코딩/디코딩 공용 계층 (orjson 선택 사용, 표준 json 폴백)
+#
+# 게시판 응답·신청 큐 메시지·푸시 페이로드가 모두 한글 문자열을 포함한 JSON이며
+# 피크타임에는 요청마다 직렬화가 반복된다. orjson이 설치되어 있으면 이를 사용하고,
+# 없으면 표준 json으로 동작한다 (requirements.txt에서 빠져도 기능은 동일).
+#
+# [출력 규칙 — 두 구현이 같은 JSON을 내도록 고정]
+#   (차이는 지수 표기 자릿수뿐이다: 1e-7 vs 1e-07 — 파싱 결과는 동일)
+#   - 비ASCII 문자는 이스케이프하지 않는다 (UTF-8 그대로, ensure_ascii=False)
+#   - 공백 없는 구분자 (",", ":")
+#   - sort_keys=True이면 키 정렬 (Flask 기본 동작과 동일)
+#   - 기본 지원 타입(dict/list/str/int/float/bool/None, str 기반 Enum) 외에는
+#     default 콜백으로 변환한다 (Flask provider의 date → HTTP date 변환 등)
+#
+# 사용처:
+#   - app.py                        : Flask app.json = FastJSONProvider(app) (jsonify 전체)
+#   - time_control/apply            : apply_stream 메시지 인코딩 (producer)
+#   - worker.py                     : apply_stream 메시지 디코딩 (consumer)
+#   - notifications/sender.py       : WebPush 페이로드 인코딩
+#   - board_view / stream_server    : 사전 렌더링 bytes, SSE 이벤트
+
+import json
+from typing import Any, Callable
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# 디코딩 실패 예외 — orjson.JSONDecodeError도 json.JSONDecodeError의 하위 클래스다.
+JSONDecodeError = json.JSONDecodeError
+
+_Default = Callable[[Any], Any] | None
+
+
+if orjson is not None:
+    # datetime·dataclass는 orjson 내장 변환(ISO 8601 등) 대신 default로 넘겨
+    # 표준 json + default 조합과 같은 결과를 낸다.
+    _BASE_OPTS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, default: _Default = None) -> bytes:
+        """obj를 UTF-8 JSON bytes로 직렬화한다."""
+        opts = _BASE_OPTS | orjson.OPT_SORT_KEYS if sort_keys else _BASE_OPTS
+        return orjson.dumps(obj, default=default, option=opts)
+
+    def dumps(obj: Any, *, sort_keys: bool = False, default: _Default = None) -> str:
+        """obj를 JSON 문자열로 직렬화한다."""
+        return dumps_bytes(obj, sort_keys=sort_keys, default=default).decode()
+
+    def loads(data: str | bytes) -> Any:
+        """JSON 문자열/bytes를 파싱한다."""
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any, *, sort_keys: bool = False, default: _Default = None) -> str:
+        """obj를 JSON 문자열로 직렬화한다."""
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+            default=default,
+        )
+
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, default: _Default = None) -> bytes:
+        """obj를 UTF-8 JSON bytes로 직렬화한다."""
+        return dumps(obj, sort_keys=sort_keys, default=default).encode()
+
+    def loads(data: str | bytes) -> Any:
+        """JSON 문자열/bytes를 파싱한다."""
+        return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify()·request.get_json()이 json_codec을 사용하도록 하는 Flask JSON provider.
+
+    정렬(sort_keys)·default 변환 규칙은 Flask 기본 provider를 그대로 따르고,
+    응답 본문은 str을 거치지 않고 bytes로 바로 만든다.
+    디버그 모드의 들여쓰기 출력은 지원하지 않는다 (항상 compact).
+    """
+
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj, sort_keys=kwargs.get("sort_keys", self.sort_keys), default=self.default)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = dumps_bytes(obj, sort_keys=self.sort_keys, default=self.default)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -11,6 +11,8 @@ from functools import wraps
 import jwt as _jwt
 from flask import request, jsonify
 
+from .apply_ticket import current_ticket
+
 _lock = threading.Lock()
 _requests: dict[str, list[float]] = {}
 
@@ -61,7 +63,13 @@ def _get_global_key() -> tuple[str, int]:
     JWT 없음 / 디코딩 실패 시 (ip:{real_ip}, _GLOBAL_MAX_PER_IP) 폴백.
 
     토큰 만료·서명 검증은 @token_required가 담당하므로 여기서는 user_id 추출만 수행한다.
+    신청권(X-Apply-Ticket)이 있으면 JWT 대신 신청권의 user_id를 쓴다 — HMAC 확인 결과는
+    flask.g에 남아 /api/apply의 @ticket_or_token이 재사용한다 (apply_ticket.py).
     """
+    ticket = current_ticket()
+    if ticket is not None and ticket.get('id'):
+        return f"uid:{ticket['id']}", _GLOBAL_MAX_PER_USER
+
     auth_header = request.headers.get('Authorization', '')
     if auth_header.startswith('Bearer '):
         token = auth_header.split(' ', 1)[1]
@@ -124,12 +132,14 @@ def check_global_ip_limit() -> bool:
     return False  # 통과
 
 
-def rate_limit(max_requests: int = 5, window_seconds: int = 10):
+def rate_limit(max_requests: int = 5, window_seconds: int = 10, scope: str = ""):
     """슬라이딩 윈도우 방식의 Rate Limiter 데코레이터.
 
     Args:
         max_requests: 윈도우 내 최대 허용 요청 수
         window_seconds: 슬라이딩 윈도우 크기 (초)
+        scope: 지정하면 키 앞에 붙여 다른 엔드포인트와 별도로 센다
+               (예: /api/time의 잦은 요청이 같은 IP의 로그인 한도를 소모하지 않도록)
 
     키 결정 우선순위:
         1) JWT 디코딩 후 설정된 request.current_user['id'] (User ID 기반)
@@ -150,6 +160,8 @@ def rate_limit(max_requests: int = 5, window_seconds: int = 10):
                 key = f"uid:{current_user['id']}"
             else:
                 key = f"ip:{_get_real_ip()}"
+            if scope:
+                key = f"{scope}:{key}"
 
             now = time.time()
 
@@ -1,9 +1,12 @@
 # scheduler_logic.py — 시간 규칙 + 주간 초기화 스케줄러
 #
 # 역할 1: 카테고리별 상태 전환 규칙 (순수 함수, datetime만 사용)
+#         상태 조회는 주 단위로 미리 만든 전환 색인(_WeekIndex)에서 bisect 한 번으로 끝낸다.
 # 역할 2: 매주 토요일 00:00 KST에 인메모리 데이터를 초기화하는 스케줄러
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
 from enum import Enum
+from typing import NamedTuple
 import threading
 import time as _time
 
@@ -89,21 +92,89 @@ def _get_transitions(category: str, week_start: datetime) -> list[tuple[datetime
     return transitions
 
 
+# ── 주간 전환 색인 ────────────────────────────────────────────────────────────
+# 상태 조회(/api/all-boards 7회, /api/category-states 14회, 신청·취소 검증마다)가
+# 매번 _get_transitions()로 timedelta 리스트를 다시 만들던 것을, 주마다 한 번
+# 카테고리별 "전환 시각(epoch 초) 정렬 배열"로 컴파일해 두고 bisect로 찾는다.
+# 색인은 불변 객체이며 전역 참조 교체(원자적)로 바뀐다 — 락 없이 여러 스레드가 읽는다.
+# 주가 바뀌거나 다른 tz의 now가 들어오면 새로 만든다 (동시에 여러 스레드가 만들어도 결과는 같다).
+
+class _WeekIndex(NamedTuple):
+    tz: tzinfo | None
+    start_ts: float                                # 주 시작 (토 00:00) epoch 초
+    end_ts: float                                  # 다음 주 시작 epoch 초
+    week_id: str                                   # 주 시작일 YYYYMMDD (주간 Redis 키 등)
+    next_week: datetime                            # 다음 주 시작 (get_next_change 반환값)
+    bounds: dict[str, list[float]]                 # 카테고리 → 전환 시각 (epoch 초, 오름차순)
+    all_bounds: list[float]                        # 모든 카테고리의 전환 시각 (중복 제거, 오름차순)
+    changes: dict[str, list[tuple[datetime, str]]] # 카테고리 → _get_transitions() 결과
+
+
+_week_index: _WeekIndex | None = None
+
+
+def _build_week_index(now: datetime) -> _WeekIndex:
+    week_start = _get_week_start(now)
+    next_week = week_start + timedelta(days=7)
+    changes = {cat.value: _get_transitions(cat, week_start) for cat in Category}
+    bounds = {cat: [t.timestamp() for t, _ in trans] for cat, trans in changes.items()}
+    return _WeekIndex(
+        tz=now.tzinfo,
+        start_ts=week_start.timestamp(),
+        end_ts=next_week.timestamp(),
+        week_id=f"{week_start:%Y%m%d}",
+        next_week=next_week,
+        bounds=bounds,
+        all_bounds=sorted({ts for cat_bounds in bounds.values() for ts in cat_bounds}),
+        changes=changes,
+    )
+
+
+def _index_for(now: datetime) -> tuple[_WeekIndex, float]:
+    """now가 속한 주의 색인과 now의 epoch 초를 반환한다."""
+    global _week_index
+    ts = now.timestamp()
+    index = _week_index
+    if index is None or not (index.start_ts <= ts < index.end_ts) or index.tz != now.tzinfo:
+        index = _build_week_index(now)
+        _week_index = index
+    return index, ts
+
+
+def get_week_start_ts(now: datetime) -> float:
+    """_get_week_start(now).timestamp()와 같은 값 (색인에서 바로 반환)."""
+    return _index_for(now)[0].start_ts
+
+
+def get_week_id(now: datetime) -> str:
+    """now가 속한 주의 시작일 "YYYYMMDD" (색인에서 바로 반환)."""
+    return _index_for(now)[0].week_id
+
+
+def get_stable_range(now: datetime) -> tuple[float, float]:
+    """now가 속한 "어느 카테고리의 상태도 바뀌지 않는 구간" [시작, 끝)을 epoch 초로 반환한다.
+
+    구간 안에서는 모든 카테고리의 get_current_status()·get_next_change() 결과가 같다
+    (/api/category-states 사전 렌더링의 유효 기간).
+    """
+    index, ts = _index_for(now)
+    i = bisect_right(index.all_bounds, ts)
+    start = index.all_bounds[i - 1] if i else index.start_ts
+    end = index.all_bounds[i] if i < len(index.all_bounds) else index.end_ts
+    return start, end
+
+
 def get_current_status(category: str, now: datetime) -> str:
     """주어진 카테고리의 현재 상태를 반환한다.
     now는 KST 기준 datetime이어야 한다.
     """
-    week_start = _get_week_start(now)
-    transitions = _get_transitions(category, week_start)
-
-    current_status = Status.CLOSED
-    for transition_time, status in transitions:
-        if now >= transition_time:
-            current_status = status
-        else:
-            break
-
-    return current_status
+    index, ts = _index_for(now)
+    bounds = index.bounds.get(category)
+    if bounds is None:
+        # 알 수 없는 카테고리 — _get_transitions()처럼 토 00:00 BEFORE_OPEN 전환만 있다
+        return Status.BEFORE_OPEN
+    i = bisect_right(bounds, ts)
+    return index.changes[category][i - 1][1] if i else Status.CLOSED
 
 
 def get_next_change(category: str, now: datetime) -> tuple[datetime, str]:
@@ -111,15 +182,16 @@ def get_next_change(category: str, now: datetime) -> tuple[datetime, str]:
     이번 주 남은 전환이 없으면 다음 주 토요일 BEFORE_OPEN을 반환한다.
     CLOSED 상태에서는 돌아오는 토요일 00:00을 반환하므로 카운트다운에 직접 사용 가능.
     """
-    week_start = _get_week_start(now)
-    transitions = _get_transitions(category, week_start)
-
-    for transition_time, status in transitions:
-        if now < transition_time:
-            return transition_time, status
+    index, ts = _index_for(now)
+    bounds = index.bounds.get(category)
+    if bounds is None:
+        return index.next_week, Status.BEFORE_OPEN
+    i = bisect_right(bounds, ts)
+    if i < len(bounds):
+        return index.changes[category][i]
 
     # 이번 주 전환이 모두 지남(= CLOSED) → 다음 주 토요일 00:00
-    return week_start + timedelta(days=7), Status.BEFORE_OPEN
+    return index.next_week, Status.BEFORE_OPEN
 
 
 # ── 주간 초기화 스케줄러 ──────────────────────────────────────────────────────
@@ -141,10 +213,12 @@ def _next_saturday_midnight(now: datetime) -> datetime:
 
 
 def _flush_apply_queue() -> None:
-    """Redis apply_queue를 비운다.
+    """Redis 신청 스트림(apply_stream:*)과 잠정 순번 집합(board:rank:*)을 비운다.
+
+    스트림을 지우면 Consumer Group도 함께 사라지며, worker가 NOGROUP을 감지해 다시 만든다.
 
     주간 리셋 시 SQLite 클리어보다 먼저 호출한다.
-    큐에 남아있는 이전 주 미처리 항목이 reset_all() 이후 재삽입되어
+    스트림에 남아있는 이전 주 미처리 항목이 reset_all() 이후 재삽입되어
     '_is_already_applied()' 오탐지를 유발하는 현상을 방지한다.
 
     Redis 장애 시 예외를 삼키고 계속 진행한다.
@@ -152,6 +226,8 @@ def _flush_apply_queue() -> None:
     """
     import os as _os
     import redis as _redis
+    from .apply_stream import STREAM_KEYS
+    from .board_rank import rank_key
     try:
         r = _redis.Redis(
             host=_os.environ.get("REDIS_HOST", "127.0.0.1"),
@@ -159,7 +235,7 @@ def _flush_apply_queue() -> None:
             db=int(_os.environ.get("REDIS_DB", 0)),
             socket_timeout=5,
         )
-        r.delete("apply_queue")
+        r.delete(*STREAM_KEYS, *(rank_key(cat.value) for cat in Category))
     except Exception:
         pass
 
@@ -168,7 +244,7 @@ def _reset_scheduler_worker(kst: timezone) -> None:
     """매주 토요일 00:00 KST에 인메모리 데이터를 초기화한다.
 
     초기화 순서:
-      1. Redis apply_queue 플러시 — SQLite 클리어 전에 수행하여
+      1. Redis 신청 스트림 플러시 — SQLite 클리어 전에 수행하여
          이전 주 미처리 항목의 재삽입을 방지
       2. board_store.reset_all()         : 신청/취소 게시판 전체
       3. capacity.store.reset_capacities(): 정원 캐시
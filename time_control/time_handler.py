@@ -6,9 +6,11 @@
 # 역할 2 (Command Validation): Apply/Cancel 요청 시 scheduler_logic으로
 #                  현재 시각이 유효한 윈도우인지 검증(Guard Clause)한 뒤
 #                  하위 apply/ · cancel/ 모듈로 라우팅.
+import time
 from datetime import datetime, timezone, timedelta
+from typing import NamedTuple
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 
 from smash_db.auth import token_required
 from .scheduler_logic import (
@@ -16,8 +18,13 @@ from .scheduler_logic import (
     Status,
     get_current_status,
     get_next_change,
+    get_stable_range,
 )
 from . import board_store
+from . import json_codec
+from .conditional import make_etag, is_not_modified, not_modified, with_etag
+from .compression import compress_response
+from .rate_limiter import rate_limit
 from admin.capacity.calculator import calculate_capacity_details, count_special_guests
 
 time_bp = Blueprint("time", __name__)
@@ -60,6 +67,54 @@ _CATEGORY_MAP: list[tuple[str, str, str]] = [
 
 # ── 역할 1: Query — 프론트엔드 폴링 응답 ──────────────────────────────────────
 
+# /api/category-states 사전 렌더링 본문
+#   응답은 주에 몇 번 안 되는 전환 시각(_get_transitions)에만 바뀌므로, 전환 사이 구간
+#   (get_stable_range)마다 한 번 렌더링·직렬화해 두고 요청마다 serverTime만 앞에 붙인다.
+#   구간 끝(다음 전환 시각)을 지난 첫 요청이 다시 렌더링하므로 22:00:00 상태 전환이 밀리초 단위로 정확하다.
+#   불변 객체를 전역 참조 교체로 바꾼다 — 동시에 여러 스레드가 렌더링해도 결과는 같다.
+class _StatesBody(NamedTuple):
+    valid_from: float   # 유효 구간 [valid_from, valid_until) — epoch 초
+    valid_until: float
+    tail: bytes         # serverTime 없는 JSON 본문에서 여는 "{" 뒤 부분
+
+
+_states_body: _StatesBody | None = None
+
+
+def _render_states(now: datetime) -> _StatesBody:
+    result: dict = {"수": {}, "금": {}}
+
+    for category, day, board in _CATEGORY_MAP:
+        status = get_current_status(category, now)
+        next_time, next_status = get_next_change(category, now)
+
+        # Unix ms 타임스탬프 (절대 시각) — 프론트엔드에서 Date.now()와 비교해 카운트다운 계산
+        deadline_ms = int(next_time.timestamp() * 1000)
+
+        frontend_status, status_text = _STATUS_MAP[status]
+        next_frontend_status, _ = _STATUS_MAP[next_status]
+
+        result[day][board] = {
+            "status":            frontend_status,
+            "statusText":        status_text,
+            "deadlineTimestamp": deadline_ms,
+            "nextStatus":        next_frontend_status,
+        }
+
+    valid_from, valid_until = get_stable_range(now)
+    return _StatesBody(valid_from, valid_until, json_codec.dumps_bytes(result)[1:])
+
+
+def _states_tail(now: datetime) -> bytes:
+    global _states_body
+    ts = now.timestamp()
+    cached = _states_body
+    if cached is None or not (cached.valid_from <= ts < cached.valid_until):
+        cached = _render_states(now)
+        _states_body = cached
+    return cached.tail
+
+
 @time_bp.route("/api/category-states", methods=["GET"])
 @token_required
 def get_category_states():
@@ -67,6 +122,7 @@ def get_category_states():
 
     Response (JSON):
         {
+          "serverTime": 1234567890123,
           "수": {
             "운동":   { "status": "open",    "statusText": "신청 마감까지", "deadlineTimestamp": 1234567890000 },
             "게스트": { ... },
@@ -84,29 +140,34 @@ def get_category_states():
         - CLOSED 상태: 돌아오는 토요일 00:00 KST (Unix ms)
           → get_next_change()가 이미 이 값을 반환하므로 별도 분기 없음.
         - 그 외 상태: 다음 상태 전환 시각 (Unix ms)
+
+    본문은 전환 구간마다 한 번 렌더링한 것을 쓰고 serverTime만 요청마다 붙인다 (_states_tail).
+    serverTime 때문에 본문이 요청마다 다르므로 압축 결과는 캐시하지 않는다.
     """
     now = _now_kst()
+    body = b'{"serverTime":%d,' % int(now.timestamp() * 1000) + _states_tail(now)
+    return compress_response(request, Response(body, mimetype="application/json")), 200
 
-    result: dict = {"수": {}, "금": {}, "serverTime": int(now.timestamp() * 1000)}
 
-    for category, day, board in _CATEGORY_MAP:
-        status = get_current_status(category, now)
-        next_time, next_status = get_next_change(category, now)
+# 시계 동기화 — 클라이언트가 NTP 방식으로 여러 번 샘플링한다 (client/src/lib/serverTime.ts).
+#   t0 = 클라이언트 송신, t1 = receive, t2 = send, t3 = 클라이언트 수신
+#   offset = ((t1 - t0) + (t2 - t3)) / 2, rtt = (t3 - t0) - (t2 - t1) → rtt가 가장 작은 샘플의 offset을 쓴다.
+# 인증·DB·캐시 없음. 글로벌 IP 한도(app.py)에서 빠지고 IP당 자체 한도만 적용한다
+# (NAT 뒤 여러 회원이 동시에 샘플링해도 여유 있는 값, 로그인 한도와는 별도 scope).
+_TIME_RATE_LIMIT = 120          # IP당 10초 내 최대 요청 수 (회원 1명 = 동기화 1회에 5건)
 
-        # Unix ms 타임스탬프 (절대 시각) — 프론트엔드에서 Date.now()와 비교해 카운트다운 계산
-        deadline_ms = int(next_time.timestamp() * 1000)
 
-        frontend_status, status_text = _STATUS_MAP[status]
-        next_frontend_status, _ = _STATUS_MAP[next_status]
-
-        result[day][board] = {
-            "status":            frontend_status,
-            "statusText":        status_text,
-            "deadlineTimestamp": deadline_ms,
-            "nextStatus":        next_frontend_status,
-        }
+@time_bp.route("/api/time", methods=["GET"])
+@rate_limit(max_requests=_TIME_RATE_LIMIT, window_seconds=10, scope="time")
+def get_server_time():
+    """서버 수신·송신 시각을 Unix ms(µs 정밀도 소수)로 반환한다.
 
-    return jsonify(result), 200
+    Response (JSON): {"receive": 1234567890123.456, "send": 1234567890123.481}
+    """
+    received = time.time_ns()
+    response = Response(mimetype="application/json", headers={"Cache-Control": "no-store"})
+    response.set_data(b'{"receive":%.3f,"send":%.3f}' % (received / 1e6, time.time_ns() / 1e6))
+    return response
 
 
 @time_bp.route("/api/capacities", methods=["GET"])
@@ -121,10 +182,16 @@ def get_capacities():
         }
 
     인메모리 캐시에서 즉시 반환 (DB I/O 없음).
+    상세 값은 정원(Redis)과 보드 인원수에만 의존하므로
+    (정원, board_version)으로 ETag를 만들어 변경이 없으면 304를 반환한다.
     """
     from admin.capacity.store import get_capacities as _get
 
     raw = _get()
+    etag = make_etag("capacities", board_store.get_board_version(), sorted(raw.items()))
+    if is_not_modified(etag):
+        return not_modified(etag)
+
     guest_category_map = {"수": Category.WED_GUEST, "금": Category.FRI_GUEST}
 
     result = {}
@@ -138,7 +205,7 @@ def get_capacities():
                 "details": calculate_capacity_details(day, total, special_count),
             }
 
-    return jsonify(result), 200
+    return with_etag(jsonify(result), etag), 200
 
 
 # ── 역할 2: Command Validation — Guard Clause ──────────────────────────────────
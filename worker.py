@@ -1,42 +1,96 @@
 # worker.py — Redis → SQLite 백그라운드 워커
 #
 # API 서버(Gunicorn)와 완전히 독립적으로 실행되는 단일 프로세스 스크립트.
-# Redis의 apply_queue에서 데이터를 꺼내
+# 카테고리별 Redis 신청 스트림(apply_stream:{category})을 Consumer Group으로 읽어
 # SQLite(smash_db/users.db)의 applications 테이블에 INSERT한다.
 #
 # [핵심 설계]
-#   - 단일 워커 = 단일 SQLite 연결 → "database is locked" 경합 완벽 회피
-#   - 배치 처리: 최대 BATCH_SIZE건을 한 트랜잭션으로 묶어 INSERT
-#     → SQLite lock 점유 횟수를 최대 1/BATCH_SIZE로 감소
-#     → 피크타임 큐 적체 시 처리량 대폭 향상
-#   - 큐가 빌 때까지 처리 후 짧게 대기(블로킹 없이 반복)
+#   - consumer N개(WORKER_CONSUMERS, 스레드): 각자 겹치지 않는 카테고리 스트림을 맡는다
+#     (apply_stream.shard_categories — N = 2이면 수요일 / 금요일)
+#     → 22:00 WED_REGULAR·FRI_REGULAR 동시 오픈 때 두 요일이 한 줄로 서지 않고
+#       읽기·파싱·ACK·뷰 렌더링이 나란히 진행된다
+#   - SQLite 쓰기는 프로세스 내 _write_lock으로 넘겨받는다
+#     → consumer끼리 WAL writer lock을 두고 busy 대기(재시도 sleep)하지 않고,
+#       앞 커밋이 끝나는 즉시 다음 consumer가 커밋한다. 게시판 읽기·변경 로그·버전은
+#       DB 하나를 그대로 쓰므로 조회 경로는 바뀌지 않는다.
+#   - 배치 처리: XREADGROUP 1회로 맡은 스트림에서 최대 batch_size건씩 읽어 한 트랜잭션으로 INSERT
+#     → SQLite lock 점유 횟수를 최대 1/batch_size로 감소
+#   - at-least-once: SQLite 커밋 후에만 XACK + XDEL
+#     → 커밋 전에 죽으면(PM2 max_memory_restart의 SIGTERM, 크래시) 항목이 PEL에 남고
+#       재기동 시 같은 consumer 이름으로 다시 읽어 처리한다 (INSERT OR IGNORE라 재처리 무해)
+#     → 다른 consumer 이름으로 남은 오래된 PEL 항목은 XAUTOCLAIM으로 가져온다
+#       (WORKER_CONSUMERS를 바꿔 카테고리 배정이 달라진 경우 포함)
+#     → 처리한 항목을 XDEL하므로 스트림 길이(XLEN) 합 = 처리 대기 건수 (서킷 브레이커 기준)
+#   - 유휴 시 XREADGROUP BLOCK으로 대기 → 첫 신청이 도착하는 즉시 깨어남 (고정 sleep 없음)
+#   - 배치 크기 자동 조절(consumer별): 읽은 건수(적체)와 커밋 시간을 보고 [MIN, MAX] 안에서 조절
+#   - 신청→커밋 지연(p50/p99)과 처리량을 주기적으로 출력
 #   - Redis 또는 SQLite 장애 시 자동 재연결 + 로그 출력
+#   - 커밋 후 신청별 결과(inserted / duplicate / rejected)를 접수증(apply:receipt:{id})에 기록
+#     → 신청자는 게시판 전체 대신 접수증 키 하나를 기다린다 (stream_server.py long-poll)
+#   - 배치 커밋 후 공개 게시판 문서를 1회 렌더링해 Redis(board:view)에 저장
+#     → Gunicorn은 조회 시 SQLite·직렬화 없이 이 bytes를 그대로 응답
+#   - 이어서 Redis pub/sub(board_events)으로 변경 알림 → stream_server.py가 SSE 푸시
+#   - 메인 스레드는 주기 점검만 한다: 공개 뷰 누락 복구, 통계 출력,
+#     잠정 순번 집합(board_rank)을 SQLite 기준으로 재동기화 (신청 스트림이 모두 비었을 때)
 #
 # 실행: python worker.py
 
-import json
 import os
 import sqlite3
 import signal
 import sys
+import threading
 import time
 
 import redis
 from dotenv import load_dotenv
 
+from time_control import apply_receipt, board_rank, json_codec
+from time_control.apply_receipt import DUPLICATE, INSERTED, REJECTED
+from time_control.apply_stream import DATA_FIELD, GROUP, SEQ_FIELD, pending_count, shard_categories, stream_key
+from time_control.board_events import publish_board_changed
+from time_control.board_store import compute_priority, ensure_schema, load_rank_rows
+from time_control.board_view import refresh_board_view, sync_board_view
+
 load_dotenv()
 
 # ── 설정 ──────────────────────────────────────────────────────────────────────
 
 _BASE_DIR  = os.path.dirname(os.path.abspath(__file__))
 _DB_PATH   = os.path.join(_BASE_DIR, "smash_db", "users.db")
-_QUEUE_KEY = "apply_queue"
 
-# 배치 크기: 한 트랜잭션에서 처리할 최대 건수
+# consumer 수 (1~7). 카테고리 배정은 apply_stream.shard_categories()
+_CONSUMERS = max(1, min(7, int(os.environ.get("WORKER_CONSUMERS", "2"))))
+# consumer 이름 = "{접두사}-{번호}". 재기동 후에도 자기 PEL(처리 중이던 항목)을 다시 읽도록 고정한다.
+_CONSUMER_PREFIX = os.environ.get("WORKER_CONSUMER", "worker")
+# 이보다 오래 ACK되지 않은 다른 consumer의 항목은 죽은 것으로 보고 가져온다 (밀리초)
+_CLAIM_IDLE_MS = int(os.environ.get("WORKER_CLAIM_IDLE_MS", "60000"))
+
+# 배치 크기: 한 트랜잭션에서 처리할 최대 건수 (시작값, 이후 consumer별 자동 조절)
 # 평시에는 대부분 1~5건이지만, 피크타임에는 수십~수백 건이 한꺼번에 적재될 수 있다.
+#   - 가득 찬 배치(읽은 건수 = 배치 크기) = 적체 → 커밋이 목표 시간 안이면 2배로 키움
+#   - 커밋이 목표 시간을 넘으면 3/4로 줄임 (SQLite write lock 점유를 짧게 유지 → 조회 지연 방지)
 _BATCH_SIZE = int(os.environ.get("WORKER_BATCH_SIZE", "50"))
+_BATCH_MIN  = int(os.environ.get("WORKER_BATCH_MIN", "10"))
+_BATCH_MAX  = int(os.environ.get("WORKER_BATCH_MAX", "500"))
+_COMMIT_TARGET_SEC = float(os.environ.get("WORKER_COMMIT_TARGET_MS", "25")) / 1000
+
+# 유휴 시 XREADGROUP BLOCK 대기 시간 (밀리초). socket_timeout(5초)보다 짧아야 하며,
+# 이 주기마다 깨어나 종료 신호와 PEL 점검 주기를 확인한다.
+_BLOCK_MS = int(os.environ.get("WORKER_BLOCK_MS", "1000"))
+
+# 주기 점검 간격 (초): 공개 뷰 ↔ SQLite 버전 대조, 잠정 순번 재동기화, 유휴 consumer의 PEL 점검
+_VIEW_SYNC_INTERVAL = 2.0
+
+# SQLite 재연결 최대 대기 (초). 실패할 때마다 1초부터 2배씩 늘린다.
+_RECONNECT_MAX_DELAY = 30.0
+
+# 지연·처리량 보고 주기 (초). 이 구간에 처리한 항목이 없으면 출력하지 않는다.
+_REPORT_INTERVAL = float(os.environ.get("WORKER_REPORT_INTERVAL", "10"))
 
 # ── Redis 연결 ────────────────────────────────────────────────────────────────
+# consumer 스레드가 같은 클라이언트(커넥션 풀)를 공유한다.
+# BLOCK 중인 XREADGROUP이 연결을 하나씩 점유하므로 풀 크기는 consumer 수보다 넉넉해야 한다.
 
 _redis_client = redis.Redis(
     host=os.environ.get("REDIS_HOST", "127.0.0.1"),
@@ -54,38 +108,26 @@ def _init_db() -> sqlite3.Connection:
     """applications 테이블이 없으면 생성하고 연결을 반환한다.
 
     - WAL 모드: 읽기(API 서버)와 쓰기(워커)가 서로를 블로킹하지 않음
-    - 단일 워커만 쓰기를 수행하므로 write lock 경합 없음
+    - consumer마다 연결 1개. 쓰기는 _write_lock으로 한 번에 하나씩 커밋
+    - 스키마는 board_store.ensure_schema()와 공유한다
+      (board_changes 로그 트리거 포함 — 배치 INSERT가 곧 스냅샷 무효화·델타 피드)
     """
     conn = sqlite3.connect(_DB_PATH, timeout=30)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS applications (
-            id         INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id    TEXT    NOT NULL,
-            name       TEXT    NOT NULL,
-            category   TEXT    NOT NULL,
-            type       TEXT    NOT NULL,
-            guest_name TEXT,
-            timestamp  REAL    NOT NULL,
-            created_at TEXT    DEFAULT (datetime('now', '+9 hours')),
-            UNIQUE(category, user_id)
-        )
-    """)
-    # 기존 테이블이 UNIQUE 제약 없이 생성된 경우를 대비해 명시적 인덱스도 보장
-    conn.execute("""
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_category_user
-        ON applications(category, user_id)
-    """)
+    ensure_schema(conn)
     conn.commit()
     print(f"[worker] SQLite 연결 완료 (WAL 모드) — {_DB_PATH}")
     return conn
 
 
-# ── 메인 루프 ─────────────────────────────────────────────────────────────────
+# ── 쓰기 / 통계 ───────────────────────────────────────────────────────────────
 
 _running = True
 
+# consumer 간 SQLite 커밋 순서를 넘겨받는 락 (WAL writer lock busy 대기 대신)
+_write_lock = threading.Lock()
+
 
 def _signal_handler(signum, frame):
     """SIGINT/SIGTERM 수신 시 graceful shutdown."""
@@ -94,123 +136,405 @@ def _signal_handler(signum, frame):
     _running = False
 
 
-def _fetch_batch() -> list[dict]:
-    """Redis apply_queue에서 최대 _BATCH_SIZE건을 꺼내 반환한다.
+_INSERT_SQL = """INSERT OR IGNORE INTO applications
+                     (user_id, name, category, type, guest_name, timestamp, priority, arrival_seq)
+                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INVALID_ENTRY = "신청 정보가 올바르지 않습니다."
+
 
-    rpop을 _BATCH_SIZE번 호출하여 현재 적재된 항목을 일괄 수집한다.
-    큐가 비어있으면 빈 리스트를 반환한다.
-    FIFO 순서 보장: lpush(최신) → rpop(가장 오래된) 순으로 처리.
+def _insert_batch(conn: sqlite3.Connection, entries: list[dict]) -> list[tuple[str, str | None]]:
+    """entries 목록을 단일 트랜잭션으로 SQLite에 INSERT한다.
 
-    ConnectionError/TimeoutError 발생 시 루프를 중단하고 현재까지 수집된
-    entries를 반환한다. 이미 rpop된 항목을 버리지 않고 INSERT까지 처리한 뒤,
-    다음 iteration에서 재연결을 시도한다. (D1 데이터 유실 방지)
+    중복 신청은 UNIQUE(category, user_id) 제약으로 자동 무시(INSERT OR IGNORE).
+    게스트 OB/교류전 우선순위(priority)는 여기서 1회 계산하여 저장한다.
+    도착 순번(entry["seq"], 스트림 메시지의 순번 필드)은 arrival_seq로 저장한다 (없으면 0).
+    필수 필드가 빠진 항목은 배치 전체를 실패시키지 않고 그 항목만 거부한다.
+    반환값: entry 순서대로 (결과, 사유) — apply_receipt.INSERTED / DUPLICATE / REJECTED
     """
-    entries = []
-    for _ in range(_BATCH_SIZE):
+    outcomes: list[tuple[str, str | None]] = []
+    for e in entries:
         try:
-            raw = _redis_client.rpop(_QUEUE_KEY)
-        except (redis.ConnectionError, redis.TimeoutError):
-            break  # 현재까지 수집된 entries 반환 후 처리, 재연결은 다음 루프에서
-        if raw is None:
-            break  # 큐 소진
+            row = (
+                e["user_id"],
+                e["name"],
+                e["category"],
+                e["type"],
+                e.get("guest_name"),
+                e["timestamp"],
+                compute_priority(e["category"], e.get("guest_name")),
+                int(e.get("seq", 0)),
+            )
+        except (KeyError, TypeError, ValueError):
+            outcomes.append((REJECTED, _INVALID_ENTRY))
+            continue
+
+        if conn.execute(_INSERT_SQL, row).rowcount:
+            outcomes.append((INSERTED, None))
+            continue
+        # 무시된 행: 같은 (category, user_id)의 timestamp가 같으면 직전 실행이 이미 커밋한 자기 자신
+        # (커밋 후 ACK 전에 중단되어 재처리되는 경우), 다르면 중복 신청
+        existing = conn.execute(
+            "SELECT timestamp FROM applications WHERE category = ? AND user_id = ?",
+            (row[2], row[0]),
+        ).fetchone()
+        if existing is None:
+            outcomes.append((REJECTED, _INVALID_ENTRY))  # NOT NULL 위반 (OR IGNORE가 무시)
+        elif existing[0] == row[5]:
+            outcomes.append((INSERTED, None))
+        else:
+            outcomes.append((DUPLICATE, None))
+    conn.commit()
+    return outcomes
+
+
+_stats_lock = threading.Lock()
+_stats = {"count": 0, "batches": 0, "commit_sec": 0.0, "latencies": [], "since": time.monotonic()}
+
+
+def _record(entries: list[dict], commit_sec: float) -> None:
+    """커밋된 배치의 신청→커밋 지연(entry timestamp 기준)을 누적한다."""
+    now = time.time()
+    with _stats_lock:
+        _stats["count"] += len(entries)
+        _stats["batches"] += 1
+        _stats["commit_sec"] += commit_sec
+        _stats["latencies"].extend(now - e["timestamp"] for e in entries)
+
+
+def _report_stats(consumers: list["_Consumer"], force: bool = False) -> None:
+    """_REPORT_INTERVAL마다 처리량·지연 분위수·배치 크기를 출력하고 구간을 초기화한다."""
+    with _stats_lock:
+        elapsed = time.monotonic() - _stats["since"]
+        if not force and elapsed < _REPORT_INTERVAL:
+            return
+        snapshot = dict(_stats)
+        _stats.update(count=0, batches=0, commit_sec=0.0, latencies=[], since=time.monotonic())
+    if snapshot["count"]:
+        lat = sorted(snapshot["latencies"])
+        p50 = lat[len(lat) // 2] * 1000
+        p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000
+        commit_ms = snapshot["commit_sec"] / snapshot["batches"] * 1000
+        sizes = "/".join(str(c.batch_size) for c in consumers)
+        print(f"[worker] {elapsed:.0f}초: {snapshot['count']}건 ({snapshot['count'] / elapsed:.0f}건/초) · "
+              f"신청→커밋 p50 {p50:.1f}ms / p99 {p99:.1f}ms · "
+              f"커밋 평균 {commit_ms:.1f}ms · 배치 크기 {sizes}")
+
+
+# ── consumer ──────────────────────────────────────────────────────────────────
+
+class _Consumer:
+    """겹치지 않는 카테고리 스트림 묶음을 맡아 읽고 → 커밋하고 → ACK하는 consumer 1개."""
+
+    def __init__(self, index: int, categories: list[str]):
+        self.name = f"{_CONSUMER_PREFIX}-{index}"
+        self.categories = categories
+        self.keys = [stream_key(cat) for cat in categories]
+        self.batch_size = max(_BATCH_MIN, min(_BATCH_MAX, _BATCH_SIZE))
+        self.conn: sqlite3.Connection | None = None
+        self.processed = 0
+
+    def ensure_groups(self) -> None:
+        """맡은 스트림마다 Consumer Group을 만든다 (스트림이 없으면 함께 생성, 이미 있으면 무시).
+
+        id="0": 그룹 생성 전에 적재된 항목도 처리한다.
+        주간 리셋(_flush_apply_queue)이 스트림을 지우면 그룹도 사라지므로 NOGROUP 시 다시 호출된다.
+        """
+        for key in self.keys:
+            try:
+                _redis_client.xgroup_create(key, GROUP, id="0", mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    def read(self, start_id: str, count: int,
+             block: int | None = None) -> tuple[dict[str, list[str]], list[dict]]:
+        """XREADGROUP 1회로 맡은 스트림마다 최대 count건을 읽는다.
+
+        start_id=">": 아직 아무에게도 전달되지 않은 새 항목
+        start_id="0": 이 consumer가 읽었으나 ACK하지 않은 항목 (PEL)
+        block: 읽을 항목이 없을 때 기다릴 최대 밀리초 (None = 기다리지 않음)
+
+        Returns:
+            ({스트림 키: 메시지 ID 목록}, entry 목록)
+            JSON 파싱에 실패했거나 객체(dict)가 아닌 메시지와 PEL에 남았지만 이미 지워진 메시지는
+            entry 없이 ID만 돌려주어 ACK되게 한다 (재전달이 반복되지 않도록).
+        """
+        try:
+            resp = _redis_client.xreadgroup(GROUP, self.name, {key: start_id for key in self.keys},
+                                            count=count, block=block)
+        except redis.ResponseError as e:
+            if "NOGROUP" not in str(e):
+                raise
+            self.ensure_groups()
+            return {}, []
+
+        ids: dict[str, list[str]] = {}
+        entries: list[dict] = []
+        for key, messages in resp or ():
+            for msg_id, fields in messages:
+                ids.setdefault(key, []).append(msg_id)
+                if not fields:
+                    continue
+                try:
+                    entry = json_codec.loads(fields[DATA_FIELD])
+                    if not isinstance(entry, dict):
+                        raise TypeError(f"객체가 아닌 메시지 ({type(entry).__name__})")
+                    if SEQ_FIELD in fields:
+                        entry["seq"] = int(fields[SEQ_FIELD])
+                    entries.append(entry)
+                except (json_codec.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    print(f"[worker] 메시지 파싱 에러: {e} — {key} {msg_id} 스킵")
+        return ids, entries
+
+    def fetch(self, block: int | None = _BLOCK_MS) -> tuple[dict[str, list[str]], list[dict]]:
+        """새 항목을 스트림마다 최대 batch_size건 읽는다 (왕복 1회).
+
+        모든 스트림이 비어 있으면 block 밀리초까지 기다렸다가, 그래도 없으면 빈 목록을 반환한다.
+        스트림 ID 순서 = XADD 순서이므로 카테고리 안에서 FIFO가 유지된다.
+        """
+        return self.read(">", self.batch_size, block)
+
+    def ack(self, ids: dict[str, list[str]]) -> None:
+        """처리 완료된 메시지를 ACK하고 스트림에서 지운다 (왕복 1회).
+
+        실패해도 항목은 PEL에 남아 다음 recover()에서 다시 처리된다.
+        """
+        pipe = _redis_client.pipeline(transaction=False)
+        for key, msg_ids in ids.items():
+            pipe.xack(key, GROUP, *msg_ids)
+            pipe.xdel(key, *msg_ids)
+        pipe.execute()
+
+    def adapt(self, read_count: int, commit_sec: float) -> None:
+        """직전 배치의 읽은 건수와 커밋 시간으로 다음 배치 크기를 정한다."""
+        if commit_sec > _COMMIT_TARGET_SEC:
+            self.batch_size = max(_BATCH_MIN, self.batch_size * 3 // 4)
+        elif read_count >= self.batch_size:
+            self.batch_size = min(_BATCH_MAX, self.batch_size * 2)
+
+    def process(self, ids: dict[str, list[str]], entries: list[dict]) -> int:
+        """entries를 INSERT·커밋하고 접수증에 결과를 기록한 뒤에 ACK한다. 반환값: 반영된 건수."""
+        outcomes: list[tuple[str, str | None]] = []
+        if entries:
+            started = time.perf_counter()
+            with _write_lock:
+                outcomes = _insert_batch(self.conn, entries)
+            commit_sec = time.perf_counter() - started
+            _record([e for e, (status, _) in zip(entries, outcomes) if status != REJECTED], commit_sec)
+            self.adapt(max(len(msg_ids) for msg_ids in ids.values()), commit_sec)
+            # 접수증 기록 실패(Redis 장애) 시 ACK하지 않는다 → PEL에 남아 재처리 때 다시 기록
+            apply_receipt.record(_redis_client, {
+                e["receipt"]: outcome for e, outcome in zip(entries, outcomes) if e.get("receipt")
+            })
+        self.ack(ids)
+        self.processed += sum(len(msg_ids) for msg_ids in ids.values())
+        inserted = sum(1 for status, _ in outcomes if status == INSERTED)
+        if inserted:
+            # 커밋 완료 후 공개 뷰 렌더링 → 알림 (/api/stream 구독자가 변경 로그를 읽어 푸시)
+            # 여러 consumer가 동시에 렌더링해도 board_view가 더 새 버전만 기록한다.
+            refresh_board_view()
+            publish_board_changed(_redis_client)
+        return inserted
+
+    def recover(self) -> int:
+        """ACK되지 않은 항목(PEL)을 다시 처리한다. 반환값: 처리한 메시지 수.
+
+        1) 다른 consumer가 _CLAIM_IDLE_MS 넘게 쥐고 있는 항목을 이 consumer로 가져온다
+           (WORKER_CONSUMER(S)를 바꿔 재배포했거나 죽은 워커가 남긴 항목)
+        2) 이 consumer의 PEL을 "0"부터 읽어 INSERT → ACK
+           (직전 실행이 커밋 전에 죽었거나, 커밋 후 ACK가 Redis 장애로 실패한 항목)
+        """
+        for key in self.keys:
+            start = "0-0"
+            while True:
+                try:
+                    resp = _redis_client.xautoclaim(
+                        key, GROUP, self.name,
+                        min_idle_time=_CLAIM_IDLE_MS, start_id=start, count=_BATCH_MAX,
+                    )
+                except redis.ResponseError as e:
+                    if "NOGROUP" not in str(e):
+                        raise
+                    self.ensure_groups()
+                    return 0
+                start = resp[0]
+                if start == "0-0":
+                    break
+
+        recovered = 0
+        while True:
+            ids, entries = self.read("0", _BATCH_MAX)
+            if not ids:
+                break
+            self.process(ids, entries)
+            recovered += sum(len(msg_ids) for msg_ids in ids.values())
+        return recovered
+
+    def connect(self, delay: float = 0.0) -> None:
+        """SQLite 연결을 (다시) 연다. 실패하면 간격을 2배씩(최대 _RECONNECT_MAX_DELAY초) 늘리며
+        종료 신호까지 재시도한다 — 연결 실패로 consumer 스레드가 조용히 끝나지 않도록."""
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.conn = None
+        while _running:
+            if delay:
+                time.sleep(delay)
+            try:
+                self.conn = _init_db()
+                return
+            except sqlite3.Error as e:
+                delay = min(_RECONNECT_MAX_DELAY, max(1.0, delay * 2))
+                print(f"[worker] {self.name}: SQLite 연결 실패: {e} — {delay:.0f}초 후 재시도")
+
+    def run(self) -> None:
+        """consumer 스레드 본체: 배치 fetch → 배치 INSERT → ACK를 종료 신호까지 반복한다."""
+        self.connect()
+        # 직전 실행이 커밋·ACK하지 못한 항목을 먼저 처리한다
         try:
-            entries.append(json.loads(raw))
-        except json.JSONDecodeError as e:
-            print(f"[worker] JSON 파싱 에러: {e} — 해당 메시지 스킵")
-    return entries
+            self.ensure_groups()
+            recovered = self.recover()
+            if recovered:
+                print(f"[worker] {self.name}: 미확인(PEL) 항목 {recovered}건 재처리")
+        except redis.RedisError as e:
+            print(f"[worker] {self.name}: PEL 복구 실패: {e} — 유휴 시 재시도")
+        last_recover = time.monotonic()
+
+        while _running:
+            try:
+                # 배치 수집: XREADGROUP 1회 (비어 있으면 BLOCK 대기)
+                ids, entries = self.fetch()
+
+                if not ids:
+                    # _BLOCK_MS 동안 새 항목 없음 — 유휴 시간에 ACK 누락(PEL)을 복구한다.
+                    if time.monotonic() - last_recover >= _VIEW_SYNC_INTERVAL:
+                        self.recover()
+                        last_recover = time.monotonic()
+                    continue
+
+                # 배치 INSERT: 단일 트랜잭션 (SQLite lock 점유 1회) → 커밋 후 ACK
+                self.process(ids, entries)
+
+            except redis.ConnectionError as e:
+                print(f"[worker] {self.name}: Redis 연결 실패: {e} — 3초 후 재시도")
+                time.sleep(3)
+
+            except sqlite3.Error as e:
+                print(f"[worker] {self.name}: SQLite 에러: {e} — 연결 재시도")
+                self.connect(delay=1.0)
+
+            except Exception as e:
+                print(f"[worker] {self.name}: 예상치 못한 에러: {e} — 1초 후 재시도")
+                time.sleep(1)
+
+        # ── Graceful Shutdown ─────────────────────────────────────────────
+        # 종료 신호 수신 후 맡은 스트림에 남은 항목을 마지막으로 한 번 더 처리
+        # (여기서 못 끝낸 항목은 PEL·스트림에 남아 재기동 후 처리된다)
+        try:
+            ids, entries = self.fetch(block=None)
+            if ids:
+                self.process(ids, entries)
+                print(f"[worker] {self.name}: 종료 전 잔여 {sum(map(len, ids.values()))}건 처리")
+        except Exception:
+            pass
+        try:
+            self.conn.close()
+        except Exception:
+            pass
 
 
-def _insert_batch(conn: sqlite3.Connection, entries: list[dict]) -> int:
-    """entries 목록을 단일 트랜잭션으로 SQLite에 INSERT한다.
+# ── 주기 점검 (메인 스레드) ───────────────────────────────────────────────────
 
-    중복 신청은 UNIQUE(category, user_id) 제약으로 자동 무시(INSERT OR IGNORE).
-    반환값: 실제 삽입된 건수.
+def _board_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(seq) FROM board_changes").fetchone()
+    return row[0] or 0
+
+
+def _reconcile_ranks(conn: sqlite3.Connection, last_version: int | None) -> int | None:
+    """보드 버전이 바뀌었고 신청 스트림이 모두 비었으면 잠정 순번 집합을 SQLite 기준으로 다시 쓴다.
+
+    처리 대기 항목이 있으면 건너뛰고 다음 점검 때 재시도한다
+    (스크립트도 XLEN을 다시 확인하므로 그 사이 새 신청이 들어와도 안전).
+    SQLite 읽기부터 교체까지 _write_lock을 쥔다 — consumer는 커밋(락 안)을 마친 뒤에만 XDEL하므로,
+    락을 쥔 동안 XLEN = 0이면 읽은 행에 모든 신청이 들어 있다. 락 없이 읽으면 읽기와 스크립트 사이에
+    커밋·XDEL된 신청이 빠진 행으로 집합을 덮어써 잠정 순번이 다음 재동기화까지 앞당겨진다.
+    반환값: 재동기화를 마친 보드 버전 (건너뛰었으면 last_version 그대로).
     """
-    rows = [
-        (
-            e["user_id"],
-            e["name"],
-            e["category"],
-            e["type"],
-            e.get("guest_name"),
-            e["timestamp"],
-        )
-        for e in entries
-    ]
-    cursor = conn.executemany(
-        """INSERT OR IGNORE INTO applications
-               (user_id, name, category, type, guest_name, timestamp)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        rows,
-    )
-    conn.commit()
-    return cursor.rowcount  # INSERT OR IGNORE: 실제 삽입 건수
+    if _board_version(conn) == last_version:
+        return last_version
+    try:
+        if pending_count(_redis_client) != 0:
+            return last_version
+        with _write_lock:
+            version = _board_version(conn)
+            if board_rank.reconcile(load_rank_rows(conn)):
+                return version
+    except redis.RedisError as e:
+        print(f"[worker] 잠정 순번 재동기화 실패: {e}")
+    return last_version
 
 
 def main() -> None:
-    """워커 메인 루프: 배치 fetch → 배치 INSERT를 무한 반복한다."""
+    """consumer 스레드를 띄우고, 메인 스레드는 종료 신호까지 주기 점검을 한다.
+
+    consumer 스레드가 하나라도 끝나면 나머지를 정리하고 종료 코드 1로 끝난다 (PM2 재시작).
+    """
+    global _running
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
 
+    consumers = [_Consumer(i, shard_categories(i, _CONSUMERS)) for i in range(_CONSUMERS)]
+
     print("[worker] ========================================")
     print("[worker] Redis → SQLite 백그라운드 워커 시작 (배치 모드)")
     print(f"[worker] DB        : {_DB_PATH}")
-    print(f"[worker] Queue     : {_QUEUE_KEY}")
-    print(f"[worker] BatchSize : {_BATCH_SIZE}")
+    print(f"[worker] Group     : {GROUP}")
+    for c in consumers:
+        print(f"[worker] Consumer  : {c.name} ← {', '.join(c.categories)}")
+    print(f"[worker] BatchSize : {_BATCH_SIZE} (자동 조절 {_BATCH_MIN}~{_BATCH_MAX}, 커밋 목표 {_COMMIT_TARGET_SEC * 1000:.0f}ms)")
     print("[worker] ========================================")
 
-    conn = _init_db()
-    processed = 0
+    conn = _init_db()  # 주기 점검(버전 확인·재동기화 읽기) 전용
+    # 기동 시 공개 뷰를 강제로 다시 그린다 (DB 교체·Redis 재시작 대비)
+    refresh_board_view(force=True)
 
+    threads = [threading.Thread(target=c.run, name=c.name, daemon=True) for c in consumers]
+    for t in threads:
+        t.start()
+
+    rank_version = None  # 잠정 순번 집합을 마지막으로 맞춘 보드 버전 (None = 기동 후 미실행)
+    exit_code = 0
     while _running:
+        time.sleep(_VIEW_SYNC_INTERVAL)
+        # consumer 스레드가 예외로 끝나면 그 카테고리는 처리가 멈춘다 — 프로세스를 끝내 PM2가 재시작하게 한다
+        dead = [c.name for c, t in zip(consumers, threads) if not t.is_alive()]
+        if dead and _running:
+            print(f"[worker] consumer 스레드 종료됨: {', '.join(dead)} — 워커를 재시작합니다")
+            exit_code = 1
+            _running = False
+            break
         try:
-            # 배치 수집: 큐에서 최대 _BATCH_SIZE건 rpop
-            entries = _fetch_batch()
-
-            if not entries:
-                # 큐가 비어있음 — CPU 낭비 방지를 위해 짧게 대기 후 재확인
-                time.sleep(0.1)
-                continue
-
-            # 배치 INSERT: 단일 트랜잭션 (SQLite lock 점유 1회)
-            inserted = _insert_batch(conn, entries)
-            processed += len(entries)
-
-            if processed % 100 == 0:
-                print(f"[worker] {processed}건 처리 완료 (이번 배치: {len(entries)}건, 실삽입: {inserted}건)")
-
-        except redis.ConnectionError as e:
-            print(f"[worker] Redis 연결 실패: {e} — 3초 후 재시도")
-            time.sleep(3)
-
-        except sqlite3.Error as e:
-            print(f"[worker] SQLite 에러: {e} — 연결 재시도")
-            try:
-                conn.close()
-            except Exception:
-                pass
-            time.sleep(1)
-            conn = _init_db()
-
+            # 공개 뷰 누락(렌더링 중 Redis 장애 등)을 복구하고 잠정 순번 집합을 최종 순서(SQLite)와 맞춘다.
+            sync_board_view()
+            rank_version = _reconcile_ranks(conn, rank_version)
+            _report_stats(consumers)
         except Exception as e:
-            print(f"[worker] 예상치 못한 에러: {e} — 1초 후 재시도")
-            time.sleep(1)
+            print(f"[worker] 주기 점검 실패: {e}")
 
-    # ── Graceful Shutdown ─────────────────────────────────────────────────
-    # 종료 신호 수신 후 큐에 남은 항목을 마지막으로 한 번 더 처리
-    try:
-        remaining = _fetch_batch()
-        if remaining:
-            _insert_batch(conn, remaining)
-            processed += len(remaining)
-            print(f"[worker] 종료 전 잔여 {len(remaining)}건 처리")
-    except Exception:
-        pass
+    # consumer는 BLOCK(_BLOCK_MS) 이내에 종료 신호를 확인하고 잔여 항목을 처리한 뒤 끝난다.
+    for t in threads:
+        t.join(timeout=_BLOCK_MS / 1000 + 10)
+    _report_stats(consumers, force=True)
     try:
         conn.close()
     except Exception:
         pass
-    print(f"[worker] 종료 완료 — 총 {processed}건 처리")
+    print(f"[worker] 종료 완료 — 총 {sum(c.processed for c in consumers)}건 처리")
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":